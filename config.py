@@ -4,9 +4,10 @@ Contains physical constants, port assignments, control gains, and validation hel
 !!!Runtime-editable run configuration now lives in user_input.py!!!
 """
 
+# Port and Color values are module-level settings read by devices, main and
+# vehicle; main.py imports pybricks.parameters before the first screen anyway.
 from pybricks.parameters import Port, Color # pyright: ignore[reportMissingImports]
 import math
-import log_utils
 
 # RUN MODES
 
@@ -45,6 +46,9 @@ GEAR_RATIO = 3
 # Distance per motor degree for odometry.
 MM_PER_MOTOR_DEGREE = (WHEEL_CIRCUMFERENCE_MM / 360.0) * GEAR_RATIO
 
+# Motor speed commands closer than this to the last one sent are not written (deg/s)
+MOTOR_COMMAND_DEADBAND_DEG_S = 1.0
+
 # Direction inverts
 INVERT_DRIVE = True
 INVERT_STEERING = False
@@ -56,6 +60,14 @@ OUTER_CAN_INSIDE_EDGE_M = 1.0
 # Calibration offsets
 DISTANCE_CORRECTION_M = 0.00  # Added to the requested target distance to correct systematic bias
 
+# Odometry
+ODOMETRY_GYRO_WEIGHT = 0.2  # Per-tick pull of the fused heading toward the gyro (0 = encoders only, 1 = gyro only)
+
+# Pose prediction: pure pursuit steers from the pose extrapolated over the
+# sample age plus the command-to-wheel latency (utils/calibrate_latency.py)
+POSE_PREDICTION_ENABLED = False
+POSE_PREDICTION_LATENCY_MS = 55  # Calibrated on simulated runs with a 50 ms motor lag; recalibrate on the brick
+
 # Path Following
 LOOKAHEAD_DIST_MM = 10.0
 TARGET_REACHED_TOLERANCE_MM = 20.0
@@ -82,6 +94,7 @@ PID_DIFF_HEADING_BONUS_KI = 0.004
 PID_DIFF_HEADING_BONUS_KD = 0.125
 PID_DIFF_INTEGRAL_WINDOW_SIZE = 50  # Differential steering has its own sliding-window integral
 PID_DIFF_INTEGRAL_ABS_MAX = 120.0  # Clamp integral state to reduce windup
+PID_DIFF_DERIVATIVE_ALPHA = 1.0  # Low-pass weight of the newest derivative sample (1.0 = unfiltered)
 
 # Motion constraints
 
@@ -90,30 +103,67 @@ MAX_ACCEL_MM_S2 = 800.0
 MAX_DECEL_MM_S2 = 800.0
 MAX_DIFF_SPEED_MM_S = 100.0 # Max speed difference between motors for diff steering
 
+# Speed planning
+SPEED_PLANNER_RATE_LIMIT = "RATE_LIMIT"  # Time/distance matching with acceleration rate limits
+SPEED_PLANNER_SCURVE = "SCURVE"  # Jerk-limited cosine ramps from motion.SCurveProfile
+SPEED_PLANNER = SPEED_PLANNER_RATE_LIMIT  # Default; chosen per run on the Speed Planner screen or in user_input
+SCURVE_FINAL_SPEED_RATIO = 0.3  # S-curve approach speed over the last SCURVE_FINAL_APPROACH_S, as a fraction of peak speed
+SCURVE_FINAL_APPROACH_S = 0.6  # Final S-curve stretch where remaining distance is matched to remaining time (0 = ramp to standstill)
+
 # Logging
 LOG_INTERVAL_MS = 50
+LOG_BUFFER_MAX_BYTES = 65536  # Memory cap for text log entries buffered during a run
+LOG_BUFFER_MAX_VALUES = 10  # Max numeric arguments per buffered entry
+LOG_IDLE_FLUSH_ENTRIES = 4  # Buffered entries written per idle gap in the run loop (0 = only after the stop)
+LOG_IDLE_FLUSH_MIN_MS = 5  # Idle time left before a tick deadline needed to write buffered entries
+TELEMETRY_MAX_SAMPLES = 4000  # Preallocated telemetry rows (40 s at a 10 ms interval)
+TELEMETRY_FORMAT_CSV = "CSV"
+TELEMETRY_FORMAT_BINARY = "BINARY"  # Decode on the host with utils/telemetry_binary.py
+TELEMETRY_FORMAT = TELEMETRY_FORMAT_BINARY
+TELEMETRY_BINARY_FIXED_POINT = True  # int16/int32 fixed-point records instead of float32
+
+# Control tick profiling (adds timer reads to every tick when enabled)
+PROFILE_ENABLED = False
+PROFILE_MAX_STAGE_MS = 50  # Histogram range; slower samples land in the last bin
+PROFILE_REPORT_PERCENTILE = 0.95  # Tail percentile printed per stage in the profile report
 
 # Gyro calibration
-GYRO_CAL_DURATION_MS = 5000
+GYRO_CAL_DURATION_MS = 5000  # Hard cap; calibration usually stops earlier
+GYRO_CAL_MIN_DURATION_MS = 1000
+GYRO_CAL_CI_DPS = 0.05  # Stop once the drift confidence half-width is within this
+GYRO_CAL_CONFIDENCE_Z = 1.96  # ~95% confidence interval
+GYRO_ANGLE_RESOLUTION_DEG = 1.0  # GyroSensor.angle() reports whole degrees
 GYRO_RESET_WAIT_MS = 100
 GYRO_CAL_LOOP_WAIT_MS = 20
-GYRO_CAL_SAMPLE_TIME_S = 0.02
 GYRO_CAL_BLINK_INTERVAL_MS = 150
 
+# Background drift tracking while waiting on the ready screen
+DRIFT_TRACK_TIME_CONSTANT_S = 20.0  # Age at which a sample's weight has decayed to 1/e
+DRIFT_TRACK_MOTION_DEG = 2.0  # Gyro jump between samples treated as the vehicle being moved
+DRIFT_TRACK_MIN_SPAN_S = 5.0  # Idle time needed before the tracked drift replaces the calibration
+
 # UI Settings
 UI_BLINK_INTERVAL_MS = 500
 UI_PROGRESS_UPDATE_INTERVAL_MS = 150
+UI_PROGRESS_BUDGET_MS = 2  # Per-update screen time in the control tick; remaining fields wait for the next update
 UI_SUMMARY_WAIT_MS = 20
 
 # Run Settings
 RUN_START_DELAY_MS = 200
-RUN_LOOP_WAIT_MS = 10
+RUN_LOOP_PERIOD_MS = 10  # Fixed control tick period (absolute deadlines)
+RUN_LOOP_LATE_TOLERANCE_MS = 2  # Ticks starting later than this defer logging and screen updates
 RUN_TIMEOUT_MULTIPLIER = 2.0
 STALL_THRESHOLD_MM = 5.0
 STALL_WINDOW_MS = 1200
 
 # Strategy Settings
-BONUS_PATH_INTEGRATION_STEPS = 50
+PLAN_DISTANCE_GAIN_PER_S = 2.0  # Speed correction per mm of distance behind the planned schedule (mm/s per mm)
+PLAN_IDLE_BUDGET_MS = 20  # Planning time spent per ready-screen refresh
+PATH_TABLE_SPACING_MM = 10.0  # Arc-length spacing of precomputed path samples
+PATH_TABLE_SUBSTEPS = 4  # Integration substeps per table entry when building the path table
+PATH_TABLE_CACHE_SIZE = 4  # Built path tables memoized by geometry (about 12 KB each for a 10 m path)
+PATH_PROJECTION_WINDOW = 3  # Table entries searched either side of the last projection each tick
+PATH_PROJECTION_LOST_MM = 300.0  # Cross-track distance that triggers a full-path re-search
 
 # Input Settings
 DISTANCE_STEP_REGIONAL_M = 0.25
@@ -143,6 +193,7 @@ def validate_config(config_dict):
     Validates the user configuration against event rules.
     Returns (errors, warnings) where errors are dicts with message, key, and fixable.
     """
+    import log_utils
     if not VALIDATION_ENABLED:
         log_utils.log("Warning: Input validation is disabled.")
         return [], []
@@ -161,9 +212,15 @@ def validate_config(config_dict):
     if gap < 0.0 or gap > 1.0:
         errors.append({"message": "Bonus gap must be between 0.0 m and 1.0 m (can spacing).", "key": "bonus_gap_m", "fixable": True})
 
+    if config_dict.get("speed_planner", SPEED_PLANNER) not in (SPEED_PLANNER_RATE_LIMIT, SPEED_PLANNER_SCURVE):
+        errors.append({"message": "Speed planner must be RATE_LIMIT or SCURVE.", "key": "speed_planner", "fixable": True})
+
     if MAX_ACCEL_MM_S2 <= 0 or MAX_DECEL_MM_S2 <= 0 or MAX_SPEED_MM_S <= 0:
         errors.append({"message": "Speed and acceleration limits must be positive.", "key": None, "fixable": False})
 
+    if not (0.0 <= SCURVE_FINAL_SPEED_RATIO < 1.0) or SCURVE_FINAL_APPROACH_S < 0:
+        errors.append({"message": "S-curve final approach needs a speed ratio in [0, 1) and a non-negative time.", "key": None, "fixable": False})
+
     if errors:
         log_utils.log("Configuration errors:")
         for err in errors:
@@ -0,0 +1,94 @@
+"""
+Registry of the vehicle's motors and gyro.
+Each port is opened once; on ev3dev every open is a slow sysfs discovery,
+so the handle is kept and shared between the startup precheck and Car. The
+open time and outcome of every probe stay available as diagnostics.
+"""
+
+from pybricks.ev3devices import Motor, GyroSensor  # pyright: ignore[reportMissingImports]
+from pybricks.parameters import Direction  # pyright: ignore[reportMissingImports]
+from pybricks.tools import StopWatch  # pyright: ignore[reportMissingImports]
+import config
+
+# Device keys
+LEFT_MOTOR = "left_motor"
+RIGHT_MOTOR = "right_motor"
+GYRO = "gyro"
+VEHICLE_DEVICES = (LEFT_MOTOR, RIGHT_MOTOR, GYRO)
+
+# Probe outcomes
+STATUS_OK = "ok"
+STATUS_MISSING = "missing"
+
+
+class DeviceRecord:
+    """Outcome of opening one device."""
+    __slots__ = ("label", "handle", "open_ms", "status", "error")
+
+    def __init__(self, label, handle, open_ms, status, error=None):
+        self.label = label
+        self.handle = handle
+        self.open_ms = open_ms
+        self.status = status
+        self.error = error
+
+
+def _vehicle_device(key):
+    """Returns (label, constructor) for a vehicle device key."""
+    drive_dir = Direction.COUNTERCLOCKWISE if config.INVERT_DRIVE else Direction.CLOCKWISE
+    if key == LEFT_MOTOR:
+        port = config.PORT_LEFT_MOTOR
+        return "Left motor on {}".format(port), lambda: Motor(port, drive_dir)
+    if key == RIGHT_MOTOR:
+        port = config.PORT_RIGHT_MOTOR
+        return "Right motor on {}".format(port), lambda: Motor(port, drive_dir)
+    if key == GYRO:
+        port = config.PORT_GYRO_SENSOR
+        return "Gyro on {}".format(port), lambda: GyroSensor(port)
+    raise ValueError("Unknown device: {}".format(key))
+
+
+class DeviceRegistry:
+    """Opens each vehicle device on first request and caches the result."""
+
+    def __init__(self, timer=None):
+        self.timer = timer if timer is not None else StopWatch()
+        self.records = {}
+
+    def probe(self, key):
+        """Opens the device once and returns its DeviceRecord (failed opens are cached too)."""
+        record = self.records.get(key)
+        if record is not None:
+            return record
+        label, ctor = _vehicle_device(key)
+        start_ms = self.timer.time()
+        try:
+            record = DeviceRecord(label, ctor(), self.timer.time() - start_ms, STATUS_OK)
+        except Exception as e:
+            record = DeviceRecord(label, None, self.timer.time() - start_ms, STATUS_MISSING, str(e))
+        self.records[key] = record
+        return record
+
+    def probe_all(self):
+        """Probes every vehicle device and returns the labels of the missing ones."""
+        missing = []
+        for key in VEHICLE_DEVICES:
+            record = self.probe(key)
+            if record.status != STATUS_OK:
+                missing.append(record.label)
+        return missing
+
+    def get(self, key):
+        """Returns the live handle, raising RuntimeError if the device could not be opened."""
+        record = self.probe(key)
+        if record.handle is None:
+            raise RuntimeError("{} unavailable: {}".format(record.label, record.error))
+        return record.handle
+
+    def report_lines(self):
+        lines = []
+        for key in VEHICLE_DEVICES:
+            record = self.records.get(key)
+            if record is not None:
+                lines.append("{}: {} ({} ms)".format(record.label, record.status, record.open_ms))
+        return lines
@@ -0,0 +1,160 @@
+"""
+Gyro drift estimation from a stationary vehicle.
+"""
+
+import math
+
+
+class DriftEstimator:
+    """
+    Streaming least-squares fit of gyro angle against time.
+    Means and co-moments are updated with Welford's method, so each sample
+    is O(1) and numerically stable. The residual variance is floored at the
+    quantization noise of the angle readings (resolution^2 / 12); otherwise
+    a gyro that has not yet ticked over a whole degree would claim a perfect fit.
+    """
+    __slots__ = ("resolution_deg", "count", "_mean_t", "_mean_a", "_sxx", "_sxy", "_syy")
+
+    def __init__(self, resolution_deg=1.0):
+        self.resolution_deg = resolution_deg
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self._mean_t = 0.0
+        self._mean_a = 0.0
+        self._sxx = 0.0
+        self._sxy = 0.0
+        self._syy = 0.0
+
+    def add(self, time_s, angle_deg):
+        self.count += 1
+        dt = time_s - self._mean_t
+        da = angle_deg - self._mean_a
+        self._mean_t += dt / self.count
+        self._mean_a += da / self.count
+        self._sxx += dt * (time_s - self._mean_t)
+        self._sxy += dt * (angle_deg - self._mean_a)
+        self._syy += da * (angle_deg - self._mean_a)
+
+    def drift_dps(self):
+        """Fitted slope in raw gyro degrees per second (0.0 until two distinct times are seen)."""
+        if self._sxx <= 0:
+            return 0.0
+        return self._sxy / self._sxx
+
+    def half_width_dps(self, z):
+        """Half-width of the z-sigma confidence interval of the drift (inf until it can be estimated)."""
+        if self.count < 3 or self._sxx <= 0:
+            return float("inf")
+        residual = (self._syy - self._sxy * self._sxy / self._sxx) / (self.count - 2)
+        floor = self.resolution_deg * self.resolution_deg / 12.0
+        if residual < floor:
+            residual = floor
+        return z * math.sqrt(residual / self._sxx)
+
+
+class DriftTracker:
+    """
+    Exponentially weighted least-squares drift estimate from idle samples.
+    Sample weights decay with time_constant_s, so the estimate follows slow
+    drift changes while the vehicle waits. A sample that moves more than
+    motion_deg away from the fitted drift means the vehicle was bumped; the
+    estimate is discarded and tracking starts over from that sample.
+    The weighted residual variance gives a confidence interval like
+    DriftEstimator's, floored at the quantization noise of the readings.
+    """
+    __slots__ = ("time_constant_s", "motion_deg", "resolution_deg", "bumps",
+                 "_t0", "_a0", "_start_s", "_last_t", "_last_a",
+                 "_w", "_w2", "_wt", "_wa", "_wtt", "_wta", "_waa")
+
+    def __init__(self, time_constant_s, motion_deg, resolution_deg=1.0):
+        self.time_constant_s = time_constant_s
+        self.motion_deg = motion_deg
+        self.resolution_deg = resolution_deg
+        self.bumps = 0
+        self.reset()
+
+    def reset(self):
+        self._t0 = 0.0
+        self._a0 = 0.0
+        self._start_s = 0.0
+        self._last_t = None
+        self._last_a = 0.0
+        self._w = 0.0
+        self._w2 = 0.0
+        self._wt = 0.0
+        self._wa = 0.0
+        self._wtt = 0.0
+        self._wta = 0.0
+        self._waa = 0.0
+
+    def add(self, time_s, angle_deg):
+        last_t = self._last_t
+        if last_t is not None:
+            dt = time_s - last_t
+            if dt <= 0:
+                return
+            if abs(angle_deg - self._last_a - self.drift_dps() * dt) > self.motion_deg:
+                self.bumps += 1
+                self.reset()
+            else:
+                decay = math.exp(-dt / self.time_constant_s)
+                self._w *= decay
+                self._w2 *= decay * decay
+                self._wt *= decay
+                self._wa *= decay
+                self._wtt *= decay
+                self._wta *= decay
+                self._waa *= decay
+        if self._last_t is None:
+            self._t0 = time_s
+            self._a0 = angle_deg
+            self._start_s = time_s
+        # Sums are kept relative to the first sample to limit cancellation.
+        t = time_s - self._t0
+        a = angle_deg - self._a0
+        self._w += 1.0
+        self._w2 += 1.0
+        self._wt += t
+        self._wa += a
+        self._wtt += t * t
+        self._wta += t * a
+        self._waa += a * a
+        self._last_t = time_s
+        self._last_a = angle_deg
+
+    def drift_dps(self):
+        """Weighted slope in raw gyro degrees per second (0.0 until it can be fitted)."""
+        den = self._w * self._wtt - self._wt * self._wt
+        if den <= 0:
+            return 0.0
+        return (self._w * self._wta - self._wt * self._wa) / den
+
+    def half_width_dps(self, z):
+        """
+        Half-width of the z-sigma confidence interval of the drift (inf until
+        it can be estimated). Uses the effective sample count w^2 / sum(w^2);
+        treating the weighted fit as unweighted over-states the interval, so
+        the estimate is conservative.
+        """
+        w = self._w
+        if w <= 0:
+            return float("inf")
+        n_eff = w * w / self._w2
+        sxx = self._wtt - self._wt * self._wt / w
+        if n_eff <= 2.0 or sxx <= 0:
+            return float("inf")
+        sxy = self._wta - self._wt * self._wa / w
+        syy = self._waa - self._wa * self._wa / w
+        residual = (syy - sxy * sxy / sxx) / w * n_eff / (n_eff - 2.0)
+        floor = self.resolution_deg * self.resolution_deg / 12.0
+        if residual < floor:
+            residual = floor
+        return z * math.sqrt(residual / sxx)
+
+    def span_s(self):
+        """Time covered since tracking last (re)started."""
+        if self._last_t is None:
+            return 0.0
+        return self._last_t - self._start_s
@@ -1,10 +1,18 @@
 """Lightweight logging with timestamps and file output."""
 
+from array import array
 from pybricks.tools import StopWatch  # pyright: ignore[reportMissingImports]
 
 LOG_FILE = "run_log.txt"
 _timer = StopWatch()
 _timer.reset()
+_buffer = None
+
+# Approximate bytes per buffered entry besides its values:
+# timestamp (4), value count (1) and the format string reference (4).
+_ENTRY_OVERHEAD_BYTES = 9
+# Values are doubles so integer counters stay exact up to 2^53
+_VALUE_BYTES = 8
 
 
 def set_log_file(path):
@@ -19,14 +27,133 @@ def _timestamp(ms):
     return "[{:02d}:{:02d}.{:03d}]".format(int(minutes), int(seconds), int(millis))
 
 
+def _write_lines(lines):
+    try:
+        with open(LOG_FILE, "a") as f:
+            for line in lines:
+                f.write(line + "\n")
+    except Exception:
+        pass
+
+
+class LogBuffer:
+    """
+    Preallocated ring of pending log entries.
+    Each entry keeps its timestamp, an unformatted format string and up to
+    max_values numeric arguments; formatting happens only when flushed.
+    Entries with a non-numeric argument (a string or None) are formatted
+    when pushed and kept as text instead. Entries that do not fit are
+    dropped and counted.
+    """
+    def __init__(self, max_bytes, max_values):
+        self.max_values = max_values
+        entry_bytes = _ENTRY_OVERHEAD_BYTES + _VALUE_BYTES * max_values
+        self.capacity = max(1, max_bytes // entry_bytes)
+        self.times = array("l", [0] * self.capacity)
+        self.counts = array("B", [0] * self.capacity)
+        self.values = array("d", [0.0] * (self.capacity * max_values))
+        self.formats = [None] * self.capacity
+        self.head = 0
+        self.size = 0
+        self.dropped = 0
+
+    def push(self, ms, fmt, values):
+        count = len(values)
+        if self.size >= self.capacity or count > self.max_values:
+            self.dropped += 1
+            return
+        slot = self.head + self.size
+        if slot >= self.capacity:
+            slot -= self.capacity
+        base = slot * self.max_values
+        try:
+            for i in range(count):
+                self.values[base + i] = values[i]
+        except TypeError:
+            fmt = fmt.format(*values)
+            count = 0
+        self.times[slot] = ms
+        self.formats[slot] = fmt
+        self.counts[slot] = count
+        self.size += 1
+
+    def pop_line(self):
+        """Formats and removes the oldest entry."""
+        slot = self.head
+        fmt = self.formats[slot]
+        count = self.counts[slot]
+        if count:
+            base = slot * self.max_values
+            values = self.values[base:base + count]
+            try:
+                text = fmt.format(*values)
+            except ValueError:
+                # Integer specs such as {:d} need the values back as ints
+                text = fmt.format(*[int(v) if v == int(v) else v for v in values])
+        else:
+            text = fmt
+        line = "{} {}".format(_timestamp(self.times[slot]), text)
+        self.formats[slot] = None
+        self.head = slot + 1 if slot + 1 < self.capacity else 0
+        self.size -= 1
+        return line
+
+
+def start_buffering(max_bytes, max_values):
+    """
+    Switches to buffered mode: log() and log_values() only record entries
+    until flush() or stop_buffering() is called.
+    """
+    global _buffer
+    _buffer = LogBuffer(max_bytes, max_values)
+
+
+def stop_buffering(discard=False):
+    """
+    Flushes all pending entries and returns to direct logging. With discard
+    the pending entries and the drop count are thrown away instead.
+    """
+    global _buffer
+    buf = _buffer
+    if buf is None:
+        return
+    if not discard:
+        flush()
+    _buffer = None
+    if buf.dropped and not discard:
+        log("Log buffer full: {} entries dropped.".format(buf.dropped))
+
+
+def flush(max_entries=None):
+    """Writes pending buffered entries with a single file open. Returns the count written."""
+    buf = _buffer
+    if buf is None or buf.size == 0:
+        return 0
+    count = buf.size if max_entries is None else min(buf.size, max_entries)
+    lines = []
+    for _ in range(count):
+        line = buf.pop_line()
+        print(line)
+        lines.append(line)
+    _write_lines(lines)
+    return count
+
+
 def log(message):
     if message is None:
         return
     ms = _timer.time()
+    if _buffer is not None:
+        _buffer.push(ms, message, ())
+        return
     text = "{} {}".format(_timestamp(ms), message)
     print(text)
-    try:
-        with open(LOG_FILE, "a") as f:
-            f.write(text + "\n")
-    except Exception:
-        pass
+    _write_lines((text,))
+
+
+def log_values(fmt, *values):
+    """Logs fmt.format(*values); formatting is deferred while buffering."""
+    if _buffer is not None:
+        _buffer.push(_timer.time(), fmt, values)
+        return
+    log(fmt.format(*values))
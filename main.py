@@ -2,30 +2,22 @@
 """Main execution entry point for the Science Olympiad Electric Vehicle 2026."""
 
 from pybricks.hubs import EV3Brick  # pyright: ignore[reportMissingImports]
-from pybricks.ev3devices import Motor, GyroSensor  # pyright: ignore[reportMissingImports]
 from pybricks.parameters import Button  # pyright: ignore[reportMissingImports]
 from pybricks.tools import wait, StopWatch  # pyright: ignore[reportMissingImports]
 
 import config
 import user_input
 from vehicle import Car
-from strategies import get_strategy
-from run_logger import RunLogger
+from devices import DeviceRegistry
 from ui.ui_flow import collect_run_config
-from ui.run_status import show_progress
-from ui.run_summary_screen import show_summary
 from ui.common import show_warning
 import log_utils
 import math
 
+TELEMETRY_LOG_FORMAT = "Telemetry: t={:.2f}s, x={:.1f}, y={:.1f}, d={:.1f}, v={:.1f}, h_cmd={:.1f}, h={:.1f}, k={:.2e}, drift={:.3f}, xt={:.1f}"
 
-def _port_label(port):
-    return str(port)
-
-
-def precheck_devices(ev3):
-    missing = []
 
+def precheck_devices(ev3, registry):
     if config.BATTERY_CHECK_ENABLED:
         voltage_v = ev3.battery.voltage() / 1000.0
         if voltage_v < config.MIN_BATTERY_VOLTAGE_V:
@@ -35,17 +27,9 @@ def precheck_devices(ev3):
             raise RuntimeError(msg)
         log_utils.log("Battery check passed: {:.2f} V.".format(voltage_v))
 
-    def try_create(name, ctor):
-        try:
-            ctor()
-        except Exception:
-            missing.append(name)
-
-    try_create("Left motor on {}".format(_port_label(config.PORT_LEFT_MOTOR)), lambda: Motor(config.PORT_LEFT_MOTOR))
-    try_create("Right motor on {}".format(_port_label(config.PORT_RIGHT_MOTOR)), lambda: Motor(config.PORT_RIGHT_MOTOR))
-
-    try_create("Gyro on {}".format(_port_label(config.PORT_GYRO_SENSOR)), lambda: GyroSensor(config.PORT_GYRO_SENSOR))
-
+    missing = registry.probe_all()
+    for line in registry.report_lines():
+        log_utils.log("Device " + line)
     if missing:
         lines = ["Device missing:"] + missing
         show_warning(ev3, "Device Error", lines)
@@ -63,14 +47,24 @@ def main():
         log_utils.log("Warning: Hardware precheck is disabled.")
     if not config.BATTERY_CHECK_ENABLED:
         log_utils.log("Warning: Battery voltage check is disabled.")
+    registry = DeviceRegistry()
     if config.HARDWARE_PRECHECK_ENABLED:
-        precheck_devices(ev3)
-    car = Car(auto_calibrate=False, ev3=ev3)
+        precheck_devices(ev3, registry)
+    car = Car(auto_calibrate=False, ev3=ev3, registry=registry)
 
     run_config = user_input.get_default_run_config()
     run_config = collect_run_config(car.ev3, car, run_config, runtime_input=user_input.USE_RUNTIME_INPUT)
     car.set_run_mode(run_config.get("mode"))
 
+    # Run-only modules load after the setup screens so the first screen
+    # appears sooner; all of them are in place before the control loop.
+    from strategies import get_strategy
+    from run_logger import RunLogger
+    from scheduler import TickScheduler
+    from run_loop import run_loop_step, StallGuard
+    from profiler import TickProfiler, RUN_TICK_STAGES, STAGE_RUN_LOGGER, STAGE_LOG, STAGE_PROGRESS
+    from ui.run_status import ProgressDisplay
+
     corrected_distance_m = run_config["target_distance_m"] + config.DISTANCE_CORRECTION_M
     run_settings = dict(run_config)
     run_settings["distance_correction_m"] = config.DISTANCE_CORRECTION_M
@@ -79,6 +73,7 @@ def main():
     run_settings["run_timeout_multiplier"] = config.RUN_TIMEOUT_MULTIPLIER
     run_settings["event_level"] = user_input.EVENT_LEVEL
     run_settings["runtime_input_enabled"] = user_input.USE_RUNTIME_INPUT
+    run_settings["speed_planner"] = run_config.get("speed_planner", config.SPEED_PLANNER)
 
     logger = RunLogger(run_settings=run_settings)
 
@@ -86,8 +81,17 @@ def main():
         errors, warnings = config.validate_config(run_config)
         if errors or warnings:
             show_warning(car.ev3, "Config Warning", [e["message"] for e in errors] + warnings)
-    strategy = get_strategy(run_config)
+    try:
+        strategy = get_strategy(run_config)
+    except ValueError as e:
+        show_warning(car.ev3, "Fix Config", [str(e)])
+        log_utils.log("Run rejected: {}".format(e))
+        raise
     log_utils.log("Strategy initialized: {}".format(run_config["mode"]))
+    if strategy.plan.reaches_target:
+        log_utils.log("Plan: {} ticks, {:.2f}s nominal".format(strategy.plan.count, strategy.plan.duration_s))
+    else:
+        log_utils.log("Plan does not reach the target; using live speed control.")
     log_utils.log("Target: {:.3f}m (raw {:.3f}m, corr {:+.3f}m) in {:.2f}s".format(
         corrected_distance_m,
         run_config["target_distance_m"],
@@ -96,6 +100,10 @@ def main():
     ))
     if run_config["mode"] == config.MODE_BONUS:
         log_utils.log("Bonus gap: {}m".format(run_config["bonus_gap_m"]))
+    # Static parts of the progress screen are drawn before the start; the
+    # loop only updates the bar and text fields within a time budget.
+    progress_display = ProgressDisplay(car.ev3, run_config.get("mode"), config.UI_PROGRESS_BUDGET_MS)
+    progress_display.start()
     wait(config.RUN_START_DELAY_MS)
 
     event_timer = StopWatch()
@@ -106,60 +114,73 @@ def main():
     car.ev3.light.off()
 
     car.reset_odometry()
+    # Keep file I/O out of the control work; entries are written in the idle
+    # time before tick deadlines and the rest after the stop.
+    log_utils.start_buffering(config.LOG_BUFFER_MAX_BYTES, config.LOG_BUFFER_MAX_VALUES)
     run_timer = StopWatch(); run_timer.reset()
     log_interval_ms = run_config.get("log_interval_ms", config.LOG_INTERVAL_MS)
     last_log_ms = -log_interval_ms # Force first log at 0ms
     last_progress_ms = 0
 
     max_run_ms = int(strategy.target_time_s * config.MS_PER_SECOND * config.RUN_TIMEOUT_MULTIPLIER)  # 2.0x target time guard
-    stall_threshold_mm = config.STALL_THRESHOLD_MM
-    stall_window_ms = config.STALL_WINDOW_MS
-    last_move_ms = 0
-    last_dist_mm = 0.0
+    stall_guard = StallGuard(config.STALL_WINDOW_MS, config.STALL_THRESHOLD_MM)
     loop_ms = 0
     dist_mm = 0.0
     pose = car.get_pose()
+    def idle_flush():
+        log_utils.flush(config.LOG_IDLE_FLUSH_ENTRIES)
+    scheduler = TickScheduler(config.RUN_LOOP_PERIOD_MS, config.RUN_LOOP_LATE_TOLERANCE_MS, run_timer,
+                              idle_flush if config.LOG_IDLE_FLUSH_ENTRIES > 0 else None,
+                              config.LOG_IDLE_FLUSH_MIN_MS)
+    profiler = None
+    if config.PROFILE_ENABLED:
+        profiler = TickProfiler(RUN_TICK_STAGES, config.PROFILE_MAX_STAGE_MS)
 
     while not strategy.is_finished(run_timer.time() / config.MS_PER_SECOND, pose):
-        loop_ms = run_timer.time()
+        loop_ms = scheduler.wait_next()
         time_s = loop_ms / config.MS_PER_SECOND
 
-        if (loop_ms // config.UI_BLINK_INTERVAL_MS) % 2 == 0:
-            car.ev3.light.on(config.Color.GREEN)
-        else:
-            car.ev3.light.off()
-
-        car.update_sensors()
+        pose, dist_mm, target_v, target_h, target_k = run_loop_step(car, strategy, time_s, profiler)
 
-        dist_mm = car.get_distance()
-        pose = car.get_pose()
-        target_v, target_h, target_k = strategy.get_target_state(time_s, pose)
+        # Logging, LED blink and screen updates are deferred on late ticks;
+        # their interval checks pick them up again on the next on-time tick.
+        low_priority_ok = scheduler.low_priority_ok()
 
-        car.drive_speed(target_v)
-        car.steer_heading(target_h, curvature_mm=target_k)
+        if low_priority_ok:
+            if (loop_ms // config.UI_BLINK_INTERVAL_MS) % 2 == 0:
+                car.ev3.light.on(config.Color.GREEN)
+            else:
+                car.ev3.light.off()
 
-        if loop_ms - last_log_ms >= log_interval_ms:
-            heading = car.get_heading()
-            x_mm, y_mm, _, _ = pose
+        if low_priority_ok and loop_ms - last_log_ms >= log_interval_ms:
+            x_mm, y_mm, heading, _ = pose
             drift = car.drift_rate_dps
-            logger.state(loop_ms, x_mm, y_mm, dist_mm, target_v, target_h, heading, target_k, drift)
-            log_utils.log("Telemetry: t={:.2f}s, x={:.1f}, y={:.1f}, d={:.1f}, v={:.1f}, h_cmd={:.1f}, h={:.1f}, k={:.2e}, drift={:.3f}".format(
-                time_s, x_mm, y_mm, dist_mm, target_v, target_h, heading, target_k, drift))
+            cross_track = strategy.cross_track_mm
+            if profiler:
+                profiler.start()
+            logger.state(loop_ms, x_mm, y_mm, dist_mm, target_v, target_h, heading, target_k, drift, cross_track)
+            if profiler:
+                profiler.stop(STAGE_RUN_LOGGER)
+            log_utils.log_values(TELEMETRY_LOG_FORMAT,
+                time_s, x_mm, y_mm, dist_mm, target_v, target_h, heading, target_k, drift, cross_track)
+            if profiler:
+                profiler.stop(STAGE_LOG)
             last_log_ms = loop_ms
 
-        if loop_ms - last_progress_ms >= config.UI_PROGRESS_UPDATE_INTERVAL_MS:
+        if low_priority_ok and loop_ms - last_progress_ms >= config.UI_PROGRESS_UPDATE_INTERVAL_MS:
             progress_fraction = min(1.0, dist_mm / max(1.0, strategy.total_path_length))
-            show_progress(car.ev3, run_config.get("mode"), progress_fraction, time_s)
+            if profiler:
+                profiler.start()
+            progress_display.update(progress_fraction, time_s)
+            if profiler:
+                profiler.stop(STAGE_PROGRESS)
             last_progress_ms = loop_ms
 
         # Stall detection: if movement < threshold over window, stop.
-        if loop_ms - last_move_ms >= stall_window_ms:
-            if abs(dist_mm - last_dist_mm) < stall_threshold_mm:
-                log_utils.log("Stall detected.")
-                logger.event(event_timer.time(), "stall_detected")
-                break
-            last_move_ms = loop_ms
-            last_dist_mm = dist_mm
+        if stall_guard.stalled(loop_ms, dist_mm):
+            log_utils.log("Stall detected.")
+            logger.event(event_timer.time(), "stall_detected")
+            break
 
         # Absolute runtime guard
         if loop_ms >= max_run_ms:
@@ -167,11 +188,26 @@ def main():
             logger.event(event_timer.time(), "timeout_guard")
             break
 
-        wait(config.RUN_LOOP_WAIT_MS)
-
     logger.event(event_timer.time(), "complete")
     car.stop(brake=True)
     car.ev3.light.on(config.Color.RED)
+    log_utils.stop_buffering()
+    saved = logger.save()
+    log_utils.log("Telemetry saved: {} samples, {} dropped.".format(saved, logger.dropped))
+    log_utils.log("Plan saved: {} ticks.".format(strategy.plan.save_csv()))
+    for line in strategy.report_lines():
+        log_utils.log(line)
+    for line in scheduler.report_lines():
+        log_utils.log(line)
+    for line in car.read_latency_lines():
+        log_utils.log(line)
+    for line in car.motor_command_lines():
+        log_utils.log(line)
+    if progress_display.deferred:
+        log_utils.log("Progress updates cut short by budget: {}".format(progress_display.deferred))
+    if profiler:
+        for line in profiler.report_lines():
+            log_utils.log(line)
 
     total_time_s = loop_ms / config.MS_PER_SECOND
 
@@ -197,6 +233,7 @@ def main():
     if "target_time_s" in run_config:
         error_s = total_time_s - run_config["target_time_s"]
         log_utils.log("Time err: {:.3f} s".format(error_s))
+    from ui.run_summary_screen import show_summary
     show_summary(car.ev3, run_config.get("mode"), dist_mm / config.MM_PER_METER, total_time_s, run_config.get("target_time_s"), distance_error_m=dist_error_m)
     log_utils.log("Press center to dismiss summary.")
     while Button.CENTER not in car.ev3.buttons.pressed():
@@ -8,37 +8,54 @@ import log_utils
 
 
 class SCurveProfile:
-    """Acceleration-limited S-curve velocity profile."""
-
-    def __init__(self, distance_mm, total_time_s, max_accel_mm_s2, max_decel_mm_s2, max_speed_mm_s=None):
+    """
+    Acceleration-limited S-curve velocity profile. With final_time_s > 0 the
+    deceleration ramp ends at final_speed_ratio * v_max instead of standstill
+    and that speed is held for the last final_time_s, so the end of the
+    distance is crossed at total_time_s with the vehicle still moving.
+    """
+
+    def __init__(self, distance_mm, total_time_s, max_accel_mm_s2, max_decel_mm_s2, max_speed_mm_s=None,
+                 final_speed_ratio=0.0, final_time_s=0.0):
         self.distance_mm = distance_mm
         self.total_time_s = total_time_s
         self.max_accel = max_accel_mm_s2
         self.max_decel = max_decel_mm_s2
         self.max_speed = max_speed_mm_s
+        self.final_ratio = final_speed_ratio if final_time_s > 0 else 0.0
+        self.t_final = final_time_s if self.final_ratio > 0 else 0.0
 
         self.v_max = self._solve_peak_velocity()
         if self.max_speed and self.v_max > self.max_speed:
             raise ValueError("Peak speed exceeds configured maximum.")
+        self.v_final = self.v_max * self.final_ratio
         self.t_acc = self.v_max * math.pi / (2 * self.max_accel)
-        self.t_dec = self.v_max * math.pi / (2 * self.max_decel)
-        self.t_cruise = max(0.0, self.total_time_s - self.t_acc - self.t_dec)
+        self.t_dec = (self.v_max - self.v_final) * math.pi / (2 * self.max_decel)
+        self.t_cruise = max(0.0, self.total_time_s - self.t_acc - self.t_dec - self.t_final)
 
         self.t_end_acc = self.t_acc
         self.t_start_dec = self.t_acc + self.t_cruise
-        log_utils.log("Profile: v_max={:.1f} mm/s, t_acc={:.2f}s, t_cruise={:.2f}s, t_dec={:.2f}s".format(
-            self.v_max, self.t_acc, self.t_cruise, self.t_dec))
+        self.t_start_final = self.t_start_dec + self.t_dec
+        log_utils.log("Profile: v_max={:.1f} mm/s, t_acc={:.2f}s, t_cruise={:.2f}s, t_dec={:.2f}s, "
+                      "v_final={:.1f} mm/s for {:.2f}s".format(
+                          self.v_max, self.t_acc, self.t_cruise, self.t_dec, self.v_final, self.t_final))
 
     def _solve_peak_velocity(self):
-        """Closed-form solution for peak velocity honoring accel limits and time."""
-        a_term = (math.pi / 4.0) * ((1.0 / self.max_accel) + (1.0 / self.max_decel))
-        discriminant = self.total_time_s ** 2 - 4 * a_term * self.distance_mm
+        """
+        Closed-form solution for peak velocity honoring accel limits and time.
+        distance = v * (T - (1 - r) * t_final) - v^2 * pi/4 * (1/a + (1 - r)^2 / d)
+        for a final speed of r * v held for t_final.
+        """
+        slow = 1.0 - self.final_ratio
+        a_term = (math.pi / 4.0) * ((1.0 / self.max_accel) + (slow * slow / self.max_decel))
+        time_term = self.total_time_s - slow * self.t_final
+        discriminant = time_term ** 2 - 4 * a_term * self.distance_mm
         if discriminant < 0:
             raise ValueError("Profile infeasible with given acceleration limits and time.")
 
         root = math.sqrt(discriminant)
-        v1 = (self.total_time_s - root) / (2 * a_term)
-        v2 = (self.total_time_s + root) / (2 * a_term)
+        v1 = (time_term - root) / (2 * a_term)
+        v2 = (time_term + root) / (2 * a_term)
         candidates = [v for v in (v1, v2) if v > 0]
         if not candidates:
             raise ValueError("No positive peak velocity satisfies constraints.")
@@ -55,9 +72,12 @@ class SCurveProfile:
         if t_s < self.t_start_dec:
             return self.v_max
 
+        if t_s >= self.t_start_final:
+            return self.v_final
+
         time_in_dec = t_s - self.t_start_dec
         progress = time_in_dec / self.t_dec
-        return self.v_max * (1 + math.cos(math.pi * progress)) / 2
+        return self.v_final + (self.v_max - self.v_final) * (1 + math.cos(math.pi * progress)) / 2
 
 
 def circular_arc_radius(chord_mm, sagitta_mm):
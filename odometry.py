@@ -0,0 +1,64 @@
+"""
+Dead-reckoning odometry from wheel encoders and the gyro.
+Heading is a complementary filter: each tick it is advanced by the yaw
+change implied by the encoder difference (fine-grained, but affected by
+slip and track-width error) and then pulled toward the gyro heading
+(1-degree steps, but no long-term drift once drift-corrected). Position is
+integrated along the exact arc between the previous and new heading.
+"""
+
+import math
+
+# Heading changes below this (rad) are integrated as a straight segment
+STRAIGHT_EPSILON_RAD = 1e-9
+
+
+class Odometry:
+    """Pose estimate (mm, deg) updated once per control tick from raw encoder angles."""
+    __slots__ = (
+        "mm_per_degree", "track_width_mm", "gyro_weight",
+        "x_mm", "y_mm", "heading_deg", "distance_mm",
+        "_heading_rad", "_last_left", "_last_right",
+    )
+
+    def __init__(self, mm_per_degree, track_width_mm, gyro_weight):
+        self.mm_per_degree = mm_per_degree
+        self.track_width_mm = track_width_mm
+        self.gyro_weight = gyro_weight
+        self.reset()
+
+    def reset(self, left_angle=0, right_angle=0, heading_deg=0.0):
+        self.x_mm = 0.0
+        self.y_mm = 0.0
+        self.distance_mm = (left_angle + right_angle) * 0.5 * self.mm_per_degree
+        self.heading_deg = heading_deg
+        self._heading_rad = math.radians(heading_deg)
+        self._last_left = left_angle
+        self._last_right = right_angle
+
+    def update(self, left_angle, right_angle, gyro_heading_deg):
+        """Advances the pose with new encoder angles (deg) and the drift-corrected gyro heading."""
+        d_left = (left_angle - self._last_left) * self.mm_per_degree
+        d_right = (right_angle - self._last_right) * self.mm_per_degree
+        self._last_left = left_angle
+        self._last_right = right_angle
+        ds = (d_left + d_right) * 0.5
+
+        # Predict with the encoder yaw change, then correct toward the gyro.
+        h0 = self._heading_rad
+        predicted = h0 + (d_right - d_left) / self.track_width_mm
+        h1 = predicted + self.gyro_weight * (math.radians(gyro_heading_deg) - predicted)
+        dh = h1 - h0
+
+        # Exact arc for a constant turn rate over the tick
+        if -STRAIGHT_EPSILON_RAD < dh < STRAIGHT_EPSILON_RAD:
+            self.x_mm += ds * math.cos(h0)
+            self.y_mm += ds * math.sin(h0)
+        else:
+            r = ds / dh
+            self.x_mm += r * (math.sin(h1) - math.sin(h0))
+            self.y_mm -= r * (math.cos(h1) - math.cos(h0))
+
+        self._heading_rad = h1
+        self.heading_deg = math.degrees(h1)
+        self.distance_mm += ds
@@ -0,0 +1,87 @@
+"""
+PID controller for the steering loop.
+The integral is a sliding window kept in a preallocated ring with a running
+sum, so an update does a constant amount of work and never grows or shifts
+a list.
+"""
+
+from array import array
+
+
+class PID:
+    """
+    PID with a sliding-window integral of error * dt.
+    The integral is clamped to +/- integral_limit (anti-windup) and, if
+    reset_on_sign_change is set, cleared whenever the error crosses zero.
+    derivative_alpha is the weight of the newest sample in a first-order
+    low-pass filter on the derivative; 1.0 leaves it unfiltered.
+    """
+    __slots__ = (
+        "kp", "ki", "kd", "integral_limit", "derivative_alpha", "reset_on_sign_change",
+        "_window", "_size", "_index", "_count", "_window_sum",
+        "integral", "derivative", "last_error",
+    )
+
+    def __init__(self, kp, ki, kd, window_size, integral_limit, derivative_alpha=1.0, reset_on_sign_change=True):
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.integral_limit = integral_limit
+        self.derivative_alpha = derivative_alpha
+        self.reset_on_sign_change = reset_on_sign_change
+        self._size = max(1, window_size)
+        self._window = array("d", [0.0] * self._size)
+        self.reset()
+
+    def set_gains(self, kp, ki, kd):
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+
+    def clear_integral(self):
+        # Stale ring entries are overwritten before the window is full again,
+        # so they never need zeroing.
+        self._index = 0
+        self._count = 0
+        self._window_sum = 0.0
+        self.integral = 0.0
+
+    def reset(self):
+        self.clear_integral()
+        self.derivative = 0.0
+        self.last_error = 0.0
+
+    def update(self, error, dt):
+        """Returns the controller output for this error; dt must be positive (seconds)."""
+        last_error = self.last_error
+        if last_error * error < 0 and self.reset_on_sign_change:
+            self.clear_integral()
+
+        # Replace the oldest window entry and keep the running sum in step.
+        window = self._window
+        i = self._index
+        sample = error * dt
+        integral = self._window_sum + sample
+        count = self._count
+        if count < self._size:
+            self._count = count + 1
+        else:
+            integral -= window[i]
+        window[i] = sample
+        i += 1
+        self._index = i if i < self._size else 0
+        self._window_sum = integral
+
+        limit = self.integral_limit
+        if integral > limit:
+            integral = limit
+        elif integral < -limit:
+            integral = -limit
+        self.integral = integral
+
+        derivative = self.derivative
+        derivative += self.derivative_alpha * ((error - last_error) / dt - derivative)
+        self.derivative = derivative
+        self.last_error = error
+
+        return self.kp * error + self.ki * integral + self.kd * derivative
@@ -0,0 +1,42 @@
+"""
+Latency-compensated pose prediction for steering.
+The pose from a sensor sample is already old when the motor command based
+on it goes out, and the motor speed loop takes a while longer to respond.
+The predictor advances the pose along the arc driven by the last commanded
+wheel speeds, from the sample time to when the new command takes effect.
+"""
+
+import math
+
+from odometry import STRAIGHT_EPSILON_RAD
+
+
+class PosePredictor:
+    """
+    Extrapolates (x_mm, y_mm, heading_deg, distance_mm) by the sample age plus
+    latency_ms, the lag from sending a command to the wheels following it
+    (see utils/calibrate_latency.py).
+    """
+    __slots__ = ("latency_ms", "track_width_mm")
+
+    def __init__(self, latency_ms, track_width_mm):
+        self.latency_ms = latency_ms
+        self.track_width_mm = track_width_mm
+
+    def predict(self, pose, v_left_mm_s, v_right_mm_s, age_ms):
+        x, y, heading_deg, distance_mm = pose
+        dt = (age_ms + self.latency_ms) / 1000.0
+        if dt <= 0:
+            return pose
+        ds = (v_left_mm_s + v_right_mm_s) * 0.5 * dt
+        dh = (v_right_mm_s - v_left_mm_s) / self.track_width_mm * dt
+        h0 = math.radians(heading_deg)
+        if -STRAIGHT_EPSILON_RAD < dh < STRAIGHT_EPSILON_RAD:
+            x += ds * math.cos(h0)
+            y += ds * math.sin(h0)
+        else:
+            h1 = h0 + dh
+            r = ds / dh
+            x += r * (math.sin(h1) - math.sin(h0))
+            y -= r * (math.cos(h1) - math.cos(h0))
+        return x, y, heading_deg + math.degrees(dh), distance_mm + ds
@@ -0,0 +1,98 @@
+"""
+Opt-in per-stage timing for the run control tick.
+All storage is preallocated when the profiler is built, so recording a
+sample never allocates inside the control loop.
+"""
+
+from array import array
+import config
+from pybricks.tools import StopWatch  # pyright: ignore[reportMissingImports]
+
+# Stage indexes for the run loop in main.py
+STAGE_SENSORS = 0
+STAGE_POSE = 1
+STAGE_STRATEGY = 2
+STAGE_STEER = 3
+STAGE_RUN_LOGGER = 4
+STAGE_LOG = 5
+STAGE_PROGRESS = 6
+
+RUN_TICK_STAGES = (
+    "update_sensors",
+    "get_pose",
+    "get_target_state",
+    "steer_heading",
+    "logger.state",
+    "log_utils.log_values",
+    "progress.update",
+)
+
+
+class TickProfiler:
+    """
+    Per-stage millisecond histograms timed with a StopWatch.
+    Call start() before a stage and stop(stage) after it; consecutive stop()
+    calls chain, so back-to-back stages need only one start().
+    """
+    def __init__(self, stage_names, max_ms):
+        self.stage_names = tuple(stage_names)
+        stages = len(self.stage_names)
+        # One bin per ms; the last bin also collects anything slower than max_ms.
+        self.bins = max_ms + 1
+        self.hist = array("L", [0] * (stages * self.bins))
+        self.counts = array("L", [0] * stages)
+        self.totals = array("L", [0] * stages)
+        self.mins = array("l", [max_ms] * stages)
+        self.maxs = array("l", [0] * stages)
+        self.timer = StopWatch()
+        self.timer.reset()
+        self._mark_ms = 0
+
+    def start(self):
+        self._mark_ms = self.timer.time()
+
+    def stop(self, stage):
+        now = self.timer.time()
+        elapsed = now - self._mark_ms
+        self._mark_ms = now
+
+        self.counts[stage] += 1
+        self.totals[stage] += elapsed
+        if elapsed < self.mins[stage]:
+            self.mins[stage] = elapsed
+        if elapsed > self.maxs[stage]:
+            self.maxs[stage] = elapsed
+        if elapsed >= self.bins:
+            elapsed = self.bins - 1
+        self.hist[stage * self.bins + elapsed] += 1
+
+    def percentile(self, stage, fraction):
+        count = self.counts[stage]
+        if count == 0:
+            return 0
+        needed = fraction * count
+        seen = 0
+        base = stage * self.bins
+        for ms in range(self.bins):
+            seen += self.hist[base + ms]
+            if seen >= needed:
+                return ms
+        return self.bins - 1
+
+    def report_lines(self):
+        fraction = config.PROFILE_REPORT_PERCENTILE
+        lines = ["Profile (ms): stage n min mean p{} max".format(int(round(fraction * 100)))]
+        for stage, name in enumerate(self.stage_names):
+            count = self.counts[stage]
+            if count == 0:
+                lines.append("Profile {}: no samples".format(name))
+                continue
+            lines.append("Profile {}: {} {} {:.2f} {} {}".format(
+                name,
+                count,
+                self.mins[stage],
+                self.totals[stage] / count,
+                self.percentile(stage, fraction),
+                self.maxs[stage],
+            ))
+        return lines
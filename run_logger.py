@@ -1,48 +1,173 @@
-"""Simple logging wrapper using EV3 DataLog."""
+"""
+Run telemetry recorder.
+Samples are kept in preallocated array-backed columns during the run and
+written to disk in one pass afterwards; run settings are written once as
+a header instead of being repeated on every row.
 
+Binary layout (little-endian), decoded on the host by utils/telemetry_binary.py:
+    magic "EVTL", version u16, header_len u32, record_size u16,
+    record_count u32, field_count u16,
+    per field: name_len u8, name, struct code (1 byte), scale f32,
+    settings_len u32, settings JSON,
+    zero padding up to header_len, then record_count fixed-size records.
+A field stored as an integer holds round(value * scale).
+"""
+
+import json
+import struct
+from array import array
 from pybricks.tools import DataLog # pyright: ignore[reportMissingImports]
+import config
+
+# (header, typecode, format) for each per-tick column
+TELEMETRY_FIELDS = (
+    ("ms", "l", "{}"),
+    ("x_mm", "f", "{:.2f}"),
+    ("y_mm", "f", "{:.2f}"),
+    ("dist_mm", "f", "{:.2f}"),
+    ("vel_cmd", "f", "{:.2f}"),
+    ("heading_cmd", "f", "{:.3f}"),
+    ("heading_deg", "f", "{:.3f}"),
+    ("curvature_cmd_mm", "f", "{:.4e}"),
+    ("drift_dps", "f", "{:.5f}"),
+    ("cross_track_mm", "f", "{:.2f}"),
+)
+
+# (struct code, scale) per field for the fixed-point binary encoding
+TELEMETRY_FIXED_POINT = (
+    ("i", 1.0),
+    ("i", 100.0),
+    ("i", 100.0),
+    ("i", 100.0),
+    ("h", 10.0),
+    ("h", 100.0),
+    ("h", 100.0),
+    ("i", 1e9),
+    ("i", 1e6),
+    ("h", 10.0),
+)
+
+SETTINGS_PREFIX = "# "
+
+BINARY_MAGIC = b"EVTL"
+BINARY_VERSION = 1
+BINARY_HEADER_ALIGN = 4
+_INT_LIMITS = {"h": (-32768, 32767), "i": (-2147483648, 2147483647)}
 
 
 class RunLogger:
-    def __init__(self, run_settings=None):
+    def __init__(self, run_settings=None, max_samples=None, name="telemetry"):
         self.run_settings = dict(run_settings or {})
         self.run_setting_keys = tuple(self.run_settings.keys())
-        self.run_setting_values = tuple(self.run_settings[k] for k in self.run_setting_keys)
-
-        telemetry_headers = [
-            "ms",
-            "x_mm",
-            "y_mm",
-            "dist_mm",
-            "vel_cmd",
-            "heading_cmd",
-            "heading_deg",
-            "curvature_cmd_mm",
-            "drift_dps",
-        ]
-        telemetry_headers.extend(self.run_setting_keys)
-
-        self.telemetry = DataLog(
-            *telemetry_headers,
-            name="telemetry",
-            timestamp=False,
-        )
+        self.path = name
+
+        if max_samples is None:
+            max_samples = config.TELEMETRY_MAX_SAMPLES
+        self.max_samples = max_samples
+        self.columns = tuple(array(code, [0] * max_samples) for _, code, _ in TELEMETRY_FIELDS)
+        (self.ms, self.x_mm, self.y_mm, self.dist_mm, self.vel_cmd,
+         self.heading_cmd, self.heading_deg, self.curvature_cmd_mm, self.drift_dps,
+         self.cross_track_mm) = self.columns
+        self.count = 0
+        self.dropped = 0
+
         self.events = DataLog("ms", "event", name="events", timestamp=False)
 
     def event(self, ms, message):
         self.events.log(ms, message)
 
-    def state(self, ms, x_mm, y_mm, dist_mm, vel_cmd, heading_cmd, heading_deg, curvature_cmd_mm, drift_dps):
-        values = [
-            ms,
-            x_mm,
-            y_mm,
-            dist_mm,
-            vel_cmd,
-            heading_cmd,
-            heading_deg,
-            curvature_cmd_mm,
-            drift_dps,
-        ]
-        values.extend(self.run_setting_values)
-        self.telemetry.log(*values)
+    def state(self, ms, x_mm, y_mm, dist_mm, vel_cmd, heading_cmd, heading_deg, curvature_cmd_mm, drift_dps,
+              cross_track_mm):
+        i = self.count
+        if i >= self.max_samples:
+            self.dropped += 1
+            return
+        self.ms[i] = ms
+        self.x_mm[i] = x_mm
+        self.y_mm[i] = y_mm
+        self.dist_mm[i] = dist_mm
+        self.vel_cmd[i] = vel_cmd
+        self.heading_cmd[i] = heading_cmd
+        self.heading_deg[i] = heading_deg
+        self.curvature_cmd_mm[i] = curvature_cmd_mm
+        self.drift_dps[i] = drift_dps
+        self.cross_track_mm[i] = cross_track_mm
+        self.count = i + 1
+
+    def save(self, telemetry_format=None):
+        """Writes the recorded samples in the configured format. Returns the sample count."""
+        if telemetry_format is None:
+            telemetry_format = config.TELEMETRY_FORMAT
+        if telemetry_format == config.TELEMETRY_FORMAT_BINARY:
+            return self.save_binary(config.TELEMETRY_BINARY_FIXED_POINT)
+        return self.save_csv()
+
+    def save_csv(self):
+        """Writes the settings header and all recorded samples as CSV."""
+        row_format = ",".join(fmt for _, _, fmt in TELEMETRY_FIELDS) + "\n"
+        columns = self.columns
+        with open(self.path + ".csv", "w") as f:
+            for key in self.run_setting_keys:
+                f.write("{}{},{}\n".format(SETTINGS_PREFIX, key, self.run_settings[key]))
+            f.write(",".join(name for name, _, _ in TELEMETRY_FIELDS) + "\n")
+            for i in range(self.count):
+                f.write(row_format.format(*[col[i] for col in columns]))
+        return self.count
+
+    def _binary_layout(self, fixed_point):
+        fields = []
+        for i, (name, code, _) in enumerate(TELEMETRY_FIELDS):
+            if fixed_point:
+                fields.append((name,) + TELEMETRY_FIXED_POINT[i])
+            elif code == "f":
+                fields.append((name, "f", 1.0))
+            else:
+                fields.append((name, "i", 1.0))
+        return fields
+
+    def save_binary(self, fixed_point=True):
+        """Packs all recorded samples into fixed-size records and writes them with one write."""
+        fields = self._binary_layout(fixed_point)
+        record_format = "<" + "".join(code for _, code, _ in fields)
+        record_size = struct.calcsize(record_format)
+
+        header = bytearray()
+        for name, code, scale in fields:
+            encoded = name.encode()
+            header += struct.pack("<B", len(encoded)) + encoded + code.encode() + struct.pack("<f", scale)
+        settings = json.dumps(self.run_settings).encode()
+        header += struct.pack("<I", len(settings)) + settings
+
+        prefix_format = "<4sHIHIH"
+        header_len = struct.calcsize(prefix_format) + len(header)
+        header_len += (-header_len) % BINARY_HEADER_ALIGN
+        prefix = struct.pack(prefix_format, BINARY_MAGIC, BINARY_VERSION, header_len,
+                             record_size, self.count, len(fields))
+
+        data = bytearray(header_len + record_size * self.count)
+        data[0:len(prefix)] = prefix
+        data[len(prefix):len(prefix) + len(header)] = header
+
+        columns = self.columns
+        codes = [code for _, code, _ in fields]
+        scales = [scale for _, _, scale in fields]
+        row = [0] * len(fields)
+        offset = header_len
+        for i in range(self.count):
+            for c in range(len(fields)):
+                value = columns[c][i]
+                code = codes[c]
+                if code != "f":
+                    value = int(round(value * scales[c]))
+                    low, high = _INT_LIMITS[code]
+                    if value < low:
+                        value = low
+                    elif value > high:
+                        value = high
+                row[c] = value
+            struct.pack_into(record_format, data, offset, *row)
+            offset += record_size
+
+        with open(self.path + ".bin", "wb") as f:
+            f.write(data)
+        return self.count
@@ -0,0 +1,56 @@
+"""
+Control tick of the run loop, shared by main.py and the host simulations
+in utils/ so both drive the vehicle the same way.
+"""
+
+from profiler import STAGE_SENSORS, STAGE_POSE, STAGE_STRATEGY, STAGE_STEER
+
+
+def run_loop_step(car, strategy, time_s, profiler=None):
+    """
+    Reads the sensors, asks the strategy for the target state at time_s and
+    commands the motors. Stages are timed when a TickProfiler is given.
+    Returns (pose, dist_mm, target_v, target_h, target_k).
+    """
+    if profiler:
+        profiler.start()
+    car.update_sensors()
+    if profiler:
+        profiler.stop(STAGE_SENSORS)
+
+    dist_mm = car.get_distance()
+    pose = car.get_pose()
+    if profiler:
+        profiler.stop(STAGE_POSE)
+    target_v, target_h, target_k = strategy.get_target_state(time_s, pose, car.predict_pose(pose))
+    if profiler:
+        profiler.stop(STAGE_STRATEGY)
+
+    car.drive_speed(target_v)
+    car.steer_heading(target_h, curvature_mm=target_k)
+    if profiler:
+        profiler.stop(STAGE_STEER)
+    return pose, dist_mm, target_v, target_h, target_k
+
+
+class StallGuard:
+    """
+    Flags a stall when the distance moved over a window_ms window stays
+    below threshold_mm.
+    """
+    __slots__ = ("window_ms", "threshold_mm", "last_move_ms", "last_dist_mm")
+
+    def __init__(self, window_ms, threshold_mm):
+        self.window_ms = window_ms
+        self.threshold_mm = threshold_mm
+        self.last_move_ms = 0
+        self.last_dist_mm = 0.0
+
+    def stalled(self, loop_ms, dist_mm):
+        if loop_ms - self.last_move_ms < self.window_ms:
+            return False
+        if abs(dist_mm - self.last_dist_mm) < self.threshold_mm:
+            return True
+        self.last_move_ms = loop_ms
+        self.last_dist_mm = dist_mm
+        return False
@@ -0,0 +1,96 @@
+"""
+Fixed-rate tick scheduling for the run control loop.
+Ticks are released against absolute deadlines so time spent inside a tick
+does not stretch the control period.
+"""
+
+from pybricks.tools import wait, StopWatch  # pyright: ignore[reportMissingImports]
+
+
+class TickScheduler:
+    """
+    Releases control ticks at start + n * period.
+    A tick that starts later than the tolerance is an overrun; low-priority
+    work (logging, screen updates) should be deferred on such ticks so the
+    loop can catch back up to its deadlines. An optional idle_task runs
+    while waiting for a deadline that is at least idle_min_ms away.
+    """
+    def __init__(self, period_ms, late_tolerance_ms=0, timer=None, idle_task=None, idle_min_ms=0):
+        self.period_ms = period_ms
+        self.late_tolerance_ms = late_tolerance_ms
+        self.timer = timer if timer is not None else StopWatch()
+        self.idle_task = idle_task
+        self.idle_min_ms = idle_min_ms
+        self.start()
+
+    def start(self):
+        """Anchors the deadline grid at the current timer value and clears stats."""
+        self.next_deadline_ms = self.timer.time()
+        self.tick_start_ms = self.next_deadline_ms
+        self.late_ms = 0
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped_ticks = 0
+        self.deferred = 0
+        self.jitter_sum_ms = 0
+        self.jitter_max_ms = 0
+        self.work_max_ms = 0
+        self.idle_runs = 0
+
+    def wait_next(self):
+        """Blocks until the next deadline and returns the tick start time (ms)."""
+        now = self.timer.time()
+        if self.ticks > 0:
+            work_ms = now - self.tick_start_ms
+            if work_ms > self.work_max_ms:
+                self.work_max_ms = work_ms
+
+        remaining = self.next_deadline_ms - now
+        if self.idle_task is not None and remaining > 0 and remaining >= self.idle_min_ms:
+            self.idle_task()
+            self.idle_runs += 1
+            now = self.timer.time()
+            remaining = self.next_deadline_ms - now
+        if remaining > 0:
+            wait(remaining)
+            now = self.timer.time()
+
+        late = now - self.next_deadline_ms
+        if late < 0:
+            late = 0
+        if late > self.late_tolerance_ms:
+            self.overruns += 1
+        if late >= self.period_ms:
+            # Whole periods were missed: drop them instead of bursting to catch up.
+            missed = late // self.period_ms
+            self.skipped_ticks += missed
+            self.next_deadline_ms += missed * self.period_ms
+
+        self.late_ms = late
+        self.jitter_sum_ms += late
+        if late > self.jitter_max_ms:
+            self.jitter_max_ms = late
+
+        self.ticks += 1
+        self.tick_start_ms = now
+        self.next_deadline_ms += self.period_ms
+        return now
+
+    def low_priority_ok(self):
+        """
+        Returns True if this tick started on time and can afford deferrable work.
+        Each refusal is counted so the report shows how much work was deferred.
+        """
+        if self.late_ms > self.late_tolerance_ms:
+            self.deferred += 1
+            return False
+        return True
+
+    def report_lines(self):
+        ticks = max(1, self.ticks)
+        return [
+            "Scheduler: period={}ms, ticks={}, overruns={}, skipped={}, deferred={}, idle runs={}".format(
+                self.period_ms, self.ticks, self.overruns, self.skipped_ticks, self.deferred, self.idle_runs),
+            "Scheduler: jitter mean={:.2f}ms, max={}ms, work max={}ms".format(
+                self.jitter_sum_ms / ticks, self.jitter_max_ms, self.work_max_ms),
+        ]
@@ -4,9 +4,11 @@ Refactored to support dynamic speed adjustment and elegant path handling.
 """
 
 import math
+from array import array
 import config
 import log_utils
-from motion import circular_arc_length, circular_arc_radius
+from trajectory import TrajectoryPlan
+from motion import SCurveProfile, circular_arc_length, circular_arc_radius
 
 class SpeedController:
     """
@@ -74,45 +76,275 @@ class SpeedController:
         return v_cmd
 
 
+class SCurveSpeedController:
+    """
+    Serves velocities from a jerk-limited SCurveProfile computed once for the
+    path length and target time. Raises ValueError if the target cannot be
+    met within the acceleration and speed limits. The profile ends with a
+    short approach at constant speed, during which the remaining distance is
+    matched to the remaining time as the rate-limited controller does, so a
+    vehicle ahead of or behind the profile still arrives at the target time.
+    Distance still left after the target time is closed at the
+    stopping-distance limited speed.
+    """
+    def __init__(self, target_distance_mm, target_time_s):
+        self.target_dist_mm = target_distance_mm
+        self.target_time_s = target_time_s
+        self.max_v = config.MAX_SPEED_MM_S
+        self.max_decel = config.MAX_DECEL_MM_S2
+        self.profile = SCurveProfile(target_distance_mm, target_time_s,
+                                     config.MAX_ACCEL_MM_S2, config.MAX_DECEL_MM_S2, config.MAX_SPEED_MM_S,
+                                     config.SCURVE_FINAL_SPEED_RATIO, config.SCURVE_FINAL_APPROACH_S)
+
+    def compute_target_velocity(self, time_s, dist_traveled_mm):
+        dist_remaining = self.target_dist_mm - dist_traveled_mm
+        time_remaining = self.target_time_s - time_s
+        if time_remaining > 0 and time_s < self.profile.t_start_final:
+            return self.profile.get_target_velocity(time_s)
+        if dist_remaining <= 0:
+            return 0.0
+        if time_remaining > 0:
+            return min(self.max_v, dist_remaining / time_remaining)
+        return min(self.max_v, math.sqrt(2 * self.max_decel * dist_remaining))
+
+
+# Built path tables keyed by path geometry and table settings, oldest key first
+_table_cache = {}
+_table_cache_keys = []
+
+# Interleaved fields of each path table entry
+TABLE_X = 0
+TABLE_Y = 1
+TABLE_HEADING = 2
+TABLE_CURVATURE = 3
+TABLE_STRIDE = 4
+
+
 class Path:
-    """Base class for geometric paths."""
+    """
+    Base class for geometric paths.
+    Subclasses describe the path as y(x) through _shape(). At construction the
+    path is sampled at fixed arc-length spacing into one interleaved
+    array('f') of (x, y, heading_deg, curvature), so per-tick queries are an
+    indexed interpolation by distance along the path instead of trig calls.
+    The arc length integrated while sampling is the path's total_length.
+    Built tables are shared between paths with the same geometry.
+    """
     def __init__(self, run_config):
         self.config = run_config
         self.target_dist_mm = (run_config["target_distance_m"] + config.DISTANCE_CORRECTION_M) * config.MM_PER_METER
         self._length = self.target_dist_mm
+        self.spacing_mm = config.PATH_TABLE_SPACING_MM
+        self._inv_spacing = 1.0 / self.spacing_mm
+        self.table = None
+        self.table_count = 0
+        self._proj_index = 0
+        self.reacquire_count = 0
 
     @property
     def total_length(self):
         return self._length
 
-    def get_lookahead_point(self, pose):
+    def _shape(self, x):
         """
-        Returns (x, y) coordinates of the lookahead point based on current pose.
+        Returns (y, dy/dx, curvature) at the given x coordinate.
         Must be implemented by subclasses.
         """
         raise NotImplementedError
 
-    def get_curvature(self, x):
-        """Returns the curvature (kappa) at the given x coordinate."""
-        return 0.0
-    
-    def _project_point(self, x, dist):
-        """Helper to return basic line projection."""
-        return x + dist
+    def _build_table(self, key):
+        """
+        Sets the table and total_length for the geometry identified by key,
+        sampling the path only when no cached table matches.
+        """
+        key = key + (self.spacing_mm, config.PATH_TABLE_SUBSTEPS)
+        built = _table_cache.get(key)
+        if built is None:
+            built = self._sample_table()
+            if len(_table_cache_keys) >= config.PATH_TABLE_CACHE_SIZE:
+                del _table_cache[_table_cache_keys.pop(0)]
+            _table_cache[key] = built
+            _table_cache_keys.append(key)
+        self.table, self._length, self._start_dir, self._end_dir = built
+        self.table_count = len(self.table) // TABLE_STRIDE
+
+    def _sample_table(self):
+        """
+        Samples the path from x = 0 to the target at fixed arc-length spacing.
+        Returns (table, arc length, start direction, end direction).
+        """
+        spacing = self.spacing_mm
+        end_x = self.target_dist_mm
+        steps = max(1, int(math.ceil(end_x * config.PATH_TABLE_SUBSTEPS / spacing)))
+        dx = end_x / steps
+
+        table = array("f")
+        self._append_entry(table, 0.0)
+        s = 0.0
+        next_s = spacing
+        x0 = 0.0
+        w0 = math.sqrt(1 + self._shape(0.0)[1] ** 2)
+        for i in range(1, steps + 1):
+            x1 = end_x if i == steps else i * dx
+            wm = math.sqrt(1 + self._shape(x0 + dx / 2.0)[1] ** 2)
+            w1 = math.sqrt(1 + self._shape(x1)[1] ** 2)
+            # Simpson's rule on ds/dx = sqrt(1 + y'^2)
+            ds = dx * (w0 + 4 * wm + w1) / 6.0
+            while next_s <= s + ds:
+                self._append_entry(table, x0 + dx * (next_s - s) / ds)
+                next_s += spacing
+            s += ds
+            x0, w0 = x1, w1
+
+        start_h = math.radians(table[TABLE_HEADING])
+        end_h = math.radians(table[len(table) - TABLE_STRIDE + TABLE_HEADING])
+        return table, s, (math.cos(start_h), math.sin(start_h)), (math.cos(end_h), math.sin(end_h))
+
+    def _append_entry(self, table, x):
+        y, slope, kappa = self._shape(x)
+        table.append(x)
+        table.append(y)
+        table.append(math.degrees(math.atan(slope)))
+        table.append(kappa)
+
+    def sample(self, s):
+        """
+        Returns (x, y, heading_deg, curvature) at arc length s along the path.
+        Outside the table the path continues straight along the end heading.
+        """
+        table = self.table
+        pos = s * self._inv_spacing
+        last = self.table_count - 1
+        if pos < 0:
+            ux, uy = self._start_dir
+            return (table[TABLE_X] + s * ux, table[TABLE_Y] + s * uy,
+                    table[TABLE_HEADING], table[TABLE_CURVATURE])
+        if pos >= last:
+            b = last * TABLE_STRIDE
+            ds = s - last * self.spacing_mm
+            ux, uy = self._end_dir
+            return (table[b + TABLE_X] + ds * ux, table[b + TABLE_Y] + ds * uy,
+                    table[b + TABLE_HEADING], 0.0)
+        i = int(pos)
+        f = pos - i
+        b = i * TABLE_STRIDE
+        n = b + TABLE_STRIDE
+        return (table[b] + (table[n] - table[b]) * f,
+                table[b + 1] + (table[n + 1] - table[b + 1]) * f,
+                table[b + 2] + (table[n + 2] - table[b + 2]) * f,
+                table[b + 3] + (table[n + 3] - table[b + 3]) * f)
+
+    def project(self, x, y):
+        """
+        Projects (x, y) onto the path.
+        Returns (progress_mm, cross_track_mm, path_heading_deg); cross-track is
+        positive when the point is left of the path. Only a small window around
+        the previous projection is searched; while the nearest entry lies on the
+        window edge the window is re-centred on it and searched again. The whole
+        table is searched only when the point is far off the path.
+        """
+        table = self.table
+        last = self.table_count - 1
+        window = config.PATH_PROJECTION_WINDOW
+        best = self._proj_index
+        best_d = self._distance_sq(best, x, y)
+        while True:
+            lo = best - window
+            hi = best + window
+            if lo < 0:
+                lo = 0
+            if hi > last:
+                hi = last
+            i = self._nearest_entry(x, y, lo, hi)
+            d = self._distance_sq(i, x, y)
+            if d >= best_d:
+                break
+            best = i
+            best_d = d
+            if lo < i < hi:
+                break
+        if best_d > config.PATH_PROJECTION_LOST_MM ** 2:
+            best = self._nearest_entry(x, y, 0, last)
+            self.reacquire_count += 1
+        self._proj_index = best
+
+        # Refine onto whichever neighbouring segment is closer. The first and
+        # last segments extend beyond the ends of the table.
+        spacing = self.spacing_mm
+        best_d = -1.0
+        progress = best * spacing
+        cross_track = 0.0
+        for i in (best - 1, best):
+            if i < 0 or i >= last:
+                continue
+            a = i * TABLE_STRIDE
+            ux = table[a + TABLE_STRIDE] - table[a]
+            uy = table[a + TABLE_STRIDE + 1] - table[a + 1]
+            chord = math.sqrt(ux * ux + uy * uy)
+            ux /= chord
+            uy /= chord
+            px = x - table[a]
+            py = y - table[a + 1]
+            along = px * ux + py * uy
+            if along < 0 and i > 0:
+                along = 0.0
+            elif along > chord and i < last - 1:
+                along = chord
+            d = (px - along * ux) ** 2 + (py - along * uy) ** 2
+            if best_d < 0 or d < best_d:
+                best_d = d
+                progress = (i + along / chord) * spacing
+                cross_track = ux * py - uy * px
+        return progress, cross_track, self.sample(progress)[TABLE_HEADING]
+
+    def _distance_sq(self, index, x, y):
+        b = index * TABLE_STRIDE
+        dx = x - self.table[b]
+        dy = y - self.table[b + 1]
+        return dx * dx + dy * dy
+
+    def _nearest_entry(self, x, y, lo, hi):
+        table = self.table
+        best = lo
+        best_d = None
+        b = lo * TABLE_STRIDE
+        for i in range(lo, hi + 1):
+            dx = x - table[b]
+            dy = y - table[b + 1]
+            d = dx * dx + dy * dy
+            if best_d is None or d < best_d:
+                best = i
+                best_d = d
+            b += TABLE_STRIDE
+        return best
+
+    def get_lookahead_point(self, progress_mm):
+        """Returns (x, y) of the path point LOOKAHEAD_DIST_MM ahead of the given progress."""
+        x, y, _, _ = self.sample(progress_mm + config.LOOKAHEAD_DIST_MM)
+        return x, y
+
+    def get_curvature(self, s):
+        """Returns the curvature (kappa) at arc length s along the path."""
+        pos = s * self._inv_spacing
+        if pos < 0:
+            return self.table[TABLE_CURVATURE]
+        last = self.table_count - 1
+        if pos >= last:
+            return 0.0  # Straight after target
+        i = int(pos)
+        b = i * TABLE_STRIDE + TABLE_CURVATURE
+        k0 = self.table[b]
+        return k0 + (self.table[b + TABLE_STRIDE] - k0) * (pos - i)
 
 
 class StraightPath(Path):
     """A straight line path from (0,0) to (Target, 0)."""
-    
-    def get_lookahead_point(self, pose):
-        x, y, _, _ = pose
-        lookahead = config.LOOKAHEAD_DIST_MM
-        
-        # Look ahead on the X axis
-        target_x = self._project_point(x, lookahead)
-        target_y = 0.0 # Strict line following on Y=0
-        
-        return target_x, target_y
+    def __init__(self, run_config):
+        super().__init__(run_config)
+        self._build_table((config.MODE_STRAIGHT, self.target_dist_mm))
+
+    def _shape(self, x):
+        return 0.0, 0.0, 0.0
 
 
 class BonusPath(Path):
@@ -144,84 +376,30 @@ class BonusPath(Path):
         self.cent_x = self.mid_x
         self.cent_y = self.sagitta_mm - self.radius_mm
         
-        self._length = self._calculate_complex_length()
-
-    def _calculate_complex_length(self):
-        # Segment 1: Cosine Integration
-        points = config.BONUS_PATH_INTEGRATION_STEPS
-        len1 = 0.0
-        last_x, last_y = 0.0, 0.0
-        for i in range(1, points + 1):
-            curr_x = (i / points) * self.mid_x
-            curr_y = (self.sagitta_mm / 2.0) * (1 - math.cos(math.pi * curr_x / self.mid_x))
-            dist = math.sqrt((curr_x - last_x)**2 + (curr_y - last_y)**2)
-            len1 += dist
-            last_x, last_y = curr_x, curr_y
-
-        # Segment 2: Circular Arc
-        dx_seg2 = self.target_dist_mm - self.mid_x
-        val = dx_seg2 / self.radius_mm
-        if val > 1.0: val = 1.0
-        theta = math.asin(val)
-        len2 = self.radius_mm * theta
-        
-        return len1 + len2
-    def get_curvature(self, x):
+        self._build_table((config.MODE_BONUS, self.target_dist_mm, self.gap_m))
+
+    def _shape(self, x):
         if x <= self.mid_x:
             # Segment 1: Cosine Curve
             # y = (S/2) * (1 - cos(pi * x / MidX))
             # k = pi / MidX
             # y' = (S/2) * k * sin(k*x)
             # y'' = (S/2) * k^2 * cos(k*x)
-            if x < 0: x = 0
-            
             k = math.pi / self.mid_x
             amp = self.sagitta_mm / 2.0
-            
+            y = amp * (1 - math.cos(k * x))
             yp = amp * k * math.sin(k * x)
             ypp = amp * k * k * math.cos(k * x)
-            
-            kappa = ypp / math.pow(1 + yp*yp, 1.5)
-            return kappa
-        else:
-            # Segment 2: Circular Arc
-            # Curve is turning Right (negative Y direction relative to tangent?)
-            # Coordinate check: P1 (MidX, S) -> P2 (TargetX, 0).
-            # Tangent at P1 is 0.
-            # Point P2 has y < S.
-            # So we are curving "down" / Right.
-            # Curvature is negative.
-            if x > self.target_dist_mm:
-                return 0.0 # Straight after target?
-            return -1.0 / self.radius_mm
-    def get_lookahead_point(self, pose):
-        x, y, _, _ = pose
-        lookahead = config.LOOKAHEAD_DIST_MM
-        
-        # Project pure x-based progress for lookahead
-        # (Simplification: assumes forward motion approx maps to x)
-        target_x_proj = self._project_point(x, lookahead)
-
-        if target_x_proj <= self.mid_x:
-            # Segment 1: Cosine Curve
-            # y = (S/2) * (1 - cos(pi * x / MidX))
-            term = math.cos(math.pi * target_x_proj / self.mid_x)
-            target_y = (self.sagitta_mm / 2.0) * (1 - term)
-        else:
-            # Segment 2: Circular Arc (Upper branch)
-            # (x - cx)^2 + (y - cy)^2 = R^2
-            dx = target_x_proj - self.cent_x
-            
-            # Check if within circle definition
-            if abs(dx) > self.radius_mm:
-                target_y = 0.0 # Clamp if logic fails (shouldn't if x clamped)
-            else:
-                # y = cy + sqrt(R^2 - dx^2)
-                # Since cent_y is usually negative (S - R), and we want positive Y,
-                # we add the sqrt root.
-                target_y = self.cent_y + math.sqrt(self.radius_mm**2 - dx**2)
+            return y, yp, ypp / math.pow(1 + yp*yp, 1.5)
 
-        return target_x_proj, target_y
+        # Segment 2: Circular Arc (Upper branch)
+        # (x - cx)^2 + (y - cy)^2 = R^2  =>  y = cy + sqrt(R^2 - dx^2)
+        # Tangent at the peak (MidX, S) is 0 and the arc curves down / Right,
+        # so curvature is negative.
+        dx = x - self.cent_x
+        root = math.sqrt(max(self.radius_mm**2 - dx**2, 0.0))
+        slope = -dx / root if root > 0 else 0.0
+        return self.cent_y + root, slope, -1.0 / self.radius_mm
 
 
 class RunStrategy:
@@ -229,6 +407,7 @@ class RunStrategy:
     Orchestrates the path following and speed control.
     """
     def __init__(self, run_config):
+        self.run_config = dict(run_config)
         self.mode = run_config["mode"]
         
         # geometric path
@@ -238,13 +417,36 @@ class RunStrategy:
             self.path = BonusPath(run_config)
         else:
             raise ValueError("Unknown Run Mode: " + str(self.mode))
+
+        # Latest projection of the pose onto the path
+        self.progress_mm = 0.0
+        self.cross_track_mm = 0.0
+        self.max_cross_track_mm = 0.0
             
         # dynamic speed controller
-        self.speed_controller = SpeedController(
-            self.path.total_length,
-            run_config["target_time_s"]
+        self.speed_planner = run_config.get("speed_planner", config.SPEED_PLANNER)
+        self.speed_controller = self._make_speed_controller(run_config["target_time_s"])
+
+        # nominal schedule, planned before the run; the rate-limited
+        # controller is stateful, so the plan steps its own instance
+        if self.speed_planner == config.SPEED_PLANNER_SCURVE:
+            plan_controller = self.speed_controller
+        else:
+            plan_controller = self._make_speed_controller(run_config["target_time_s"])
+        self.plan = TrajectoryPlan(
+            self.path,
+            plan_controller,
+            config.RUN_LOOP_PERIOD_MS,
+            run_config["target_time_s"] * config.RUN_TIMEOUT_MULTIPLIER,
         )
 
+    def _make_speed_controller(self, target_time_s):
+        if self.speed_planner == config.SPEED_PLANNER_SCURVE:
+            return SCurveSpeedController(self.path.total_length, target_time_s)
+        if self.speed_planner == config.SPEED_PLANNER_RATE_LIMIT:
+            return SpeedController(self.path.total_length, target_time_s)
+        raise ValueError("Unknown Speed Planner: " + str(self.speed_planner))
+
     @property
     def total_path_length(self):
         return self.path.total_length
@@ -253,17 +455,42 @@ class RunStrategy:
     def target_time_s(self):
         return self.speed_controller.target_time_s
 
-    def get_target_state(self, time_s, pose):
+    def get_target_state(self, time_s, pose, steer_pose=None):
         """
         Calculates the instantaneous target velocity and heading.
+        The speed plan follows the measured pose; pure pursuit steers from
+        steer_pose (the latency-compensated pose) when one is given.
         """
-        x, y, h, d_trav = pose
-        
+        d_trav = pose[3]
+        steer = pose if steer_pose is None else steer_pose
+        x = steer[0]
+        y = steer[1]
+
         # 1. Update Speed Plan
-        target_v = self.speed_controller.compute_target_velocity(time_s, d_trav)
+        # Follow the planned schedule, correcting for distance behind or ahead
+        # of it; without a usable plan the controller runs live.
+        plan = self.plan
+        if plan.complete and plan.reaches_target:
+            v_plan, d_plan = plan.at(time_s)
+            target_v = v_plan + config.PLAN_DISTANCE_GAIN_PER_S * (d_plan - d_trav)
+            if target_v < 0:
+                target_v = 0.0
+            elif target_v > config.MAX_SPEED_MM_S:
+                target_v = config.MAX_SPEED_MM_S
+        else:
+            target_v = self.speed_controller.compute_target_velocity(time_s, d_trav)
         
         # 2. Update Steering Plan (Pure Pursuit)
-        target_x, target_y = self.path.get_lookahead_point(pose)
+        # Progress along the path comes from projecting the pose onto it, so a
+        # lateral disturbance does not shift the lookahead point along the path.
+        progress, cross_track, _ = self.path.project(x, y)
+        self.progress_mm = progress
+        self.cross_track_mm = cross_track
+        if cross_track < 0:
+            cross_track = -cross_track
+        if cross_track > self.max_cross_track_mm:
+            self.max_cross_track_mm = cross_track
+        target_x, target_y = self.path.get_lookahead_point(progress)
         
         dx = target_x - x
         dy = target_y - y
@@ -279,10 +506,15 @@ class RunStrategy:
              target_heading = math.degrees(math.atan2(dy, dx))
              
         # 3. Calculate Curvature Feedforward
-        target_kappa = self.path.get_curvature(x)
+        target_kappa = self.path.get_curvature(progress)
 
         return target_v, target_heading, target_kappa
 
+    def report_lines(self):
+        """Summary of path tracking for the run log."""
+        return ["Path: cross-track {:.1f} mm at end, {:.1f} mm max; reacquired {} times".format(
+            self.cross_track_mm, self.max_cross_track_mm, self.path.reacquire_count)]
+
     def is_finished(self, time_s, pose):
         """
         Determines if the run is complete based on distance traveled.
@@ -291,6 +523,34 @@ class RunStrategy:
         return d_trav >= self.path.total_length
 
 
+# Strategy built from the confirmed configuration ahead of the run
+_prepared = None
+
+
+def prepare_strategy(run_config):
+    """Builds the strategy for run_config ahead of the run; see plan_prepared()."""
+    global _prepared
+    _prepared = RunStrategy(run_config)
+    return _prepared
+
+
+def plan_prepared(budget_ms):
+    """Spends up to budget_ms planning the prepared strategy. Returns True when nothing is pending."""
+    if _prepared is None:
+        return True
+    return _prepared.plan.plan(budget_ms)
+
+
 def get_strategy(run_config):
-    """Factory function to create the correct strategy object."""
-    return RunStrategy(run_config)
+    """
+    Factory function to create the correct strategy object.
+    Reuses the prepared strategy when it was built for the same configuration
+    and finishes any planning that idle time did not cover.
+    """
+    global _prepared
+    strategy = _prepared
+    _prepared = None
+    if strategy is None or strategy.run_config != run_config:
+        strategy = RunStrategy(run_config)
+    strategy.plan.plan()
+    return strategy
@@ -0,0 +1,12 @@
+"""Runs the tests against the simulated pybricks in utils/sim."""
+
+import os
+import sys
+
+UTILS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils")
+if UTILS_DIR not in sys.path:
+    sys.path.insert(0, UTILS_DIR)
+
+from simulate_run import install_simulator  # noqa: E402
+
+install_simulator()
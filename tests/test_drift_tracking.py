@@ -0,0 +1,65 @@
+import math
+import random
+
+import pytest
+
+import config
+import log_utils
+from gyro_drift import DriftTracker
+from pybricks import _sim  # pyright: ignore[reportMissingImports]
+from pybricks.hubs import EV3Brick  # pyright: ignore[reportMissingImports]
+from vehicle import Car
+
+
+@pytest.fixture
+def car(tmp_path):
+    _sim.world.reset()
+    log_utils.set_log_file(str(tmp_path / "run_log.txt"))
+    return Car(auto_calibrate=False, ev3=EV3Brick())
+
+
+def feed(tracker, drift_dps, duration_s, period_s, noise_deg, seed):
+    """Feeds whole-degree gyro readings of a still vehicle drifting at drift_dps."""
+    rng = random.Random(seed)
+    for i in range(int(duration_s / period_s) + 1):
+        t = i * period_s
+        tracker.add(t, float(round(drift_dps * t + rng.gauss(0.0, noise_deg))))
+
+
+def test_half_width_is_infinite_until_fitted():
+    tracker = DriftTracker(20.0, 2.0)
+    assert math.isinf(tracker.half_width_dps(1.96))
+    tracker.add(0.0, 0.0)
+    tracker.add(0.05, 0.0)
+    assert math.isinf(tracker.half_width_dps(1.96))
+
+
+def test_half_width_narrows_with_idle_time():
+    short = DriftTracker(20.0, 2.0)
+    feed(short, 0.1, 5.0, 0.05, 0.3, 2)
+    long = DriftTracker(20.0, 2.0)
+    feed(long, 0.1, 30.0, 0.05, 0.3, 2)
+    assert long.half_width_dps(1.96) < short.half_width_dps(1.96)
+    assert abs(long.drift_dps() - 0.1) < long.half_width_dps(1.96)
+
+
+def test_short_noisy_idle_window_keeps_tight_calibration(car):
+    car.drift_rate_dps = 0.02
+    car.drift_half_width_dps = 0.01
+    feed(car.drift_tracker, 0.1, config.DRIFT_TRACK_MIN_SPAN_S + 0.5, 0.05, 0.3, 2)
+    assert car.drift_tracker.span_s() >= config.DRIFT_TRACK_MIN_SPAN_S
+    assert car.drift_tracker.half_width_dps(config.GYRO_CAL_CONFIDENCE_Z) > 0.01
+
+    assert not car.apply_tracked_drift()
+    assert car.drift_rate_dps == 0.02
+    assert car.drift_half_width_dps == 0.01
+
+
+def test_long_idle_window_replaces_loose_calibration(car):
+    car.drift_rate_dps = 0.0
+    car.drift_half_width_dps = 0.2
+    feed(car.drift_tracker, 0.1, 30.0, 0.05, 0.3, 3)
+
+    assert car.apply_tracked_drift()
+    assert car.drift_half_width_dps < 0.2
+    assert abs(car.drift_rate_dps - 0.1) < 0.05
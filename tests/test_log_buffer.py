@@ -0,0 +1,42 @@
+import log_utils
+
+
+def flushed_lines(tmp_path, write):
+    path = tmp_path / "run_log.txt"
+    log_utils.set_log_file(str(path))
+    log_utils.start_buffering(4096, 4)
+    write()
+    log_utils.stop_buffering()
+    return [line.split(" ", 1)[1] for line in path.read_text().splitlines()]
+
+
+def test_numeric_values_are_formatted_at_flush(tmp_path):
+    lines = flushed_lines(tmp_path, lambda: log_utils.log_values("v={:.1f}, n={:.0f}", 12.25, 3))
+    assert lines == ["v=12.2, n=3"]
+
+
+def test_string_value_is_kept_as_text(tmp_path):
+    def write():
+        log_utils.log_values("mode={}, d={:.1f}", "BONUS", 7000.0)
+        log_utils.log_values("event={}", None)
+        log_utils.log_values("d={:.1f}", 12.5)
+
+    lines = flushed_lines(tmp_path, write)
+    assert lines == ["mode=BONUS, d=7000.0", "event=None", "d=12.5"]
+
+
+def test_discarded_buffer_writes_nothing_and_restores_direct_logging(tmp_path):
+    path = tmp_path / "run_log.txt"
+    log_utils.set_log_file(str(path))
+    log_utils.start_buffering(1, 1)
+    log_utils.log("during")
+    log_utils.log("dropped")
+    log_utils.stop_buffering(discard=True)
+    assert not path.exists()
+    log_utils.log("after")
+    assert path.read_text().splitlines()[0].endswith(" after")
+
+
+def test_integer_values_stay_exact_and_format_as_ints(tmp_path):
+    lines = flushed_lines(tmp_path, lambda: log_utils.log_values("ms={:d}, deg={:.1f}", 2 ** 24 + 1, 16777217))
+    assert lines == ["ms=16777217, deg=16777217.0"]
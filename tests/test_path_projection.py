@@ -0,0 +1,27 @@
+import config
+import strategies
+
+
+def bonus_path():
+    return strategies.BonusPath({"mode": config.MODE_BONUS, "target_distance_m": 7.0, "target_time_s": 10.0,
+                                 "bonus_gap_m": 0.5})
+
+
+def test_jump_ahead_slides_the_window_without_reacquiring():
+    path = bonus_path()
+    path.project(0.0, 0.0)
+    x, y, _, _ = path.sample(800.0)
+    progress, cross_track, _ = path.project(x, y)
+    assert abs(progress - 800.0) < 1.0
+    assert abs(cross_track) < 1.0
+    assert path.reacquire_count == 0
+
+
+def test_point_far_off_the_path_searches_the_whole_table():
+    path = bonus_path()
+    path.project(0.0, 0.0)
+    x, y, _, _ = path.sample(3000.0)
+    progress, cross_track, _ = path.project(x, y - config.PATH_PROJECTION_LOST_MM - 200.0)
+    assert path.reacquire_count == 1
+    assert abs(progress - 3000.0) < 200.0
+    assert cross_track < -config.PATH_PROJECTION_LOST_MM
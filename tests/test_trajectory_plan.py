@@ -0,0 +1,24 @@
+import config
+import strategies
+from trajectory import TrajectoryPlan
+
+
+def straight_path():
+    return strategies.StraightPath({"mode": config.MODE_STRAIGHT, "target_distance_m": 7.0, "target_time_s": 10.0})
+
+
+def test_empty_plan_holds_still():
+    path = straight_path()
+    plan = TrajectoryPlan(path, strategies.SpeedController(path.total_length, 10.0), 10, 20.0)
+    assert plan.at(0.0) == (0.0, 0.0)
+    assert plan.at(5.0) == (0.0, 0.0)
+
+
+def test_plan_reaches_the_target_and_holds_the_final_entry():
+    path = straight_path()
+    plan = TrajectoryPlan(path, strategies.SpeedController(path.total_length, 10.0), 10, 20.0)
+    assert plan.plan()
+    assert plan.reaches_target
+    _, d_end = plan.at(plan.duration_s + 1.0)
+    assert d_end >= path.total_length
+    assert plan.at(-1.0) == plan.at(0.0)
@@ -0,0 +1,96 @@
+"""
+Nominal trajectory planning ahead of the run.
+The speed plan is stepped through once at the control period along the
+path, assuming perfect tracking, so the run loop only interpolates the
+schedule and applies feedback on top of it. Steering works from the
+projected pose (see strategies.Path.project), so only speed and distance
+are planned.
+"""
+
+from array import array
+from pybricks.tools import StopWatch  # pyright: ignore[reportMissingImports]
+
+# Columns of the planned schedule
+PLAN_FIELDS = ("ms", "v_mm_s", "dist_mm")
+
+
+class TrajectoryPlan:
+    """
+    Time-parameterized schedule of velocity and expected distance at every
+    control tick. Planning can be spread over several plan() calls so it
+    fits into idle UI time.
+    """
+    def __init__(self, path, speed_controller, period_ms, max_time_s):
+        self.path = path
+        self.speed_controller = speed_controller
+        self.period_ms = period_ms
+        self._period_s = period_ms / 1000.0
+        self.max_ticks = int(max_time_s * 1000.0 / period_ms) + 1
+        self.velocity = array("f", [0.0] * self.max_ticks)
+        self.distance = array("f", [0.0] * self.max_ticks)
+        self.count = 0
+        self.complete = False
+        self.reaches_target = False
+        self._dist_mm = 0.0
+
+    def plan(self, budget_ms=None):
+        """Extends the schedule, for at most budget_ms if given. Returns True once complete."""
+        if self.complete:
+            return True
+        timer = None
+        if budget_ms is not None:
+            timer = StopWatch()
+            timer.reset()
+        target_mm = self.path.total_length
+        controller = self.speed_controller
+        period_s = self._period_s
+        i = self.count
+        d = self._dist_mm
+        while i < self.max_ticks:
+            v = controller.compute_target_velocity(i * period_s, d)
+            self.velocity[i] = v
+            self.distance[i] = d
+            i += 1
+            if d >= target_mm:
+                self.reaches_target = True
+                break
+            d += v * period_s
+            if timer is not None and timer.time() >= budget_ms:
+                self.count = i
+                self._dist_mm = d
+                return False
+        self.count = i
+        self._dist_mm = d
+        self.complete = True
+        return True
+
+    @property
+    def duration_s(self):
+        return (self.count - 1) * self._period_s
+
+    def at(self, time_s):
+        """
+        Returns the planned (velocity, distance) at time_s; held at the final
+        entry afterwards and (0.0, 0.0) while nothing is planned yet.
+        """
+        last = self.count - 1
+        if last < 0:
+            return 0.0, 0.0
+        pos = time_s / self._period_s
+        if pos >= last:
+            return self.velocity[last], self.distance[last]
+        if pos < 0:
+            pos = 0.0
+        i = int(pos)
+        f = pos - i
+        v0 = self.velocity[i]
+        d0 = self.distance[i]
+        return v0 + (self.velocity[i + 1] - v0) * f, d0 + (self.distance[i + 1] - d0) * f
+
+    def save_csv(self, name="plan"):
+        """Writes the planned schedule for comparison with the run telemetry."""
+        with open(name + ".csv", "w") as f:
+            f.write(",".join(PLAN_FIELDS) + "\n")
+            for i in range(self.count):
+                f.write("{},{:.2f},{:.2f}\n".format(i * self.period_ms, self.velocity[i], self.distance[i]))
+        return self.count
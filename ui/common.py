@@ -1,7 +1,6 @@
 """Shared UI helpers for EV3 brick screens."""
 
 from pybricks.parameters import Color, Button  # pyright: ignore[reportMissingImports]
-from pybricks.media.ev3dev import Font  # pyright: ignore[reportMissingImports]
 from pybricks.tools import wait  # pyright: ignore[reportMissingImports]
 
 SCREEN_WIDTH = 178
@@ -11,10 +10,23 @@ INDICATOR_SIZE = 6
 INDICATOR_MARGIN = 10
 INDICATOR_THICKNESS = 2
 
-TITLE_FONT = Font(size=16)
-VALUE_FONT = Font(size=18)
-DEFAULT_FONT = Font(size=14)
-HINT_FONT = Font(size=10)
+TITLE_FONT_SIZE = 16
+VALUE_FONT_SIZE = 18
+DEFAULT_FONT_SIZE = 14
+HINT_FONT_SIZE = 10
+
+# Fonts are created on first use and shared by size; building them at import
+# time slowed startup before anything was on screen.
+_fonts = {}
+
+
+def get_font(size):
+    font = _fonts.get(size)
+    if font is None:
+        from pybricks.media.ev3dev import Font  # pyright: ignore[reportMissingImports]
+        font = Font(size=size)
+        _fonts[size] = font
+    return font
 
 
 def _wrap_line(line, width):
@@ -126,6 +138,84 @@ def draw_play_shape(screen, x, y, radius, completed):
         _draw_hline_thick(screen, start_x, end_x, y + dy, 1)
 
 
+def draw_shape(screen, shape, x, y, filled):
+    if shape == "circle":
+        draw_circle_shape(screen, x, y, INDICATOR_SIZE, filled)
+    elif shape == "square":
+        draw_square_shape(screen, x, y, INDICATOR_SIZE * 2, filled)
+    elif shape == "triangle":
+        draw_triangle_shape(screen, x, y, INDICATOR_SIZE * 2, filled)
+    elif shape == "play":
+        draw_play_shape(screen, x, y, INDICATOR_SIZE, filled)
+
+
+# Sprites are rasterized once into off-screen images; redraws only blit them.
+# A node sprite is centered on its (x, y); line sprites start at their left end.
+NODE_SPRITE_SIZE = 2 * INDICATOR_SIZE + 1
+_sprites = {}
+
+
+def _new_image(width, height):
+    from pybricks.media.ev3dev import Image  # pyright: ignore[reportMissingImports]
+    return Image.empty(width, height)
+
+
+def node_sprite(shape, filled):
+    key = ("node", shape, filled)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        sprite = _new_image(NODE_SPRITE_SIZE, NODE_SPRITE_SIZE)
+        draw_shape(sprite, shape, INDICATOR_SIZE, INDICATOR_SIZE, filled)
+        _sprites[key] = sprite
+    return sprite
+
+
+def hline_sprite(length, thickness):
+    key = ("hline", length, thickness)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        half = thickness // 2
+        sprite = _new_image(max(1, length + 1), 2 * half + 1)
+        _draw_hline_thick(sprite, 0, length, half, thickness)
+        _sprites[key] = sprite
+    return sprite
+
+
+def draw_hline_sprite(screen, x1, x2, y, thickness):
+    if x2 < x1:
+        return
+    screen.draw_image(x1, y - thickness // 2, hline_sprite(x2 - x1, thickness))
+
+
+def draw_progress_bar(screen, x, y, w, h, fraction):
+    """Bordered bar spanning x..x+w and y..y+h-1, filled left to right."""
+    fraction = max(0.0, min(1.0, fraction))
+    key = ("bar", w, h)
+    sprites = _sprites.get(key)
+    if sprites is None:
+        frame = _new_image(w + 1, h)
+        frame.draw_line(0, 0, w, 0)
+        frame.draw_line(0, h - 1, w, h - 1)
+        frame.draw_line(0, 0, 0, h - 1)
+        frame.draw_line(w, 0, w, h - 1)
+        fill = _new_image(w - 1, h - 2)
+        for dy in range(h - 2):
+            fill.draw_line(0, dy, w - 2, dy)
+        # Partial fills are views into the full fill, cached by width.
+        sprites = (frame, fill, {})
+        _sprites[key] = sprites
+    frame, fill, parts = sprites
+    screen.draw_image(x, y, frame)
+    fill_w = int((w - 1) * fraction)
+    if fill_w > 0:
+        part = parts.get(fill_w)
+        if part is None:
+            from pybricks.media.ev3dev import Image  # pyright: ignore[reportMissingImports]
+            part = Image(fill, sub=True, x1=0, y1=0, x2=fill_w - 1, y2=h - 3)
+            parts[fill_w] = part
+        screen.draw_image(x + 1, y + 1, part)
+
+
 def draw_indicator_bar(ev3, steps, current_index, completed_map):
     screen = ev3.screen
     count = len(steps)
@@ -134,47 +224,38 @@ def draw_indicator_bar(ev3, steps, current_index, completed_map):
 
     usable = SCREEN_WIDTH - 2 * INDICATOR_MARGIN
     spacing = usable // (count - 1 if count > 1 else 1)
-    positions = [INDICATOR_MARGIN + spacing * i for i in range(count)]
 
     # Connectors
     for i in range(count - 1):
-        start_x = positions[i] + INDICATOR_SIZE + 1
-        end_x = positions[i + 1] - INDICATOR_SIZE - 1
-        _draw_hline_thick(screen, start_x, end_x, INDICATOR_Y, INDICATOR_THICKNESS)
+        start_x = INDICATOR_MARGIN + spacing * i + INDICATOR_SIZE + 1
+        draw_hline_sprite(screen, start_x, start_x + spacing - 2 * (INDICATOR_SIZE + 1), INDICATOR_Y, INDICATOR_THICKNESS)
 
     # Nodes
+    node_y = INDICATOR_Y - INDICATOR_SIZE
     for i, step in enumerate(steps):
-        x = positions[i]
+        x = INDICATOR_MARGIN + spacing * i
         filled = completed_map.get(step["key"], False)
-        shape = step["shape"]
-        if shape == "circle":
-            draw_circle_shape(screen, x, INDICATOR_Y, INDICATOR_SIZE, filled)
-        elif shape == "square":
-            draw_square_shape(screen, x, INDICATOR_Y, INDICATOR_SIZE * 2, filled)
-        elif shape == "triangle":
-            draw_triangle_shape(screen, x, INDICATOR_Y, INDICATOR_SIZE * 2, filled)
-        elif shape == "play":
-            draw_play_shape(screen, x, INDICATOR_Y, INDICATOR_SIZE, filled)
+        screen.draw_image(x - INDICATOR_SIZE, node_y, node_sprite(step["shape"], filled))
 
         # Highlight current step with a thicker underline mark, slightly lower for breathing room.
         if i == current_index:
-            _draw_hline_thick(screen, x - INDICATOR_SIZE, x + INDICATOR_SIZE, INDICATOR_Y + INDICATOR_SIZE + 5, INDICATOR_THICKNESS + 1)
+            draw_hline_sprite(screen, x - INDICATOR_SIZE, x + INDICATOR_SIZE, INDICATOR_Y + INDICATOR_SIZE + 5, INDICATOR_THICKNESS + 1)
 
 
 def render_value_page(ev3, title, value_text, hint_lines, steps, current_index, completed_map):
     screen = ev3.screen
     screen.clear()
-    screen.set_font(TITLE_FONT)
+    screen.set_font(get_font(TITLE_FONT_SIZE))
     screen.draw_text(6, 4, title)
-    screen.set_font(VALUE_FONT)
+    screen.set_font(get_font(VALUE_FONT_SIZE))
     screen.draw_text(6, 26, value_text)
 
-    screen.set_font(HINT_FONT)
+    screen.set_font(get_font(HINT_FONT_SIZE))
     y = 54
     for line in hint_lines:
         screen.draw_text(6, y, line)
         y += 12
-    screen.set_font(DEFAULT_FONT)
+    screen.set_font(get_font(DEFAULT_FONT_SIZE))
 
     draw_indicator_bar(ev3, steps, current_index, completed_map)
 
@@ -195,9 +276,9 @@ def show_warning(ev3, title, lines):
     """Display a blocking warning dialog and wait for center press."""
     screen = ev3.screen
     screen.clear()
-    screen.set_font(TITLE_FONT)
+    screen.set_font(get_font(TITLE_FONT_SIZE))
     screen.draw_text(6, 4, title)
-    screen.set_font(DEFAULT_FONT)
+    screen.set_font(get_font(DEFAULT_FONT_SIZE))
 
     wrapped = wrap_text_lines(lines, width=24)
     y = 26
@@ -205,7 +286,7 @@ def show_warning(ev3, title, lines):
         screen.draw_text(6, y, line)
         y += 14
 
-    screen.set_font(HINT_FONT)
+    screen.set_font(get_font(HINT_FONT_SIZE))
     screen.draw_text(6, SCREEN_HEIGHT - 14, "Center to continue")
 
     while True:
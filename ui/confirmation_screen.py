@@ -1,6 +1,9 @@
 """Final confirmation screen for run settings."""
 
-from .common import TITLE_FONT, DEFAULT_FONT, HINT_FONT, SCREEN_HEIGHT, draw_indicator_bar
+import config
+from .common import TITLE_FONT_SIZE, DEFAULT_FONT_SIZE, HINT_FONT_SIZE, SCREEN_HEIGHT, draw_indicator_bar, get_font
+
+CONFIRM_ROW_SPACING = 13
 
 
 class ConfirmationScreen:
@@ -11,7 +14,7 @@ class ConfirmationScreen:
         screen = ev3.screen
         screen.clear()
 
-        screen.set_font(TITLE_FONT)
+        screen.set_font(get_font(TITLE_FONT_SIZE))
         screen.draw_text(6, 6, "Confirm Run Profile:")
 
         rows = [
@@ -19,16 +22,17 @@ class ConfirmationScreen:
             ("Distance", "{:.2f} m".format(state.get("target_distance_m", 0.0))),
             ("Time", "{:.2f} s".format(state.get("target_time_s", 0.0))),
             ("Bonus Gap", "{:.2f} m".format(state.get("bonus_gap_m", 0.0))),
+            ("Planner", "{}".format(state.get("speed_planner", config.SPEED_PLANNER))),
         ]
 
         y = 22
         for label, value in rows:
-            screen.set_font(DEFAULT_FONT)
+            screen.set_font(get_font(DEFAULT_FONT_SIZE))
             screen.draw_text(6, y, label + ":")
             screen.draw_text(96, y, value)
-            y += 16
+            y += CONFIRM_ROW_SPACING
 
-        screen.set_font(HINT_FONT)
+        screen.set_font(get_font(HINT_FONT_SIZE))
         screen.draw_text(6, SCREEN_HEIGHT - 40, "Center: confirm run profile")
 
         draw_indicator_bar(ev3, steps, current_index, state.get("completed", {}))
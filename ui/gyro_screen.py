@@ -2,7 +2,7 @@
 
 import config
 import log_utils
-from .common import render_value_page, mark_complete, TITLE_FONT, DEFAULT_FONT
+from .common import render_value_page, mark_complete, draw_progress_bar, get_font, TITLE_FONT_SIZE, DEFAULT_FONT_SIZE
 
 
 class GyroScreen:
@@ -48,20 +48,12 @@ class GyroScreen:
         frac = max(0.0, min(1.0, fraction))
         screen = self.ev3.screen
         screen.clear()
-        screen.set_font(TITLE_FONT)
+        screen.set_font(get_font(TITLE_FONT_SIZE))
         screen.draw_text(6, 4, "Gyro Calibration")
-        screen.set_font(DEFAULT_FONT)
+        screen.set_font(get_font(DEFAULT_FONT_SIZE))
         screen.draw_text(6, 24, "Keep vehicle still")
 
-        x, y, w, h = 6, 60, 166, 14
-        screen.draw_line(x, y, x + w, y)
-        screen.draw_line(x, y + h - 1, x + w, y + h - 1)
-        screen.draw_line(x, y, x, y + h - 1)
-        screen.draw_line(x + w, y, x + w, y + h - 1)
-        fill_w = int((w - 2) * frac)
-        for dy in range(1, h - 1):
-            if fill_w > 0:
-                screen.draw_line(x + 1, y + dy, x + 1 + fill_w, y + dy)
+        draw_progress_bar(screen, 6, 60, 166, 14, frac)
 
         percent = int((frac * 100) // 5 * 5)
         screen.draw_text(6, 84, "{}%".format(percent))
@@ -0,0 +1,47 @@
+"""Speed planner selection screen."""
+
+import config
+from .common import render_value_page, mark_complete, mark_incomplete, is_complete
+
+PLANNER_LABELS = {
+    config.SPEED_PLANNER_RATE_LIMIT: "Rate limit",
+    config.SPEED_PLANNER_SCURVE: "S-curve",
+}
+
+
+class PlannerScreen:
+    key = "speed_planner"
+    shape = "circle"
+
+    def render(self, ev3, state, steps, current_index):
+        value = state.get("speed_planner", config.SPEED_PLANNER)
+        if is_complete(state, self.key):
+            hints = ["Center: unlock to edit"]
+        else:
+            hints = ["Up/Down: switch planner", "Center: mark complete"]
+        render_value_page(ev3, "Speed Planner", PLANNER_LABELS.get(value, value), hints, steps, current_index,
+                          state.get("completed", {}))
+
+    def on_up(self, state, step=None):
+        if is_complete(state, self.key):
+            return
+        self._toggle(state)
+
+    def on_down(self, state, step=None):
+        if is_complete(state, self.key):
+            return
+        self._toggle(state)
+
+    def on_center(self, state):
+        if is_complete(state, self.key):
+            mark_incomplete(state, self.key)
+        else:
+            mark_complete(state, self.key)
+        return None
+
+    def _toggle(self, state):
+        current = state.get("speed_planner", config.SPEED_PLANNER)
+        if current == config.SPEED_PLANNER_SCURVE:
+            state["speed_planner"] = config.SPEED_PLANNER_RATE_LIMIT
+        else:
+            state["speed_planner"] = config.SPEED_PLANNER_SCURVE
@@ -1,12 +1,12 @@
 """Ready-to-run screen displayed after confirming settings."""
 
-from pybricks.media.ev3dev import Font  # pyright: ignore[reportMissingImports]
 from pybricks.parameters import Color  # pyright: ignore[reportMissingImports]
 from pybricks.tools import StopWatch  # pyright: ignore[reportMissingImports]
 
-from .common import HINT_FONT, SCREEN_HEIGHT, SCREEN_WIDTH
+from .common import HINT_FONT_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH, get_font
 
-READY_FONT = Font(size=20)
+READY_FONT_SIZE = 20
+READY_BLINK_MS = 300
 
 
 class ReadyScreen:
@@ -17,33 +17,48 @@ class ReadyScreen:
     def __init__(self, car=None):
         self._blink = StopWatch()
         self._blink.reset()
+        self._blink_phase = None
         self._ev3 = None
         self._car = car
 
     def on_enter(self, ev3, state):
+        self._blink_phase = None
         if self._car is not None:
             self._car.stop(brake=True)
+            self._car.start_drift_tracking()
+
+    def tick(self, ev3, state):
+        """Runs every UI iteration; only the status light changes, so no redraw is requested."""
+        self._ev3 = ev3
+        if self._car is not None:
+            # The vehicle sits still here; keep the drift estimate current.
+            self._car.track_drift()
+        phase = (self._blink.time() // READY_BLINK_MS) % 2
+        if phase != self._blink_phase:
+            self._blink_phase = phase
+            if phase == 0:
+                ev3.light.on(Color.GREEN)
+            else:
+                ev3.light.off()
+        return False
 
     def render(self, ev3, state, steps, current_index):
         self._ev3 = ev3
         screen = ev3.screen
         screen.clear()
-        screen.set_font(READY_FONT)
+        title_font = get_font(READY_FONT_SIZE)
+        screen.set_font(title_font)
         title = "READY TO RUN"
-        title_width = READY_FONT.text_width(title)
+        title_width = title_font.text_width(title)
         title_x = max(0, (SCREEN_WIDTH - title_width) // 2)
         title_y = 22
         screen.draw_text(title_x, title_y, title)
         screen.draw_text(title_x + 1, title_y, title)
 
-        if (self._blink.time() // 300) % 2 == 0:
-            ev3.light.on(Color.GREEN)
-        else:
-            ev3.light.off()
-
-        screen.set_font(HINT_FONT)
+        hint_font = get_font(HINT_FONT_SIZE)
+        screen.set_font(hint_font)
         hint = "Center: begin run"
-        hint_width = HINT_FONT.text_width(hint)
+        hint_width = hint_font.text_width(hint)
         hint_x = max(0, (SCREEN_WIDTH - hint_width) // 2)
         screen.draw_text(hint_x, SCREEN_HEIGHT - 32, hint)
 
@@ -1,34 +1,123 @@
 """Run-time status screens for progress."""
 
-from pybricks.media.ev3dev import Font  # pyright: ignore[reportMissingImports]
-from .common import SCREEN_WIDTH, SCREEN_HEIGHT
-
-TITLE_FONT = Font(size=16)
-VALUE_FONT = Font(size=14)
-
-
-def _draw_bar(screen, x, y, w, h, fraction):
-    fraction = max(0.0, min(1.0, fraction))
-    fill_w = int(w * fraction)
-    # Border
-    screen.draw_line(x, y, x + w, y)
-    screen.draw_line(x, y + h - 1, x + w, y + h - 1)
-    screen.draw_line(x, y, x, y + h - 1)
-    screen.draw_line(x + w, y, x + w, y + h - 1)
-    # Fill
-    for dy in range(1, h - 1):
-        if fill_w > 0:
-            screen.draw_line(x + 1, y + dy, x + fill_w, y + dy)
-
-
-def show_progress(ev3, mode, progress_fraction, time_s):
-    screen = ev3.screen
-    screen.clear()
-    screen.set_font(TITLE_FONT)
-    screen.draw_text(6, 4, "Run Progress")
-    screen.set_font(VALUE_FONT)
-    screen.draw_text(6, 24, "Mode: {}".format(mode))
-    screen.draw_text(6, 40, "Time: {:.2f}s".format(time_s))
-    _draw_bar(screen, 6, 64, SCREEN_WIDTH - 12, 12, progress_fraction)
-    percent = int((max(0.0, min(1.0, progress_fraction)) * 100) // 5 * 5)
-    screen.draw_text(6, 84, "{}%".format(percent))
\ No newline at end of file
+from pybricks.parameters import Color  # pyright: ignore[reportMissingImports]
+from pybricks.tools import StopWatch  # pyright: ignore[reportMissingImports]
+
+from .common import SCREEN_WIDTH, draw_progress_bar, get_font
+
+TITLE_FONT_SIZE = 16
+VALUE_FONT_SIZE = 14
+
+TEXT_X = 6
+TIME_Y = 40
+BAR_X = 6
+BAR_Y = 64
+BAR_W = SCREEN_WIDTH - 12
+BAR_H = 12
+PERCENT_Y = 84
+
+# Update items, in the order they are first tried
+ITEM_BAR = 0
+ITEM_TIME = 1
+ITEM_PERCENT = 2
+ITEM_COUNT = 3
+
+
+def _percent(fraction):
+    return int((fraction * 100) // 5 * 5)
+
+
+class ProgressDisplay:
+    """
+    Run progress screen that is drawn in full once by start() and then
+    updated in place: update() touches only the bar columns that changed
+    and the time and percent text fields. Each call stops starting new items
+    once budget_ms is used up; skipped items are tried first next call,
+    since each item compares against what is actually on screen.
+    """
+
+    def __init__(self, ev3, mode, budget_ms, timer=None):
+        self.ev3 = ev3
+        self.mode = mode
+        self.budget_ms = budget_ms
+        self.timer = timer if timer is not None else StopWatch()
+        self.deferred = 0
+        self._next_item = ITEM_BAR
+        self._fill_w = 0
+        self._time_text = None
+        self._time_w = 0
+        self._percent_text = None
+        self._percent_w = 0
+        self._time_x = TEXT_X
+
+    def start(self):
+        """Draws the static page with an empty bar."""
+        screen = self.ev3.screen
+        screen.clear()
+        screen.set_font(get_font(TITLE_FONT_SIZE))
+        screen.draw_text(TEXT_X, 4, "Run Progress")
+        value_font = get_font(VALUE_FONT_SIZE)
+        screen.set_font(value_font)
+        screen.draw_text(TEXT_X, 24, "Mode: {}".format(self.mode))
+        label = "Time: "
+        screen.draw_text(TEXT_X, TIME_Y, label)
+        self._time_x = TEXT_X + value_font.text_width(label)
+        draw_progress_bar(screen, BAR_X, BAR_Y, BAR_W, BAR_H, 0.0)
+        self._fill_w = 0
+        self._time_text = None
+        self._time_w = 0
+        self._percent_text = None
+        self._percent_w = 0
+        self._next_item = ITEM_BAR
+
+    def update(self, progress_fraction, time_s):
+        fraction = max(0.0, min(1.0, progress_fraction))
+        start_ms = self.timer.time()
+        item = self._next_item
+        for done in range(ITEM_COUNT):
+            if done > 0 and self.timer.time() - start_ms >= self.budget_ms:
+                self._next_item = item
+                self.deferred += 1
+                return
+            if item == ITEM_BAR:
+                self._update_bar(fraction)
+            elif item == ITEM_TIME:
+                self._update_time(time_s)
+            else:
+                self._update_percent(fraction)
+            item = (item + 1) % ITEM_COUNT
+        self._next_item = ITEM_BAR
+
+    def _update_bar(self, fraction):
+        fill_w = int((BAR_W - 1) * fraction)
+        drawn = self._fill_w
+        if fill_w == drawn:
+            return
+        x0 = BAR_X + 1
+        if fill_w > drawn:
+            self.ev3.screen.draw_box(x0 + drawn, BAR_Y + 1, x0 + fill_w - 1, BAR_Y + BAR_H - 2, fill=True, color=Color.BLACK)
+        else:
+            self.ev3.screen.draw_box(x0 + fill_w, BAR_Y + 1, x0 + drawn - 1, BAR_Y + BAR_H - 2, fill=True, color=Color.WHITE)
+        self._fill_w = fill_w
+
+    def _draw_field(self, x, y, text, old_w):
+        """Replaces a text field, blanking what the previous text covered; returns the new width."""
+        screen = self.ev3.screen
+        font = get_font(VALUE_FONT_SIZE)
+        screen.set_font(font)
+        if old_w > 0:
+            screen.draw_box(x, y, x + old_w - 1, y + font.height - 1, fill=True, color=Color.WHITE)
+        screen.draw_text(x, y, text)
+        return font.text_width(text)
+
+    def _update_time(self, time_s):
+        text = "{:.2f}s".format(time_s)
+        if text != self._time_text:
+            self._time_w = self._draw_field(self._time_x, TIME_Y, text, self._time_w)
+            self._time_text = text
+
+    def _update_percent(self, fraction):
+        text = "{}%".format(_percent(fraction))
+        if text != self._percent_text:
+            self._percent_w = self._draw_field(TEXT_X, PERCENT_Y, text, self._percent_w)
+            self._percent_text = text
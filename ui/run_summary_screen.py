@@ -1,16 +1,16 @@
 """Post-run summary UI."""
 
-from .common import TITLE_FONT, DEFAULT_FONT, HINT_FONT, SCREEN_HEIGHT
+from .common import TITLE_FONT_SIZE, DEFAULT_FONT_SIZE, HINT_FONT_SIZE, SCREEN_HEIGHT, get_font
 
 
 def show_summary(ev3, mode, distance_m, time_s, target_time_s, distance_error_m=None):
     """Render the post-run summary screen."""
     screen = ev3.screen
     screen.clear()
-    screen.set_font(TITLE_FONT)
+    screen.set_font(get_font(TITLE_FONT_SIZE))
     screen.draw_text(6, 4, "Run Summary")
 
-    screen.set_font(DEFAULT_FONT)
+    screen.set_font(get_font(DEFAULT_FONT_SIZE))
     screen.draw_text(6, 24, "Mode: {}".format(mode))
     screen.draw_text(6, 40, "Dist: {:.2f} m".format(distance_m))
     if distance_error_m is not None:
@@ -21,5 +21,5 @@ def show_summary(ev3, mode, distance_m, time_s, target_time_s, distance_error_m=
         err = time_s - target_time_s
         screen.draw_text(6, 88, "Time err: {:+.2f} s".format(err))
 
-    screen.set_font(HINT_FONT)
+    screen.set_font(get_font(HINT_FONT_SIZE))
     screen.draw_text(6, SCREEN_HEIGHT - 16, "Center to dismiss")
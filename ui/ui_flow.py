@@ -7,13 +7,6 @@ import config
 import user_input
 import log_utils
 
-from .mode_screen import ModeScreen
-from .distance_screen import DistanceScreen
-from .time_screen import TimeScreen
-from .bonus_screen import BonusScreen
-from .gyro_screen import GyroScreen
-from .confirmation_screen import ConfirmationScreen
-from .ready_screen import ReadyScreen
 from .common import mark_complete, show_warning
 
 
@@ -28,11 +21,22 @@ def collect_run_config(ev3, car, initial_config, runtime_input=True):
     Screens use Up/Down for value changes and Left/Right to navigate.
     """
     def build_screens(current_mode):
+        # Screen modules are imported on first use, so startup only loads
+        # the screens this flow can actually show.
+        from .gyro_screen import GyroScreen
+        from .confirmation_screen import ConfirmationScreen
+        from .ready_screen import ReadyScreen
         screens = []
         if runtime_input:
+            from .mode_screen import ModeScreen
+            from .distance_screen import DistanceScreen
+            from .time_screen import TimeScreen
             screens.extend([ModeScreen(), DistanceScreen(), TimeScreen()])
             if current_mode == config.MODE_BONUS:
+                from .bonus_screen import BonusScreen
                 screens.append(BonusScreen())
+            from .planner_screen import PlannerScreen
+            screens.append(PlannerScreen())
         screens.append(GyroScreen(car))
         screens.append(ConfirmationScreen())
         screens.append(ReadyScreen(car))
@@ -53,6 +57,7 @@ def collect_run_config(ev3, car, initial_config, runtime_input=True):
         "target_distance_m": "Target Distance",
         "target_time_s": "Target Time",
         "bonus_gap_m": "Bonus Gap",
+        "speed_planner": "Speed Planner",
         "gyro_calibration": "Gyro Calibration",
         "confirm_run": "Confirm Run",
     }
@@ -63,6 +68,7 @@ def collect_run_config(ev3, car, initial_config, runtime_input=True):
             "target_distance_m": state.get("target_distance_m"),
             "target_time_s": state.get("target_time_s"),
             "bonus_gap_m": state.get("bonus_gap_m", 0.0),
+            "speed_planner": state.get("speed_planner", config.SPEED_PLANNER),
         }
 
     def first_incomplete_index(screens, state):
@@ -79,6 +85,50 @@ def collect_run_config(ev3, car, initial_config, runtime_input=True):
                 return i
         return len(screens) - 1
 
+    def step_sizes_for_screen(scr):
+        if scr.key == "target_distance_m":
+            return state.get("distance_step", 0.1)
+        if scr.key == "target_time_s":
+            return state.get("time_step", 0.1)
+        if scr.key == "bonus_gap_m":
+            return state.get("bonus_step", 0.05)
+        return 1.0
+
+    def accel_factor(scr_key, held_ms):
+        if held_ms < hold_accel_ms:
+            return 1.0
+        if scr_key == "target_time_s":
+            return 5.0
+        if scr_key == "target_distance_m":
+            lvl = user_input.EVENT_LEVEL.upper()
+            if lvl in ("STATE", "NATIONAL"):
+                return 5.0
+            return 4.0
+        if scr_key == "bonus_gap_m":
+            return 2.0
+        return 1.0
+
+    def handle_step(button, scr, pressed, now, up_fn):
+        """Applies a (repeating) step for a held button; returns True if a step was applied."""
+        stepped = False
+        if button in pressed:
+            if not prev_pressed[button]:
+                press_start[button] = now
+                last_repeat[button] = 0
+            held_ms = now - press_start[button]
+            factor = accel_factor(scr.key, held_ms)
+            if last_repeat[button] == 0 or now - last_repeat[button] >= repeat_ms:
+                step = step_sizes_for_screen(scr) * factor
+                up_fn(step)
+                last_repeat[button] = now
+                stepped = True
+            prev_pressed[button] = True
+        else:
+            prev_pressed[button] = False
+            press_start[button] = 0
+            last_repeat[button] = 0
+        return stepped
+
     index = 0
     last_screen_key = None
     timer = StopWatch(); timer.reset()
@@ -89,13 +139,25 @@ def collect_run_config(ev3, car, initial_config, runtime_input=True):
     repeat_ms = 180
     hold_accel_ms = 3000
 
+    # Screens are rebuilt only when the mode changes the page list, and a
+    # page is redrawn only when it is marked dirty: on entry, after input
+    # that may have changed it, after a warning covered it, or when the
+    # screen's tick() asks for it.
+    screens = None
+    screens_mode = None
+    dirty = True
+
     while True:
-        screens = build_screens(state.get("mode", config.MODE_STRAIGHT))
-        nav_screens = [s for s in screens if getattr(s, "show_in_nav", True)]
-        steps = [{"key": s.key, "shape": s.shape} for s in nav_screens]
-        state.setdefault("completed", {})
-        for s in screens:
-            state["completed"].setdefault(s.key, False)
+        mode = state.get("mode", config.MODE_STRAIGHT)
+        if screens is None or mode != screens_mode:
+            screens = build_screens(mode)
+            screens_mode = mode
+            nav_screens = [s for s in screens if getattr(s, "show_in_nav", True)]
+            steps = [{"key": s.key, "shape": s.shape} for s in nav_screens]
+            state.setdefault("completed", {})
+            for s in screens:
+                state["completed"].setdefault(s.key, False)
+            dirty = True
 
         if index >= len(screens):
             index = len(screens) - 1
@@ -106,12 +168,21 @@ def collect_run_config(ev3, car, initial_config, runtime_input=True):
             if hasattr(current_screen, "on_enter"):
                 current_screen.on_enter(ev3, state)
             last_screen_key = current_screen_key
-        if current_screen in nav_screens:
-            nav_index = nav_screens.index(current_screen)
-        else:
-            nav_index = len(nav_screens) - 1 if nav_screens else 0
+            dirty = True
+        if hasattr(current_screen, "tick") and current_screen.tick(ev3, state):
+            dirty = True
 
-        current_screen.render(ev3, state, steps, nav_index)
+        if dirty:
+            if current_screen in nav_screens:
+                nav_index = nav_screens.index(current_screen)
+            else:
+                nav_index = len(nav_screens) - 1 if nav_screens else 0
+            current_screen.render(ev3, state, steps, nav_index)
+            dirty = False
+        if current_screen_key == "ready_run":
+            # Idle time on the ready screen goes to planning the confirmed run.
+            from strategies import plan_prepared
+            plan_prepared(config.PLAN_IDLE_BUDGET_MS)
         wait(debounce_ms)
         pressed = ev3.buttons.pressed()
         now = timer.time()
@@ -125,54 +196,16 @@ def collect_run_config(ev3, car, initial_config, runtime_input=True):
             _debounce_buttons(ev3)
             continue
 
-        def step_sizes_for_screen(scr):
-            if scr.key == "target_distance_m":
-                return state.get("distance_step", 0.1)
-            if scr.key == "target_time_s":
-                return state.get("time_step", 0.1)
-            if scr.key == "bonus_gap_m":
-                return state.get("bonus_step", 0.05)
-            return 1.0
-
-        def accel_factor(scr_key, held_ms):
-            if held_ms < hold_accel_ms:
-                return 1.0
-            if scr_key == "target_time_s":
-                return 5.0
-            if scr_key == "target_distance_m":
-                lvl = user_input.EVENT_LEVEL.upper()
-                if lvl in ("STATE", "NATIONAL"):
-                    return 5.0
-                return 4.0
-            if scr_key == "bonus_gap_m":
-                return 2.0
-            return 1.0
-
-        def handle_step(button, scr, up_fn):
-            base = step_sizes_for_screen(scr)
-            if button in pressed:
-                if not prev_pressed[button]:
-                    press_start[button] = now
-                    last_repeat[button] = 0
-                held_ms = now - press_start[button]
-                factor = accel_factor(scr.key, held_ms)
-                if last_repeat[button] == 0 or now - last_repeat[button] >= repeat_ms:
-                    step = base * factor
-                    up_fn(step)
-                    last_repeat[button] = now
-                prev_pressed[button] = True
-            else:
-                prev_pressed[button] = False
-                press_start[button] = 0
-                last_repeat[button] = 0
-
-        handle_step(Button.UP, current_screen, lambda step: current_screen.on_up(state, step))
-        handle_step(Button.DOWN, current_screen, lambda step: current_screen.on_down(state, step))
+        if handle_step(Button.UP, current_screen, pressed, now, lambda step: current_screen.on_up(state, step)):
+            dirty = True
+        if handle_step(Button.DOWN, current_screen, pressed, now, lambda step: current_screen.on_down(state, step)):
+            dirty = True
 
         # Center press is immediate action; no extra confirmation needed.
         if Button.CENTER in pressed:
             action = screens[index].on_center(state)
             _debounce_buttons(ev3)
+            dirty = True
             if action == "confirm":
                 missing = [
                     scr.key
@@ -209,13 +242,27 @@ def collect_run_config(ev3, car, initial_config, runtime_input=True):
                 if warnings:
                     show_warning(ev3, "Config Warning", warnings)
 
+                from strategies import prepare_strategy
+                try:
+                    prepare_strategy(run_config)
+                except ValueError as e:
+                    # The speed planner rejects targets it cannot meet within the limits.
+                    log_utils.log("Run rejected: {}".format(e))
+                    show_warning(ev3, "Fix Config", [str(e)])
+                    if not runtime_input:
+                        raise RuntimeError("Infeasible run: {}".format(e))
+                    state["completed"]["target_time_s"] = False
+                    index = first_incomplete_index(screens, state)
+                    continue
+
                 mark_complete(state, screens[index].key)
                 log_utils.log(
-                    "Run confirmed: mode={}, dist={:.2f}m, time={:.2f}s, gap={:.2f}m".format(
+                    "Run confirmed: mode={}, dist={:.2f}m, time={:.2f}s, gap={:.2f}m, planner={}".format(
                         run_config.get("mode"),
                         run_config.get("target_distance_m", 0.0),
                         run_config.get("target_time_s", 0.0),
                         run_config.get("bonus_gap_m", 0.0),
+                        run_config.get("speed_planner"),
                     )
                 )
                 index = ready_index(screens)
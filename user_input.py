@@ -20,6 +20,8 @@ STATIC_RUN_CONFIG = {
     "target_time_s": 10,
     # Distance between outer can inside edge (at 1.0 m) and inside can outside edge (0.0-1.0 m range)
     "bonus_gap_m": 1.0,
+    # config.SPEED_PLANNER_RATE_LIMIT or config.SPEED_PLANNER_SCURVE
+    "speed_planner": config.SPEED_PLANNER,
 }
 
 
@@ -0,0 +1,109 @@
+"""
+Benchmark of the odometry update.
+Drives a synthetic constant-curvature arc at 1 m/s with jittery tick
+intervals, quantizing encoder and gyro readings to whole degrees as on the
+EV3. Compares the previous Euler update (average wheel delta along the gyro
+heading) with odometry.Odometry for end-point error and per-tick cost.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+if UTILS_DIR not in sys.path:
+    sys.path.insert(0, UTILS_DIR)
+
+from simulate_run import install_simulator  # noqa: E402
+
+install_simulator()
+
+import config  # noqa: E402
+from odometry import Odometry  # noqa: E402
+
+
+class EulerOdometry:
+    """The Car.update_sensors integration before odometry.Odometry."""
+
+    def __init__(self, mm_per_degree):
+        self.mm_per_degree = mm_per_degree
+        self.x_mm = 0.0
+        self.y_mm = 0.0
+        self.last_odo_dist = 0.0
+
+    def update(self, left_angle, right_angle, gyro_heading_deg):
+        current_dist = (left_angle + right_angle) / 2.0 * self.mm_per_degree
+        delta_dist = current_dist - self.last_odo_dist
+        self.last_odo_dist = current_dist
+        heading_rad = math.radians(gyro_heading_deg)
+        self.x_mm += delta_dist * math.cos(heading_rad)
+        self.y_mm += delta_dist * math.sin(heading_rad)
+
+
+def drive_arc(speed_mm_s, curvature, duration_s, period_ms, jitter_ms, seed):
+    """Returns [(left_deg, right_deg, gyro_deg)] readings and the true end pose."""
+    rng = random.Random(seed)
+    mm_per_deg = config.MM_PER_MOTOR_DEGREE
+    half_track = config.EFFECTIVE_TRACK_WIDTH_MM / 2.0
+    t = 0.0
+    readings = []
+    while t < duration_s:
+        t += max(1.0, period_ms + rng.uniform(-jitter_ms, jitter_ms)) / 1000.0
+        s = speed_mm_s * t
+        h = s * curvature
+        left = (s - h * half_track) / mm_per_deg
+        right = (s + h * half_track) / mm_per_deg
+        readings.append((int(left), int(right), float(round(math.degrees(h)))))
+    s = speed_mm_s * t
+    h = s * curvature
+    if curvature == 0:
+        end = (s, 0.0)
+    else:
+        end = (math.sin(h) / curvature, (1 - math.cos(h)) / curvature)
+    return readings, end
+
+
+def run(odo, readings):
+    for left, right, gyro in readings:
+        odo.update(left, right, gyro)
+    return odo.x_mm, odo.y_mm
+
+
+def cost_ns(make, readings, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        odo = make()
+        update = odo.update
+        start = time.perf_counter()
+        for left, right, gyro in readings:
+            update(left, right, gyro)
+        best = min(best, time.perf_counter() - start)
+    return best / len(readings) * 1e9
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark odometry integration.")
+    parser.add_argument("--speed", type=float, default=1000.0, help="Speed in mm/s")
+    parser.add_argument("--jitter", type=float, default=4.0, help="Tick interval jitter in ms (+/-)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed passes (best is reported)")
+    args = parser.parse_args()
+
+    def make_euler():
+        return EulerOdometry(config.MM_PER_MOTOR_DEGREE)
+
+    def make_fused():
+        return Odometry(config.MM_PER_MOTOR_DEGREE, config.EFFECTIVE_TRACK_WIDTH_MM, config.ODOMETRY_GYRO_WEIGHT)
+
+    period = config.RUN_LOOP_PERIOD_MS
+    print(f"{'radius_m':>8} {'euler_err_mm':>13} {'fused_err_mm':>13} {'euler_ns':>9} {'fused_ns':>9}")
+    for radius_m in (0.0, 20.0, 8.0, 3.0):
+        curvature = 0.0 if radius_m == 0 else 1.0 / (radius_m * 1000.0)
+        readings, (x_true, y_true) = drive_arc(args.speed, curvature, 7.0, period, args.jitter, 1)
+        ex, ey = run(make_euler(), readings)
+        fx, fy = run(make_fused(), readings)
+        label = "inf" if radius_m == 0 else f"{radius_m:.1f}"
+        print(f"{label:>8} {math.hypot(ex - x_true, ey - y_true):>13.2f} {math.hypot(fx - x_true, fy - y_true):>13.2f}"
+              f" {cost_ns(make_euler, readings, args.repeat):>9.0f} {cost_ns(make_fused, readings, args.repeat):>9.0f}")
@@ -0,0 +1,100 @@
+"""
+Benchmark of the bonus path length calculation.
+Compares the previous fixed 50-segment polyline estimate with the length
+integrated by the BonusPath table build for accuracy (against a dense
+composite Simpson reference) and cost. The table build is what constructing
+a new BonusPath costs; a repeat construction reuses the cached table.
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+if UTILS_DIR not in sys.path:
+    sys.path.insert(0, UTILS_DIR)
+
+from simulate_run import install_simulator  # noqa: E402
+
+install_simulator()
+
+import strategies  # noqa: E402
+
+LEGACY_POLYLINE_STEPS = 50
+REFERENCE_PANELS = 200000
+
+DISTANCES_M = (5.0, 6.0, 7.0, 8.0, 9.0, 10.0)
+GAPS_M = (0.25, 0.5, 1.0, 1.5)
+
+
+def polyline_length(path, steps=LEGACY_POLYLINE_STEPS):
+    """The previous estimate: cosine segment as a polyline plus the exact arc."""
+    len1 = 0.0
+    last_x, last_y = 0.0, 0.0
+    for i in range(1, steps + 1):
+        x = (i / steps) * path.mid_x
+        y = (path.sagitta_mm / 2.0) * (1 - math.cos(math.pi * x / path.mid_x))
+        len1 += math.sqrt((x - last_x) ** 2 + (y - last_y) ** 2)
+        last_x, last_y = x, y
+    return len1 + arc_length(path)
+
+
+def arc_length(path):
+    return path.radius_mm * math.asin(min(1.0, (path.target_dist_mm - path.mid_x) / path.radius_mm))
+
+
+def reference_length(path, panels=REFERENCE_PANELS):
+    k = math.pi / path.mid_x
+    slope_amp = (path.sagitta_mm / 2.0) * k
+    h = path.mid_x / panels
+    total = 0.0
+    for i in range(panels + 1):
+        w = 1 if i in (0, panels) else (4 if i % 2 else 2)
+        yp = slope_amp * math.sin(k * i * h)
+        total += w * math.sqrt(1 + yp * yp)
+    return total * h / 3.0 + arc_length(path)
+
+
+def build_table(path):
+    """Samples the table without the cache, as a first construction does."""
+    return path._sample_table()
+
+
+def construct(run_config):
+    """A repeat construction with the same geometry, served from the table cache."""
+    return strategies.BonusPath(run_config)
+
+
+def time_call(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bonus path length integration.")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed calls per method and case")
+    args = parser.parse_args()
+
+    print(f"{'dist_m':>6} {'gap_m':>5} {'reference_mm':>13} {'poly_err_mm':>12} {'table_err_mm':>13}"
+          f" {'poly_us':>8} {'build_us':>9} {'cached_us':>10}")
+    worst_poly = worst_table = 0.0
+    for distance_m in DISTANCES_M:
+        for gap_m in GAPS_M:
+            run_config = {"mode": "BONUS", "target_distance_m": distance_m, "target_time_s": 10,
+                          "bonus_gap_m": gap_m}
+            path = strategies.BonusPath(run_config)
+            reference = reference_length(path)
+            poly_err = polyline_length(path) - reference
+            table_err = path.total_length - reference
+            worst_poly = max(worst_poly, abs(poly_err))
+            worst_table = max(worst_table, abs(table_err))
+            poly_us = time_call(lambda: polyline_length(path), args.repeat)
+            build_us = time_call(lambda: build_table(path), max(1, args.repeat // 20))
+            cached_us = time_call(lambda: construct(run_config), args.repeat)
+            print(f"{distance_m:>6.2f} {gap_m:>5.2f} {reference:>13.4f} {poly_err:>12.4f} {table_err:>13.6f}"
+                  f" {poly_us:>8.1f} {build_us:>9.1f} {cached_us:>10.2f}")
+    print(f"Worst |error|: polyline {worst_poly:.4f} mm, table {worst_table:.6f} mm")
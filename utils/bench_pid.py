@@ -0,0 +1,112 @@
+"""
+Micro-benchmark of the steering PID update.
+Compares the previous list-based sliding-window integral (append, pop(0),
+sum() and config lookups every call) with pid.PID on the same error
+sequence, checks the outputs agree and reports the per-call cost.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+if UTILS_DIR not in sys.path:
+    sys.path.insert(0, UTILS_DIR)
+
+from simulate_run import install_simulator  # noqa: E402
+
+install_simulator()
+
+import config  # noqa: E402
+from pid import PID  # noqa: E402
+
+
+class LegacyPid:
+    """The PID section of Car.steer_heading before pid.PID."""
+
+    def __init__(self):
+        self.diff_pid_error_history = []
+        self.diff_pid_integral = 0.0
+        self.diff_pid_last_error = 0.0
+        self.run_mode = config.MODE_STRAIGHT
+
+    def update(self, error, dt):
+        if self.run_mode == config.MODE_BONUS:
+            kp = config.PID_DIFF_HEADING_BONUS_KP
+            ki = config.PID_DIFF_HEADING_BONUS_KI
+            kd = config.PID_DIFF_HEADING_BONUS_KD
+        else:
+            kp = config.PID_DIFF_HEADING_STRAIGHT_KP
+            ki = config.PID_DIFF_HEADING_STRAIGHT_KI
+            kd = config.PID_DIFF_HEADING_STRAIGHT_KD
+
+        if self.diff_pid_last_error * error < 0:
+            self.diff_pid_error_history = []
+
+        self.diff_pid_error_history.append(error * dt)
+        if len(self.diff_pid_error_history) > config.PID_DIFF_INTEGRAL_WINDOW_SIZE:
+            self.diff_pid_error_history.pop(0)
+        self.diff_pid_integral = sum(self.diff_pid_error_history)
+
+        if self.diff_pid_integral > config.PID_DIFF_INTEGRAL_ABS_MAX:
+            self.diff_pid_integral = config.PID_DIFF_INTEGRAL_ABS_MAX
+        elif self.diff_pid_integral < -config.PID_DIFF_INTEGRAL_ABS_MAX:
+            self.diff_pid_integral = -config.PID_DIFF_INTEGRAL_ABS_MAX
+
+        i_term = ki * self.diff_pid_integral
+        derivative = (error - self.diff_pid_last_error) / dt
+        d_term = kd * derivative
+        self.diff_pid_last_error = error
+        return kp * error + i_term + d_term
+
+
+def make_new_pid():
+    return PID(
+        config.PID_DIFF_HEADING_STRAIGHT_KP,
+        config.PID_DIFF_HEADING_STRAIGHT_KI,
+        config.PID_DIFF_HEADING_STRAIGHT_KD,
+        config.PID_DIFF_INTEGRAL_WINDOW_SIZE,
+        config.PID_DIFF_INTEGRAL_ABS_MAX,
+        config.PID_DIFF_DERIVATIVE_ALPHA,
+    )
+
+
+def error_sequence(count, seed, sign_flips):
+    """Heading errors for a slowly wandering vehicle; sign_flips adds zero crossings."""
+    rng = random.Random(seed)
+    errors = []
+    for i in range(count):
+        base = 0.5 if not sign_flips else 2.0 * math.sin(i / 37.0)
+        errors.append(base + rng.gauss(0.0, 0.3))
+    return errors
+
+
+def time_per_call(controller, errors, dt, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        update = controller.update
+        start = time.perf_counter()
+        for error in errors:
+            update(error, dt)
+        best = min(best, time.perf_counter() - start)
+    return best / len(errors) * 1e9
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the steering PID update.")
+    parser.add_argument("--calls", type=int, default=20000, help="Updates per timed pass")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes (best is reported)")
+    args = parser.parse_args()
+
+    dt = config.RUN_LOOP_PERIOD_MS / config.MS_PER_SECOND
+    print(f"{'sequence':<22} {'legacy_ns':>10} {'pid_ns':>10} {'speedup':>8} {'max_abs_diff':>13}")
+    for label, sign_flips in (("one-sided error", False), ("zero crossings", True)):
+        errors = error_sequence(args.calls, 1, sign_flips)
+        legacy, new = LegacyPid(), make_new_pid()
+        max_diff = max(abs(legacy.update(e, dt) - new.update(e, dt)) for e in errors)
+        legacy_ns = time_per_call(LegacyPid(), errors, dt, args.repeat)
+        new_ns = time_per_call(make_new_pid(), errors, dt, args.repeat)
+        print(f"{label:<22} {legacy_ns:>10.0f} {new_ns:>10.0f} {legacy_ns / new_ns:>7.2f}x {max_diff:>13.2e}")
@@ -0,0 +1,98 @@
+"""
+Benchmark of the indicator bar and progress bar redraws.
+Compares the previous line-by-line rasterization (kept here) with the
+sprite blits in ui.common, counting the drawing calls that reach the
+screen per redraw (world.draw_ops in the simulator) and the host time per
+redraw. Sprites are built before timing, as they are after the first
+redraw on the brick.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+if UTILS_DIR not in sys.path:
+    sys.path.insert(0, UTILS_DIR)
+
+from simulate_run import install_simulator  # noqa: E402
+
+_sim = install_simulator()
+
+from pybricks.hubs import EV3Brick  # noqa: E402
+from ui import common  # noqa: E402
+
+
+def legacy_indicator_bar(ev3, steps, current_index, completed_map):
+    """ui.common.draw_indicator_bar before sprites."""
+    screen = ev3.screen
+    count = len(steps)
+    usable = common.SCREEN_WIDTH - 2 * common.INDICATOR_MARGIN
+    spacing = usable // (count - 1 if count > 1 else 1)
+    positions = [common.INDICATOR_MARGIN + spacing * i for i in range(count)]
+    for i in range(count - 1):
+        start_x = positions[i] + common.INDICATOR_SIZE + 1
+        end_x = positions[i + 1] - common.INDICATOR_SIZE - 1
+        common._draw_hline_thick(screen, start_x, end_x, common.INDICATOR_Y, common.INDICATOR_THICKNESS)
+    for i, step in enumerate(steps):
+        x = positions[i]
+        common.draw_shape(screen, step["shape"], x, common.INDICATOR_Y, completed_map.get(step["key"], False))
+        if i == current_index:
+            common._draw_hline_thick(screen, x - common.INDICATOR_SIZE, x + common.INDICATOR_SIZE,
+                                     common.INDICATOR_Y + common.INDICATOR_SIZE + 5, common.INDICATOR_THICKNESS + 1)
+
+
+def legacy_progress_bar(screen, x, y, w, h, fraction):
+    """ui.run_status._draw_bar before sprites."""
+    fraction = max(0.0, min(1.0, fraction))
+    fill_w = int(w * fraction)
+    screen.draw_line(x, y, x + w, y)
+    screen.draw_line(x, y + h - 1, x + w, y + h - 1)
+    screen.draw_line(x, y, x, y + h - 1)
+    screen.draw_line(x + w, y, x + w, y + h - 1)
+    for dy in range(1, h - 1):
+        if fill_w > 0:
+            screen.draw_line(x + 1, y + dy, x + fill_w, y + dy)
+
+
+def measure(draw, repeat):
+    """Returns (screen draw calls per redraw, best host ns per redraw)."""
+    draw()  # builds any sprites
+    before = _sim.world.draw_ops
+    draw()
+    ops = _sim.world.draw_ops - before
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(100):
+            draw()
+        best = min(best, (time.perf_counter() - start) / 100)
+    return ops, best * 1e9
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark UI redraws.")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed passes of 100 redraws (best is reported)")
+    args = parser.parse_args()
+
+    ev3 = EV3Brick()
+    screen = ev3.screen
+    steps = [{"key": k, "shape": s} for k, s in (
+        ("mode", "circle"), ("target_distance_m", "circle"), ("target_time_s", "circle"),
+        ("bonus_gap_m", "circle"), ("gyro_calibration", "square"), ("confirm_run", "play"))]
+    completed = {"mode": True, "target_distance_m": True, "gyro_calibration": True}
+    cases = (
+        ("indicator bar",
+         lambda: legacy_indicator_bar(ev3, steps, 2, completed),
+         lambda: common.draw_indicator_bar(ev3, steps, 2, completed)),
+        ("progress bar 60%",
+         lambda: legacy_progress_bar(screen, 6, 64, common.SCREEN_WIDTH - 12, 12, 0.6),
+         lambda: common.draw_progress_bar(screen, 6, 64, common.SCREEN_WIDTH - 12, 12, 0.6)),
+    )
+    print(f"{'redraw':<18} {'legacy_ops':>10} {'sprite_ops':>10} {'legacy_ns':>10} {'sprite_ns':>10} {'speedup':>8}")
+    for label, legacy, sprite in cases:
+        legacy_ops, legacy_ns = measure(legacy, args.repeat)
+        sprite_ops, sprite_ns = measure(sprite, args.repeat)
+        print(f"{label:<18} {legacy_ops:>10} {sprite_ops:>10} {legacy_ns:>10.0f} {sprite_ns:>10.0f}"
+              f" {legacy_ns / sprite_ns:>7.1f}x")
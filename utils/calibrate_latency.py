@@ -0,0 +1,88 @@
+"""
+Estimates the end-to-end steering latency from logged runs.
+The measured speed (the time derivative of dist_mm) follows the commanded
+speed (vel_cmd) with a lag made up of the time from the sensor sample to the
+motor command and the response of the motor speed loop. The latency is the
+shift of vel_cmd that best explains the measured speed in a least-squares
+sense, searched on a 1 ms grid over all given telemetry files. Ticks at
+standstill are ignored, so the start delay does not count as latency.
+The result is the value for config.POSE_PREDICTION_LATENCY_MS.
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+import numpy as np
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+if UTILS_DIR not in sys.path:
+    sys.path.insert(0, UTILS_DIR)
+
+# Commanded speeds below this (mm/s) are treated as standstill
+MIN_SPEED_MM_S = 50.0
+
+
+def load_columns(path):
+    """Returns (ms, dist_mm, vel_cmd) arrays from a telemetry .bin or .csv file."""
+    if path.lower().endswith(".bin"):
+        import telemetry_binary
+        records, header = telemetry_binary.load(path)
+        return tuple(np.asarray(telemetry_binary.field(records, header, name), dtype=float)
+                     for name in ("ms", "dist_mm", "vel_cmd"))
+    rows = []
+    columns = None
+    with open(path, "r") as f:
+        for row in csv.reader(f):
+            if not row or row[0].startswith("#"):
+                continue
+            if columns is None:
+                columns = {name.strip(): i for i, name in enumerate(row)}
+                continue
+            rows.append([float(row[columns[name]]) for name in ("ms", "dist_mm", "vel_cmd")])
+    data = np.array(rows, dtype=float).reshape(-1, 3)
+    return data[:, 0], data[:, 1], data[:, 2]
+
+
+def measured_speed(ms, dist_mm):
+    """Central-difference speed (mm/s) at each sample."""
+    return np.gradient(dist_mm, ms / 1000.0)
+
+
+def shift_error(runs, latency_ms):
+    """Sum of squared differences between measured speed and vel_cmd delayed by latency_ms."""
+    total = 0.0
+    count = 0
+    for ms, speed, vel_cmd in runs:
+        delayed = np.interp(ms - latency_ms, ms, vel_cmd)
+        valid = (ms - latency_ms >= ms[0]) & (vel_cmd > MIN_SPEED_MM_S)
+        diff = speed[valid] - delayed[valid]
+        total += float(np.dot(diff, diff))
+        count += int(valid.sum())
+    return total / max(1, count)
+
+
+def estimate_latency(paths, max_latency_ms):
+    runs = []
+    for path in paths:
+        ms, dist_mm, vel_cmd = load_columns(path)
+        if len(ms) >= 3:
+            runs.append((ms, measured_speed(ms, dist_mm), vel_cmd))
+    if not runs:
+        raise ValueError("no telemetry samples to fit")
+    latencies = np.arange(0, max_latency_ms + 1)
+    errors = np.array([shift_error(runs, latency) for latency in latencies])
+    best = int(np.argmin(errors))
+    return int(latencies[best]), errors[best], errors[0]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estimate steering latency from telemetry logs.")
+    parser.add_argument("telemetry_paths", nargs="+", help="Telemetry .bin or .csv files")
+    parser.add_argument("--max-latency", type=int, default=300, help="Largest latency tried (ms)")
+    args = parser.parse_args()
+
+    latency_ms, error, error_zero = estimate_latency(args.telemetry_paths, args.max_latency)
+    print(f"Speed residual RMS: {error_zero ** 0.5:.1f} mm/s at 0 ms, {error ** 0.5:.1f} mm/s at {latency_ms} ms")
+    print(f"POSE_PREDICTION_LATENCY_MS = {latency_ms}")
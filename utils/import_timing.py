@@ -0,0 +1,122 @@
+"""
+Measures program startup against the simulated pybricks in utils/sim.
+Each trial is a fresh interpreter started with -X importtime that runs
+main.main() until the first text is drawn on the screen, so it reports the
+time to the first screen and which vehicle modules were imported on the way
+there (self and cumulative import time). Pass --root to time another
+checkout of the repository, e.g. a git worktree of an older commit.
+On the brick the same split can be read with utime.ticks_ms() around the
+imports at the top of main.py.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(UTILS_DIR, ".."))
+
+RESULT_PREFIX = "IMPORT_TIMING "
+
+
+class _FirstScreen(Exception):
+    pass
+
+
+def child(root):
+    """Runs main() until the first draw_text and prints the elapsed time."""
+    import time
+    start = time.perf_counter()
+    for path in (root, os.path.join(root, "utils", "sim")):
+        sys.path.insert(0, path)
+    from pybricks.media import ev3dev
+
+    def first_draw(self, *args, **kwargs):
+        raise _FirstScreen()
+
+    ev3dev.Image.draw_text = first_draw
+    import user_input
+    user_input.USE_RUNTIME_INPUT = True
+    import log_utils
+    log_utils.set_log_file(os.devnull)
+    import main as vehicle_main
+    imported_s = time.perf_counter() - start
+    try:
+        vehicle_main.main()
+    except _FirstScreen:
+        pass
+    first_screen_s = time.perf_counter() - start
+    sys.stdout.write(RESULT_PREFIX + json.dumps({"import_main_s": imported_s, "first_screen_s": first_screen_s}) + "\n")
+
+
+def local_modules(root):
+    names = set()
+    for base, _, files in os.walk(root):
+        rel = os.path.relpath(base, root)
+        if rel != "." and (rel.startswith("utils") or rel.startswith(".")):
+            continue
+        package = "" if rel == "." else rel.replace(os.sep, ".") + "."
+        for name in files:
+            if name.endswith(".py"):
+                module = name[:-3]
+                names.add(package[:-1] if module == "__init__" else package + module)
+    return names
+
+
+def trial(root, modules):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child", "--root", root],
+        capture_output=True, text=True, cwd=root if os.path.isdir(root) else None, check=True)
+    timing = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[0].isdigit():
+            continue
+        name = parts[2]
+        if name in modules:
+            timing[name] = (int(parts[0]), int(parts[1]))
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):]), timing
+    raise RuntimeError("child produced no result:\n" + proc.stdout + proc.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time imports and the first screen of main.py.")
+    parser.add_argument("--root", default=ROOT_DIR, help="Repository checkout to time")
+    parser.add_argument("--trials", type=int, default=7, help="Fresh interpreters to run (median is reported)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    root = os.path.abspath(args.root)
+
+    if args.child:
+        child(root)
+        sys.exit(0)
+
+    modules = local_modules(root)
+    totals = {"import_main_s": [], "first_screen_s": []}
+    per_module = {}
+    for _ in range(args.trials):
+        result, timing = trial(root, modules)
+        for key in totals:
+            totals[key].append(result[key])
+        for name, value in timing.items():
+            per_module.setdefault(name, []).append(value)
+
+    print(f"{root} ({args.trials} trials, median)")
+    print(f"  import main:  {statistics.median(totals['import_main_s']) * 1000.0:7.1f} ms")
+    print(f"  first screen: {statistics.median(totals['first_screen_s']) * 1000.0:7.1f} ms")
+    print(f"  {'module':<28} {'self_us':>8} {'cumulative_us':>14}")
+    rows = sorted(per_module.items(), key=lambda item: -statistics.median(v[1] for v in item[1]))
+    for name, values in rows:
+        self_us = statistics.median(v[0] for v in values)
+        cumulative_us = statistics.median(v[1] for v in values)
+        print(f"  {name:<28} {self_us:>8.0f} {cumulative_us:>14.0f}")
+    not_loaded = sorted(modules - set(per_module))
+    if not_loaded:
+        print("  not imported before the first screen: " + ", ".join(not_loaded))
@@ -0,0 +1,288 @@
+"""
+Monte Carlo robustness study for a run configuration.
+Each trial runs the real Car / RunStrategy control stack against the simulated
+vehicle in utils/sim with randomly drawn wheel-diameter error, gyro drift,
+motor lag and wheel slip. Trials are seeded from (base seed, trial index), so
+any result can be reproduced on its own, and are spread over a
+multiprocessing pool.
+"""
+
+import argparse
+import csv
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, asdict
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+if UTILS_DIR not in sys.path:
+    sys.path.insert(0, UTILS_DIR)
+
+from simulate_run import install_simulator  # noqa: E402
+
+_sim = install_simulator()
+
+import config  # noqa: E402
+import log_utils  # noqa: E402
+from pybricks.hubs import EV3Brick  # noqa: E402  # pyright: ignore[reportMissingImports]
+from pybricks.tools import StopWatch  # noqa: E402  # pyright: ignore[reportMissingImports]
+from run_loop import StallGuard, run_loop_step  # noqa: E402
+from scheduler import TickScheduler  # noqa: E402
+from strategies import get_strategy  # noqa: E402
+from vehicle import Car  # noqa: E402
+
+SEED_STRIDE = 1000003
+METRICS = ("distance_error_mm", "lateral_error_mm", "time_error_s", "gap_clearance_mm", "score")
+
+
+@dataclass
+class NoiseModel:
+    """Spread of the vehicle errors drawn for each trial."""
+    wheel_scale_sd: float = 0.005  # Common wheel-diameter error (fraction)
+    wheel_mismatch_sd: float = 0.002  # Left/right diameter mismatch (fraction)
+    gyro_drift_sd_dps: float = 0.05
+    gyro_noise_deg: float = 0.3
+    motor_lag_min_s: float = 0.02
+    motor_lag_max_s: float = 0.08
+    slip_max: float = 0.01  # Mean slip fraction is drawn from [0, slip_max]
+    slip_noise: float = 0.005
+
+    def sample(self, rng, seed):
+        common = rng.gauss(0.0, self.wheel_scale_sd)
+        mismatch = rng.gauss(0.0, self.wheel_mismatch_sd) / 2.0
+        return _sim.VehicleParams(
+            wheel_scale_left=1.0 + common - mismatch,
+            wheel_scale_right=1.0 + common + mismatch,
+            motor_time_constant_s=rng.uniform(self.motor_lag_min_s, self.motor_lag_max_s),
+            slip_fraction=rng.uniform(0.0, self.slip_max),
+            slip_noise=self.slip_noise,
+            gyro_drift_dps=rng.gauss(0.0, self.gyro_drift_sd_dps),
+            gyro_noise_deg=self.gyro_noise_deg,
+            seed=seed,
+        )
+
+
+def trial_seed(base_seed, index):
+    return base_seed * SEED_STRIDE + index
+
+
+def score_run(distance_error_mm, time_error_s):
+    """Event run score without the can bonus: 2 pts/cm distance error plus |time error|."""
+    return 2.0 * distance_error_mm / 10.0 + abs(time_error_s)
+
+
+def _apply_overrides(overrides):
+    """Sets config values and returns the previous ones for _restore_overrides()."""
+    saved = {}
+    for name, value in (overrides or {}).items():
+        if not hasattr(config, name):
+            raise AttributeError(f"config has no setting {name}")
+        saved[name] = getattr(config, name)
+        setattr(config, name, value)
+    return saved
+
+
+def _restore_overrides(saved):
+    for name, value in saved.items():
+        setattr(config, name, value)
+
+
+def run_trial(run_config, seed, noise=None, overrides=None, abort_lateral_mm=None):
+    """
+    Runs one seeded trial and returns a dict of metrics measured on the true
+    (simulated) vehicle pose. overrides replaces config values for this trial;
+    abort_lateral_mm ends a trial early once it is clearly off course.
+    """
+    noise = noise or NoiseModel()
+    rng = random.Random(seed)
+    world = _sim.world
+    world.reset(noise.sample(rng, seed))
+    saved = _apply_overrides(overrides)
+    # Trial log output is discarded: a one-entry buffer only counts what it
+    # drops, and it is thrown away when the trial ends.
+    log_utils.start_buffering(1, 1)
+    try:
+        return _run_trial(run_config, seed, abort_lateral_mm)
+    finally:
+        log_utils.stop_buffering(discard=True)
+        _restore_overrides(saved)
+
+
+def _run_trial(run_config, seed, abort_lateral_mm):
+    world = _sim.world
+    car = Car(auto_calibrate=False, ev3=EV3Brick())
+    car.calibrate_gyro_drift()
+    car.set_run_mode(run_config["mode"])
+    strategy = get_strategy(run_config)
+
+    target_mm = run_config["target_distance_m"] * config.MM_PER_METER
+    gate_x_mm = target_mm / 2.0
+    gate_outer_mm = config.OUTER_CAN_INSIDE_EDGE_M * config.MM_PER_METER
+    gate_inner_mm = gate_outer_mm - run_config.get("bonus_gap_m", 0.0) * config.MM_PER_METER
+    gate_y_mm = None
+    has_gate = run_config["mode"] == config.MODE_BONUS
+
+    # Measure from the vehicle's true pose at the start of the run.
+    x0, y0, h0 = world.x_mm, world.y_mm, world.heading_rad
+    cos0, sin0 = math.cos(-h0), math.sin(-h0)
+
+    def true_pose():
+        dx, dy = world.x_mm - x0, world.y_mm - y0
+        return dx * cos0 - dy * sin0, dx * sin0 + dy * cos0
+
+    car.reset_odometry()
+    run_timer = StopWatch()
+    run_timer.reset()
+    scheduler = TickScheduler(config.RUN_LOOP_PERIOD_MS, config.RUN_LOOP_LATE_TOLERANCE_MS, run_timer)
+    max_run_ms = int(strategy.target_time_s * config.MS_PER_SECOND * config.RUN_TIMEOUT_MULTIPLIER)
+    stall_guard = StallGuard(config.STALL_WINDOW_MS, config.STALL_THRESHOLD_MM)
+    loop_ms = 0
+    aborted = False
+    pose = car.get_pose()
+
+    while not strategy.is_finished(run_timer.time() / config.MS_PER_SECOND, pose):
+        loop_ms = scheduler.wait_next()
+        time_s = loop_ms / config.MS_PER_SECOND
+        pose, dist_mm, _, _, _ = run_loop_step(car, strategy, time_s)
+
+        x_true, y_true = true_pose()
+        if has_gate and gate_y_mm is None and x_true >= gate_x_mm:
+            gate_y_mm = y_true
+        if abort_lateral_mm is not None and abs(y_true) > abort_lateral_mm:
+            aborted = True
+            break
+        if stall_guard.stalled(loop_ms, dist_mm):
+            break
+        if loop_ms >= max_run_ms:
+            break
+
+    car.stop(brake=True)
+
+    x_true, y_true = true_pose()
+    distance_error_mm = math.hypot(x_true - target_mm, y_true)
+    time_error_s = loop_ms / config.MS_PER_SECOND - run_config["target_time_s"]
+    if gate_y_mm is None:
+        gap_clearance_mm = float("nan")
+    else:
+        # Distance from the vehicle centreline to the nearer gate edge; negative means outside the gate.
+        gap_clearance_mm = min(gate_y_mm - gate_inner_mm, gate_outer_mm - gate_y_mm)
+    return {
+        "seed": seed,
+        "distance_error_mm": distance_error_mm,
+        "lateral_error_mm": y_true,
+        "time_error_s": time_error_s,
+        "gap_clearance_mm": gap_clearance_mm,
+        "score": score_run(distance_error_mm, time_error_s),
+        "aborted": aborted,
+    }
+
+
+def _trial_worker(args):
+    index, run_config, seed, noise, overrides, abort_lateral_mm = args
+    result = run_trial(run_config, seed, noise, overrides, abort_lateral_mm)
+    result["trial"] = index
+    return result
+
+
+def run_batch(run_config, trials, base_seed=0, noise=None, overrides=None, processes=None,
+              abort_lateral_mm=None, seeds=None):
+    """Runs trials across a process pool; results are returned in trial order."""
+    if seeds is None:
+        seeds = [trial_seed(base_seed, i) for i in range(trials)]
+    jobs = [(i, run_config, seed, noise, overrides, abort_lateral_mm) for i, seed in enumerate(seeds)]
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        results = [_trial_worker(job) for job in jobs]
+    else:
+        chunksize = max(1, len(jobs) // (processes * 4))
+        with multiprocessing.Pool(processes) as pool:
+            results = list(pool.imap_unordered(_trial_worker, jobs, chunksize=chunksize))
+    results.sort(key=lambda r: r["trial"])
+    return results
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float("nan")
+    pos = fraction * (len(sorted_values) - 1)
+    lo = int(math.floor(pos))
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def summarize(results, metrics=METRICS):
+    """Returns {metric: {mean, std, min, p5, p50, p95, max}} ignoring NaN values."""
+    summary = {}
+    for metric in metrics:
+        values = sorted(r[metric] for r in results if not math.isnan(r[metric]))
+        if not values:
+            continue
+        mean = sum(values) / len(values)
+        var = sum((v - mean) ** 2 for v in values) / max(1, len(values) - 1)
+        summary[metric] = {
+            "mean": mean,
+            "std": math.sqrt(var),
+            "min": values[0],
+            "p5": percentile(values, 0.05),
+            "p50": percentile(values, 0.50),
+            "p95": percentile(values, 0.95),
+            "max": values[-1],
+        }
+    return summary
+
+
+def print_summary(summary, results):
+    columns = ("mean", "std", "min", "p5", "p50", "p95", "max")
+    print(f"{'metric':<20}" + "".join(f"{c:>10}" for c in columns))
+    for metric, stats in summary.items():
+        print(f"{metric:<20}" + "".join(f"{stats[c]:>10.2f}" for c in columns))
+    gate = [r["gap_clearance_mm"] for r in results if not math.isnan(r["gap_clearance_mm"])]
+    if gate:
+        inside = sum(1 for g in gate if g > 0)
+        print(f"Bonus gate passed in {inside}/{len(gate)} trials")
+
+
+def default_run_config(mode=None, distance_m=None, time_s=None, gap_m=None):
+    import user_input
+    run_config = user_input.get_default_run_config()
+    for key, value in (("mode", mode), ("target_distance_m", distance_m),
+                       ("target_time_s", time_s), ("bonus_gap_m", gap_m)):
+        if value is not None:
+            run_config[key] = value
+    return run_config
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo scoring distribution for a run configuration.")
+    parser.add_argument("--mode", choices=("STRAIGHT", "BONUS"), help="Run mode")
+    parser.add_argument("--distance", type=float, help="Target distance in meters")
+    parser.add_argument("--time", type=float, help="Target time in seconds")
+    parser.add_argument("--gap", type=float, help="Bonus gap in meters")
+    parser.add_argument("--trials", type=int, default=1000, help="Number of trials")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed")
+    parser.add_argument("--processes", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--csv", dest="csv_path", help="Write per-trial results to this CSV file")
+    for name, value in asdict(NoiseModel()).items():
+        parser.add_argument("--" + name.replace("_", "-"), type=float, default=value, help=f"Noise model (default {value})")
+    args = parser.parse_args()
+
+    noise = NoiseModel(**{name: getattr(args, name) for name in asdict(NoiseModel())})
+    run_config = default_run_config(args.mode, args.distance, args.time, args.gap)
+
+    start = time.perf_counter()
+    results = run_batch(run_config, args.trials, args.seed, noise, processes=args.processes)
+    elapsed = time.perf_counter() - start
+
+    print(f"Run config: {run_config}")
+    print(f"{len(results)} trials in {elapsed:.1f} s ({len(results) / elapsed:.1f} trials/s)")
+    print_summary(summarize(results), results)
+
+    if args.csv_path:
+        with open(args.csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+        print(f"Wrote per-trial results to {args.csv_path}")
@@ -0,0 +1,5 @@
+"""
+Simulated pybricks for running the vehicle code on a desktop CPython.
+Put utils/sim on sys.path ahead of everything else (utils/simulate_run.py
+does this); never copy this package to the brick.
+"""
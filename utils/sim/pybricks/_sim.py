@@ -0,0 +1,183 @@
+"""
+Virtual clock, differential-drive vehicle model and scripted buttons behind
+the simulated pybricks modules.
+
+Time only moves when the program waits (or, optionally, when a device is
+read), so a full run completes as fast as the Python code can execute.
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+
+from .parameters import Button
+
+# Longest integration step; waits longer than this are split.
+MAX_STEP_MS = 5.0
+
+
+@dataclass
+class VehicleParams:
+    """Error model for the simulated vehicle. The defaults describe an ideal vehicle."""
+    wheel_scale_left: float = 1.0  # Actual / configured effective wheel diameter
+    wheel_scale_right: float = 1.0
+    track_scale: float = 1.0  # Actual / configured effective track width
+    motor_time_constant_s: float = 0.0  # First-order speed lag of the motor speed loop
+    motor_max_speed_dps: float = 1050.0
+    slip_fraction: float = 0.0  # Mean fraction of wheel travel lost to slip
+    slip_noise: float = 0.0  # Std dev of per-step slip fraction
+    gyro_drift_dps: float = 0.0  # Raw gyro drift (clockwise-positive, like the sensor)
+    gyro_noise_deg: float = 0.0  # Std dev of gyro angle read noise
+    io_cost_ms: float = 0.0  # Virtual time consumed by each sensor read
+    battery_mv: int = 8000
+    missing_ports: tuple = ()  # Ports whose devices fail to open
+    seed: int = 0
+
+
+def _default_autopilot():
+    # Center then Right, repeatedly: completes each setup screen and moves on,
+    # then confirms, starts the run and dismisses the summary.
+    return [
+        ((Button.CENTER,), 100),
+        ((), 150),
+        ((Button.RIGHT,), 100),
+        ((), 150),
+    ]
+
+
+@dataclass
+class ButtonScript:
+    """Cyclic sequence of (buttons, hold_ms) steps evaluated against the virtual clock."""
+    steps: list = field(default_factory=_default_autopilot)
+    start_ms: float = 0.0
+
+    def pressed(self, now_ms):
+        total = sum(ms for _, ms in self.steps)
+        if total <= 0:
+            return []
+        t = (now_ms - self.start_ms) % total
+        for buttons, ms in self.steps:
+            if t < ms:
+                return list(buttons)
+            t -= ms
+        return []
+
+
+class World:
+    """Global simulation state shared by every simulated device."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, params=None, output_dir="."):
+        self.params = params if params is not None else VehicleParams()
+        self.rng = random.Random(self.params.seed)
+        self.output_dir = output_dir
+        self.now_ms = 0.0
+        self.buttons = ButtonScript(start_ms=0.0)
+        self.light_color = None
+        self.draw_ops = 0
+
+        # True vehicle state (mm, rad). Heading 0 is +X, positive is CCW/left.
+        self.x_mm = 0.0
+        self.y_mm = 0.0
+        self.heading_rad = 0.0
+        self.yaw_rate_rad_s = 0.0
+
+        # Raw motor shafts keyed by port: angle (deg), actual and commanded speed (deg/s)
+        self.shaft_deg = {}
+        self.shaft_speed = {}
+        self.shaft_cmd = {}
+
+        # Raw gyro angle before quantization (clockwise-positive)
+        self.gyro_raw_deg = 0.0
+        self._geometry = None
+
+    # Geometry comes from config so the model matches the code under test.
+    def geometry(self):
+        if self._geometry is None:
+            import config
+            self._geometry = (
+                config.PORT_LEFT_MOTOR,
+                config.PORT_RIGHT_MOTOR,
+                config.MM_PER_MOTOR_DEGREE,
+                config.EFFECTIVE_TRACK_WIDTH_MM,
+                -1.0 if config.INVERT_DRIVE else 1.0,
+            )
+        return self._geometry
+
+    def check_port(self, port):
+        if port in self.params.missing_ports:
+            raise OSError(f"No device on {port}")
+
+    def attach_motor(self, port):
+        self.shaft_deg.setdefault(port, 0.0)
+        self.shaft_speed.setdefault(port, 0.0)
+        self.shaft_cmd.setdefault(port, 0.0)
+
+    def read_cost(self):
+        if self.params.io_cost_ms > 0:
+            self.advance(self.params.io_cost_ms)
+
+    def advance(self, ms):
+        remaining = float(ms)
+        while remaining > 0:
+            step = MAX_STEP_MS if remaining > MAX_STEP_MS else remaining
+            self._integrate(step / 1000.0)
+            remaining -= step
+            self.now_ms += step
+
+    def _integrate(self, dt):
+        p = self.params
+        tau = p.motor_time_constant_s
+        decay = math.exp(-dt / tau) if tau > 0 else 0.0
+        avg_speed = {}
+        for port, cmd in self.shaft_cmd.items():
+            old = self.shaft_speed[port]
+            new = cmd + (old - cmd) * decay
+            limit = p.motor_max_speed_dps
+            if new > limit:
+                new = limit
+            elif new < -limit:
+                new = -limit
+            avg = (old + new) / 2.0
+            self.shaft_deg[port] += avg * dt
+            self.shaft_speed[port] = new
+            avg_speed[port] = avg
+
+        left_port, right_port, mm_per_deg, track_mm, drive_sign = self.geometry()
+        fwd_left = drive_sign * avg_speed.get(left_port, 0.0)
+        fwd_right = drive_sign * avg_speed.get(right_port, 0.0)
+        slip_left = p.slip_fraction
+        slip_right = p.slip_fraction
+        if p.slip_noise > 0:
+            slip_left += self.rng.gauss(0.0, p.slip_noise)
+            slip_right += self.rng.gauss(0.0, p.slip_noise)
+        v_left = fwd_left * mm_per_deg * p.wheel_scale_left * (1.0 - slip_left)
+        v_right = fwd_right * mm_per_deg * p.wheel_scale_right * (1.0 - slip_right)
+
+        v = (v_left + v_right) / 2.0
+        w = (v_right - v_left) / (track_mm * p.track_scale)
+        h = self.heading_rad
+        if abs(w) < 1e-9:
+            self.x_mm += v * math.cos(h) * dt
+            self.y_mm += v * math.sin(h) * dt
+        else:
+            h_next = h + w * dt
+            self.x_mm += v / w * (math.sin(h_next) - math.sin(h))
+            self.y_mm -= v / w * (math.cos(h_next) - math.cos(h))
+        self.heading_rad = h + w * dt
+        self.yaw_rate_rad_s = w
+        self.gyro_raw_deg += (-math.degrees(w) + p.gyro_drift_dps) * dt
+
+    def gyro_reading(self):
+        value = self.gyro_raw_deg
+        if self.params.gyro_noise_deg > 0:
+            value += self.rng.gauss(0.0, self.params.gyro_noise_deg)
+        return value
+
+    def pressed(self):
+        return self.buttons.pressed(self.now_ms)
+
+
+world = World()
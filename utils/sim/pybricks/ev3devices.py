@@ -0,0 +1,67 @@
+"""Simulated EV3 motors and gyro, driven by the vehicle model in _sim."""
+
+import math
+
+from ._sim import world
+from .parameters import Direction
+
+
+def _sign(positive_direction):
+    return -1.0 if positive_direction == Direction.COUNTERCLOCKWISE else 1.0
+
+
+class Motor:
+    def __init__(self, port, positive_direction=Direction.CLOCKWISE, gears=None):
+        world.check_port(port)
+        world.attach_motor(port)
+        self.port = port
+        self._sign = _sign(positive_direction)
+        self._zero = 0.0
+
+    def angle(self):
+        world.read_cost()
+        return int(round(self._sign * world.shaft_deg[self.port] - self._zero))
+
+    def speed(self):
+        world.read_cost()
+        return int(round(self._sign * world.shaft_speed[self.port]))
+
+    def reset_angle(self, angle):
+        self._zero = self._sign * world.shaft_deg[self.port] - angle
+
+    def run(self, speed):
+        world.shaft_cmd[self.port] = self._sign * speed
+
+    def dc(self, duty):
+        world.shaft_cmd[self.port] = self._sign * world.params.motor_max_speed_dps * duty / 100.0
+
+    def stop(self):
+        world.shaft_cmd[self.port] = 0.0
+
+    def brake(self):
+        world.shaft_cmd[self.port] = 0.0
+
+    def hold(self):
+        # Holding stops the shaft immediately.
+        world.shaft_cmd[self.port] = 0.0
+        world.shaft_speed[self.port] = 0.0
+
+
+class GyroSensor:
+    def __init__(self, port, positive_direction=Direction.CLOCKWISE):
+        world.check_port(port)
+        self.port = port
+        self._sign = _sign(positive_direction)
+        self._zero = 0.0
+
+    def angle(self):
+        world.read_cost()
+        return int(round(self._sign * world.gyro_reading() - self._zero))
+
+    def speed(self):
+        world.read_cost()
+        rate = -math.degrees(world.yaw_rate_rad_s) + world.params.gyro_drift_dps
+        return int(round(self._sign * rate))
+
+    def reset_angle(self, angle):
+        self._zero = self._sign * world.gyro_raw_deg - angle
@@ -0,0 +1,54 @@
+"""Simulated EV3Brick with a headless screen and scripted buttons."""
+
+from ._sim import world
+from .media.ev3dev import Image
+
+
+class _Buttons:
+    def pressed(self):
+        return world.pressed()
+
+
+class _Light:
+    def on(self, color):
+        world.light_color = color
+
+    def off(self):
+        world.light_color = None
+
+
+class _Speaker:
+    def beep(self, frequency=500, duration=100):
+        world.advance(duration)
+
+    def play_notes(self, notes, tempo=120):
+        pass
+
+    def play_file(self, file_name):
+        pass
+
+    def say(self, text):
+        pass
+
+    def set_speech_options(self, language=None, voice=None, speed=None, pitch=None):
+        pass
+
+    def set_volume(self, volume, which="_all_"):
+        pass
+
+
+class _Battery:
+    def voltage(self):
+        return world.params.battery_mv
+
+    def current(self):
+        return 100
+
+
+class EV3Brick:
+    def __init__(self):
+        self.screen = Image("_screen_")
+        self.buttons = _Buttons()
+        self.light = _Light()
+        self.speaker = _Speaker()
+        self.battery = _Battery()
@@ -0,0 +1,100 @@
+"""Simulated pybricks.media.ev3dev: headless images and fonts."""
+
+from .._sim import world
+
+
+class Font:
+    DEFAULT = None
+
+    def __init__(self, family=None, size=12, bold=False, monospace=False, lang=None, script=None):
+        self.family = family or "Lucida"
+        self.size = size
+        self.bold = bold
+        self.monospace = monospace
+
+    @property
+    def width(self):
+        return max(1, int(self.size * 0.6))
+
+    @property
+    def height(self):
+        return self.size
+
+    def text_width(self, text):
+        return self.width * len(text)
+
+    def text_height(self, text):
+        return self.height
+
+
+Font.DEFAULT = Font("Lucida", 12)
+
+
+class Image:
+    """Headless image. Drawing calls only count operations in world.draw_ops."""
+
+    def __init__(self, source, sub=False, x1=0, y1=0, x2=None, y2=None):
+        if isinstance(source, Image):
+            width, height = source.width, source.height
+            if sub:
+                width = (x2 if x2 is not None else width - 1) - x1 + 1
+                height = (y2 if y2 is not None else height - 1) - y1 + 1
+        else:
+            # "_screen_" or a file path; both use the EV3 screen size.
+            width, height = 178, 128
+        self.width = width
+        self.height = height
+        self.font = Font.DEFAULT
+
+    @staticmethod
+    def empty(width=178, height=128):
+        if width < 1 or height < 1:
+            raise ValueError("width and height must be at least 1")
+        img = Image("_empty_")
+        img.width = width
+        img.height = height
+        return img
+
+    def _op(self):
+        world.draw_ops += 1
+
+    def clear(self):
+        self._op()
+
+    def set_font(self, font):
+        self.font = font
+
+    def draw_text(self, x, y, text, text_color=None, background_color=None):
+        self._op()
+
+    def print(self, *args, sep=" ", end="\n"):
+        self._op()
+
+    def draw_pixel(self, x, y, color=None):
+        self._op()
+
+    def draw_line(self, x1, y1, x2, y2, width=1, color=None):
+        self._op()
+
+    def draw_box(self, x1, y1, x2, y2, r=0, fill=False, color=None):
+        self._op()
+
+    def draw_circle(self, x, y, r, fill=False, color=None):
+        self._op()
+
+    def draw_image(self, x, y, source, transparent=None):
+        self._op()
+
+    def load_image(self, source):
+        self._op()
+
+    def save(self, filename):
+        pass
+
+
+class ImageFile:
+    pass
+
+
+class SoundFile:
+    pass
@@ -0,0 +1,41 @@
+"""Simulated pybricks.parameters."""
+
+
+class _Constant:
+    __slots__ = ("_group", "_name")
+
+    def __init__(self, group, name):
+        self._group = group
+        self._name = name
+
+    def __repr__(self):
+        return f"{self._group}.{self._name}"
+
+    __str__ = __repr__
+
+
+def _constants(group, names):
+    return {name: _Constant(group, name) for name in names}
+
+
+class Port:
+    locals().update(_constants("Port", ("A", "B", "C", "D", "S1", "S2", "S3", "S4")))
+
+
+class Direction:
+    locals().update(_constants("Direction", ("CLOCKWISE", "COUNTERCLOCKWISE")))
+
+
+class Stop:
+    locals().update(_constants("Stop", ("COAST", "BRAKE", "HOLD")))
+
+
+class Color:
+    locals().update(_constants("Color", (
+        "BLACK", "BLUE", "GREEN", "YELLOW", "RED", "WHITE", "BROWN", "ORANGE", "PURPLE")))
+
+
+class Button:
+    locals().update(_constants("Button", (
+        "LEFT_DOWN", "DOWN", "RIGHT_DOWN", "LEFT", "CENTER", "RIGHT",
+        "LEFT_UP", "UP", "BEACON", "RIGHT_UP")))
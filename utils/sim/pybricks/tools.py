@@ -0,0 +1,57 @@
+"""Simulated pybricks.tools on the virtual clock."""
+
+import os
+from datetime import datetime
+
+from ._sim import world
+
+
+def wait(time):
+    if time > 0:
+        world.advance(time)
+
+
+class StopWatch:
+    def __init__(self):
+        self._start_ms = world.now_ms
+        self._paused_at = None
+
+    def _now(self):
+        return world.now_ms if self._paused_at is None else self._paused_at
+
+    def time(self):
+        return int(self._now() - self._start_ms)
+
+    def pause(self):
+        if self._paused_at is None:
+            self._paused_at = world.now_ms
+
+    def resume(self):
+        if self._paused_at is not None:
+            self._start_ms += world.now_ms - self._paused_at
+            self._paused_at = None
+
+    def reset(self):
+        self._start_ms = world.now_ms
+        if self._paused_at is not None:
+            self._paused_at = world.now_ms
+
+
+class DataLog:
+    """Writes CSV rows to world.output_dir, named like the brick's DataLog."""
+
+    def __init__(self, *headers, name="log", timestamp=True, extension="csv", append=False):
+        filename = name
+        if timestamp:
+            filename += datetime.now().strftime("_%Y_%m_%d_%H_%M_%S_%f")
+        self.path = os.path.join(world.output_dir, f"{filename}.{extension}")
+        self._file = open(self.path, "a" if append else "w")
+        if headers:
+            self.log(*headers)
+
+    def log(self, *values):
+        self._file.write(", ".join(str(v) for v in values) + "\n")
+        self._file.flush()
+
+    def __repr__(self):
+        return f"DataLog({self.path})"
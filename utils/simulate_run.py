@@ -0,0 +1,84 @@
+"""
+Runs main.py unmodified on the desktop against the simulated pybricks in utils/sim.
+The virtual clock only advances when the program waits, so a full run (setup
+screens, gyro calibration, the run itself and the summary) takes well under a
+second of wall time. Buttons are pressed by an autopilot that completes each
+setup screen, confirms, starts the run and dismisses the summary.
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import sys
+import time
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(UTILS_DIR, ".."))
+SIM_DIR = os.path.join(UTILS_DIR, "sim")
+
+
+def install_simulator():
+    """Makes the simulated pybricks and the vehicle code importable."""
+    for path in (ROOT_DIR, SIM_DIR):
+        if path in sys.path:
+            sys.path.remove(path)
+        sys.path.insert(0, path)
+    from pybricks import _sim
+    return _sim
+
+
+def run(mode=None, distance_m=None, time_s=None, gap_m=None, output_dir=".", runtime_input=False,
+        params=None, quiet=False):
+    """Runs main.main() once in the simulator and returns the final world state."""
+    _sim = install_simulator()
+    os.makedirs(output_dir, exist_ok=True)
+    _sim.world.reset(params, output_dir=output_dir)
+
+    import user_input
+    overrides = {
+        "mode": mode,
+        "target_distance_m": distance_m,
+        "target_time_s": time_s,
+        "bonus_gap_m": gap_m,
+    }
+    for key, value in overrides.items():
+        if value is not None:
+            user_input.STATIC_RUN_CONFIG[key] = value
+    user_input.USE_RUNTIME_INPUT = runtime_input
+
+    import log_utils
+    import main as vehicle_main
+    log_utils.set_log_file(os.path.join(output_dir, "run_log.txt"))
+
+    cwd = os.getcwd()
+    os.chdir(output_dir)
+    try:
+        stdout = io.StringIO() if quiet else sys.stdout
+        with contextlib.redirect_stdout(stdout):
+            vehicle_main.main()
+    finally:
+        os.chdir(cwd)
+    return _sim.world
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run main.py against the simulated pybricks backend.")
+    parser.add_argument("--mode", choices=("STRAIGHT", "BONUS"), help="Run mode")
+    parser.add_argument("--distance", type=float, help="Target distance in meters")
+    parser.add_argument("--time", type=float, help="Target time in seconds")
+    parser.add_argument("--gap", type=float, help="Bonus gap in meters")
+    parser.add_argument("--out", default="sim_output", help="Directory for run_log.txt and telemetry")
+    parser.add_argument("--runtime-input", action="store_true", help="Step through the value-entry screens too")
+    parser.add_argument("--quiet", action="store_true", help="Suppress the program's console output")
+    args = parser.parse_args()
+
+    wall_start = time.perf_counter()
+    world = run(args.mode, args.distance, args.time, args.gap, os.path.abspath(args.out),
+                runtime_input=args.runtime_input, quiet=args.quiet)
+    wall_s = time.perf_counter() - wall_start
+
+    print(f"Virtual time: {world.now_ms / 1000.0:.2f} s, wall time: {wall_s * 1000.0:.0f} ms")
+    print(f"True final pose: x={world.x_mm:.1f} mm, y={world.y_mm:.1f} mm, "
+          f"heading={math.degrees(world.heading_rad):.2f} deg")
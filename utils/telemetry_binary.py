@@ -0,0 +1,133 @@
+"""
+Host-side decoder for the binary telemetry written by RunLogger.save_binary().
+Records are mapped straight from the file with numpy.memmap, so loading a run
+does not copy or parse the sample data.
+"""
+
+import argparse
+import csv
+import json
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"EVTL"
+SUPPORTED_VERSIONS = (1,)
+PREFIX_FORMAT = "<4sHIHIH"
+
+# struct codes used on the brick -> little-endian numpy dtypes
+DTYPES = {
+    "b": "<i1",
+    "h": "<i2",
+    "i": "<i4",
+    "l": "<i4",
+    "f": "<f4",
+    "d": "<f8",
+}
+
+
+class TelemetryHeader:
+    """Parsed header: field layout, scales and run settings."""
+
+    def __init__(self, version, header_len, record_size, record_count, fields, settings):
+        self.version = version
+        self.header_len = header_len
+        self.record_size = record_size
+        self.record_count = record_count
+        self.fields = fields  # list of (name, struct code, scale)
+        self.settings = settings
+
+    @property
+    def field_names(self):
+        return [name for name, _, _ in self.fields]
+
+    def dtype(self):
+        return np.dtype([(name, DTYPES[code]) for name, code, _ in self.fields])
+
+    def scale(self, name):
+        for field, _, scale in self.fields:
+            if field == name:
+                return scale
+        raise KeyError(name)
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        prefix = f.read(struct.calcsize(PREFIX_FORMAT))
+        if len(prefix) < struct.calcsize(PREFIX_FORMAT):
+            raise ValueError(f"{path}: file too short for a telemetry header")
+        magic, version, header_len, record_size, record_count, field_count = struct.unpack(PREFIX_FORMAT, prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a binary telemetry file")
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"{path}: unsupported telemetry version {version}")
+
+        fields = []
+        for _ in range(field_count):
+            (name_len,) = struct.unpack("<B", f.read(1))
+            name = f.read(name_len).decode()
+            code = f.read(1).decode()
+            (scale,) = struct.unpack("<f", f.read(4))
+            fields.append((name, code, scale))
+        (settings_len,) = struct.unpack("<I", f.read(4))
+        settings = json.loads(f.read(settings_len).decode()) if settings_len else {}
+
+    header = TelemetryHeader(version, header_len, record_size, record_count, fields, settings)
+    if header.dtype().itemsize != record_size:
+        raise ValueError(f"{path}: record size {record_size} does not match field layout")
+    return header
+
+
+def load(path):
+    """Returns (records, header); records is a read-only structured memmap of raw values."""
+    header = read_header(path)
+    if header.record_count == 0:
+        return np.zeros(0, dtype=header.dtype()), header
+    records = np.memmap(path, dtype=header.dtype(), mode="r",
+                        offset=header.header_len, shape=(header.record_count,))
+    return records, header
+
+
+def field(records, header, name):
+    """Returns one field in physical units. Unscaled fields are returned as views."""
+    scale = header.scale(name)
+    raw = records[name]
+    if scale == 1.0:
+        return raw
+    return raw / scale
+
+
+def to_csv(bin_path, csv_path):
+    """Converts a binary log to the CSV layout written by RunLogger.save_csv()."""
+    records, header = load(bin_path)
+    columns = [field(records, header, name) for name in header.field_names]
+    integer = [np.issubdtype(col.dtype, np.integer) for col in columns]
+    with open(csv_path, "w", newline="") as f:
+        for key, value in header.settings.items():
+            f.write(f"# {key},{value}\n")
+        writer = csv.writer(f)
+        writer.writerow(header.field_names)
+        for i in range(header.record_count):
+            writer.writerow([int(col[i]) if is_int else f"{col[i]:.6g}" for col, is_int in zip(columns, integer)])
+    return header.record_count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or convert binary telemetry logs.")
+    parser.add_argument("telemetry_path", help="Path to a telemetry .bin file")
+    parser.add_argument("--csv", dest="csv_path", help="Write a CSV copy to this path (default: alongside the input)")
+    parser.add_argument("--info", action="store_true", help="Print the header instead of converting")
+    args = parser.parse_args()
+
+    if args.info:
+        hdr = read_header(args.telemetry_path)
+        print(f"Version {hdr.version}, {hdr.record_count} records of {hdr.record_size} bytes")
+        for name, code, scale in hdr.fields:
+            print(f"  {name}: {code} (scale {scale:g})")
+        for key, value in hdr.settings.items():
+            print(f"  setting {key} = {value}")
+    else:
+        out_path = args.csv_path or os.path.splitext(args.telemetry_path)[0] + ".csv"
+        count = to_csv(args.telemetry_path, out_path)
+        print(f"Wrote {count} rows to {out_path}")
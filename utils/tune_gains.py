@@ -0,0 +1,158 @@
+"""
+Offline tuner for the heading PID gains, lookahead and differential speed limit.
+Candidates are drawn by random search and scored with the Monte Carlo trials
+in monte_carlo.py (the real Car.steer_heading control law on the simulated
+vehicle). Successive halving keeps the budget on promising candidates: every
+candidate is scored on a few seeds, the best fraction advances to a rung with
+more seeds, and trials that leave the course are aborted early. All
+candidates in a rung share the same seeds so they are compared on identical
+vehicles.
+"""
+
+import argparse
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+if UTILS_DIR not in sys.path:
+    sys.path.insert(0, UTILS_DIR)
+
+import monte_carlo  # noqa: E402
+from monte_carlo import NoiseModel, config, default_run_config, trial_seed  # noqa: E402
+
+# name: (low, high, log-scale)
+SEARCH_SPACE = {
+    "KP": (0.05, 2.0, True),
+    "KI": (0.0, 0.05, False),
+    "KD": (0.0, 1.0, False),
+    "LOOKAHEAD_DIST_MM": (5.0, 400.0, True),
+    "MAX_DIFF_SPEED_MM_S": (30.0, 300.0, False),
+}
+
+ABORT_LATERAL_MM = 600.0  # Trials further than this from the centreline are cut short
+ABORT_PENALTY = 1000.0  # Score charged for an aborted trial
+GATE_MISS_PENALTY = 55.0  # Full can bonus (-0.5 x 110) forfeited when the gate is missed
+
+
+def config_names(mode):
+    prefix = "PID_DIFF_HEADING_BONUS_" if mode == config.MODE_BONUS else "PID_DIFF_HEADING_STRAIGHT_"
+    names = {}
+    for key in SEARCH_SPACE:
+        names[key] = prefix + key if key in ("KP", "KI", "KD") else key
+    return names
+
+
+def current_candidate(mode):
+    return {key: getattr(config, name) for key, name in config_names(mode).items()}
+
+
+def sample_candidate(rng):
+    candidate = {}
+    for key, (low, high, log_scale) in SEARCH_SPACE.items():
+        if log_scale:
+            candidate[key] = math.exp(rng.uniform(math.log(low), math.log(high)))
+        else:
+            candidate[key] = rng.uniform(low, high)
+    return candidate
+
+
+def objective(results, mode):
+    """Mean run score, with aborted trials and missed bonus gates penalized."""
+    total = 0.0
+    for r in results:
+        if r["aborted"]:
+            total += ABORT_PENALTY
+            continue
+        total += r["score"]
+        if mode == config.MODE_BONUS and not r["gap_clearance_mm"] > 0:
+            total += GATE_MISS_PENALTY
+    return total / max(1, len(results))
+
+
+def evaluate(candidates, run_config, seeds, noise, processes):
+    """Scores every candidate on the same seeds in one pool pass. Returns objectives in order."""
+    names = config_names(run_config["mode"])
+    jobs = []
+    for c_index, candidate in enumerate(candidates):
+        overrides = {names[key]: value for key, value in candidate.items()}
+        for seed in seeds:
+            jobs.append((c_index, run_config, seed, noise, overrides, ABORT_LATERAL_MM))
+
+    if processes == 1:
+        results = [monte_carlo._trial_worker(job) for job in jobs]
+    else:
+        chunksize = max(1, len(jobs) // (processes * 4))
+        with multiprocessing.Pool(processes) as pool:
+            results = list(pool.imap_unordered(monte_carlo._trial_worker, jobs, chunksize=chunksize))
+
+    grouped = [[] for _ in candidates]
+    for r in results:
+        grouped[r["trial"]].append(r)
+    return [objective(group, run_config["mode"]) for group in grouped]
+
+
+def tune(run_config, candidates=64, rungs=3, base_trials=4, keep_fraction=1.0 / 3.0, seed=0,
+         noise=None, processes=None):
+    """Random search with successive halving. Returns [(objective, candidate, trials)] best first."""
+    rng = random.Random(seed)
+    processes = processes or os.cpu_count() or 1
+    pool = [current_candidate(run_config["mode"])]
+    pool += [sample_candidate(rng) for _ in range(candidates - 1)]
+
+    ranked = []
+    trials = base_trials
+    for rung in range(rungs):
+        seeds = [trial_seed(seed, i) for i in range(trials)]
+        start = time.perf_counter()
+        scores = evaluate(pool, run_config, seeds, noise, processes)
+        ranked = sorted(zip(scores, range(len(pool))), key=lambda item: item[0])
+        ranked = [(score, pool[i], trials) for score, i in ranked]
+        print(f"Rung {rung + 1}/{rungs}: {len(pool)} candidates x {trials} trials "
+              f"in {time.perf_counter() - start:.1f} s, best {ranked[0][0]:.2f}")
+        if rung == rungs - 1:
+            break
+        keep = max(1, int(math.ceil(len(pool) * keep_fraction)))
+        pool = [candidate for _, candidate, _ in ranked[:keep]]
+        trials = int(trials / keep_fraction)
+    return ranked
+
+
+def print_ranking(ranked, limit=10):
+    keys = list(SEARCH_SPACE)
+    print(f"{'rank':>4} {'objective':>10} {'trials':>6}" + "".join(f"{k:>22}" for k in keys))
+    for i, (score, candidate, trials) in enumerate(ranked[:limit]):
+        print(f"{i + 1:>4} {score:>10.2f} {trials:>6}" + "".join(f"{candidate[k]:>22.4f}" for k in keys))
+
+
+def config_block(candidate, mode):
+    lines = [f"# Tuned for {mode} by utils/tune_gains.py"]
+    for key, name in config_names(mode).items():
+        lines.append(f"{name} = {candidate[key]:.4g}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune heading PID gains and lookahead in simulation.")
+    parser.add_argument("--mode", choices=("STRAIGHT", "BONUS"), help="Run mode to tune")
+    parser.add_argument("--distance", type=float, help="Target distance in meters")
+    parser.add_argument("--time", type=float, help="Target time in seconds")
+    parser.add_argument("--gap", type=float, help="Bonus gap in meters")
+    parser.add_argument("--candidates", type=int, default=64, help="Random candidates in the first rung")
+    parser.add_argument("--rungs", type=int, default=3, help="Successive-halving rungs")
+    parser.add_argument("--base-trials", type=int, default=4, help="Trials per candidate in the first rung")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for candidates and trials")
+    parser.add_argument("--processes", type=int, help="Worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    run_config = default_run_config(args.mode, args.distance, args.time, args.gap)
+    print(f"Run config: {run_config}")
+    ranked = tune(run_config, args.candidates, args.rungs, args.base_trials, seed=args.seed,
+                  noise=NoiseModel(), processes=args.processes)
+    print()
+    print_ranking(ranked)
+    print()
+    print(config_block(ranked[0][1], run_config["mode"]))
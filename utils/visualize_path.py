@@ -32,6 +32,7 @@ BASE_TELEMETRY_FIELDS = (
     "heading_deg",
     "curvature_cmd_mm",
     "drift_dps",
+    "cross_track_mm",
 )
 
 
@@ -85,16 +86,33 @@ def get_straight_path(target_dist_m):
     target_dist_mm = (target_dist_m + config.DISTANCE_CORRECTION_M) * config.MM_PER_METER
     return np.array([0.0, target_dist_mm]), np.array([0.0, 0.0])
 
+def load_binary_telemetry(bin_path):
+    """Loads recorded path and run config from a binary telemetry.bin file."""
+    import telemetry_binary
+
+    try:
+        records, header = telemetry_binary.load(bin_path)
+        x_coords = telemetry_binary.field(records, header, "x_mm")
+        y_coords = telemetry_binary.field(records, header, "y_mm")
+        return np.asarray(x_coords, dtype=float), np.asarray(y_coords, dtype=float), dict(header.settings)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error reading telemetry: {e}")
+        return None, None, {}
+
+
 def load_telemetry(csv_path):
-    """Loads recorded path and run config from a telemetry.csv file."""
+    """Loads recorded path and run config from a telemetry.csv or telemetry.bin file."""
     if not os.path.exists(csv_path):
         print(f"Warning: Telemetry file {csv_path} not found.")
         return None, None, {}
+    if csv_path.lower().endswith(".bin"):
+        return load_binary_telemetry(csv_path)
     
     x_coords = []
     y_coords = []
     run_info = {}
     column_indexes = {}
+    rows_seen = False
     
     try:
         with open(csv_path, 'r') as f:
@@ -103,6 +121,13 @@ def load_telemetry(csv_path):
                 if not row:
                     continue
 
+                # Run settings header written once by RunLogger.save(): "# key,value"
+                if row[0].startswith("#"):
+                    key = row[0].lstrip("#").strip()
+                    if key and len(row) > 1:
+                        run_info[key] = _parse_scalar(",".join(row[1:]))
+                    continue
+
                 if not column_indexes and row[0].strip().lower() == "ms":
                     column_indexes = {name.strip(): idx for idx, name in enumerate(row)}
                     continue
@@ -117,8 +142,9 @@ def load_telemetry(csv_path):
                     x_coords.append(float(row[x_idx]))
                     y_coords.append(float(row[y_idx]))
                     
-                    # Store config from the first valid row
-                    if not run_info:
+                    # Older logs repeat the run settings as columns; store them from the first valid row
+                    if not rows_seen:
+                        rows_seen = True
                         if column_indexes:
                             for field, idx in column_indexes.items():
                                 if field in BASE_TELEMETRY_FIELDS:
@@ -138,7 +164,7 @@ def load_telemetry(csv_path):
         return None, None, {}
 
 def select_file_via_gui():
-    """Opens a file picker dialog to select a telemetry CSV file."""
+    """Opens a file picker dialog to select a telemetry file."""
     root = None
     try:
         root = tk.Tk()
@@ -146,8 +172,8 @@ def select_file_via_gui():
         root.attributes("-topmost", True)
         root.update()
         file_path = filedialog.askopenfilename(
-            title="Select Telemetry CSV",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            title="Select Telemetry File",
+            filetypes=[("Telemetry files", "*.bin *.csv"), ("Binary telemetry", "*.bin"), ("CSV files", "*.csv"), ("All files", "*.*")]
         )
         return file_path
     except KeyboardInterrupt:
@@ -245,7 +271,7 @@ def visualize(target_dist_m=8.0, bonus_gap_m=0.2, telemetry_path=None, run_mode=
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Visualize ideal and recorded vehicle paths.")
-    parser.add_argument("telemetry_path", nargs="?", help="Optional telemetry CSV path. If omitted, file picker opens.")
+    parser.add_argument("telemetry_path", nargs="?", help="Optional telemetry .csv or .bin path. If omitted, file picker opens.")
     parser.add_argument("--distance", type=float, help="Target distance in meters")
     parser.add_argument("--gap", type=float, help="Bonus gap in meters")
     parser.add_argument("--telemetry", type=str, help="Path to telemetry CSV file (legacy flag)")
@@ -1,45 +1,147 @@
 """Hardware abstraction layer for the EV3 vehicle."""
 
 import math
+from array import array
 from pybricks.hubs import EV3Brick  # pyright: ignore[reportMissingImports]
-from pybricks.ev3devices import Motor, GyroSensor  # pyright: ignore[reportMissingImports]
-from pybricks.parameters import Direction  # pyright: ignore[reportMissingImports]
 from pybricks.tools import wait, StopWatch  # pyright: ignore[reportMissingImports]
 import config
 import log_utils
+from pid import PID
+from odometry import Odometry
+from gyro_drift import DriftEstimator, DriftTracker
+from prediction import PosePredictor
+import devices
+
+# Sensor reads take well under a millisecond, so they are timed with the
+# microsecond tick counter; the host simulator falls back to perf_counter_ns.
+try:
+    from utime import ticks_us, ticks_diff  # pyright: ignore[reportMissingImports]
+except ImportError:
+    from time import perf_counter_ns
+
+    def ticks_us():
+        return perf_counter_ns() // 1000
+
+    def ticks_diff(end, start):
+        return end - start
+
+
+# Device indexes for per-device read latency stats
+DEVICE_LEFT_MOTOR = 0
+DEVICE_RIGHT_MOTOR = 1
+DEVICE_GYRO = 2
+DEVICE_NAMES = ("left_motor", "right_motor", "gyro")
+
+
+class SensorSnapshot:
+    """
+    Sensor values sampled once per control tick.
+    The same object is refilled every tick so odometry, strategy, steering
+    and logging all work from one consistent set of readings.
+    """
+    __slots__ = ("time_ms", "left_angle", "right_angle", "gyro_angle", "heading_deg")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.time_ms = 0
+        self.left_angle = 0
+        self.right_angle = 0
+        self.gyro_angle = 0
+        self.heading_deg = 0.0
+
+
+class MotorCommand:
+    """
+    Speed command filter in front of one motor.
+    run() is forwarded only if the speed differs from the last one sent by
+    more than deadband_deg_s, changes sign (zero counts as its own sign),
+    or follows a stop/hold; stop() and hold() are always sent. Every
+    ev3dev motor command is a sysfs write, so writes and suppressed
+    commands are counted.
+    """
+    __slots__ = ("motor", "deadband_deg_s", "last_speed", "writes", "suppressed")
+
+    def __init__(self, motor, deadband_deg_s):
+        self.motor = motor
+        self.deadband_deg_s = deadband_deg_s
+        self.last_speed = None
+        self.writes = 0
+        self.suppressed = 0
+
+    def run(self, speed_deg_s):
+        last = self.last_speed
+        if last is not None and -self.deadband_deg_s <= speed_deg_s - last <= self.deadband_deg_s \
+                and (speed_deg_s > 0) == (last > 0) and (speed_deg_s < 0) == (last < 0):
+            self.suppressed += 1
+            return
+        self.motor.run(speed_deg_s)
+        self.last_speed = speed_deg_s
+        self.writes += 1
 
+    def stop(self):
+        self.motor.stop()
+        self.last_speed = None
+        self.writes += 1
 
-class Car:
-    def __init__(self, auto_calibrate=False, ev3=None):
-        self.ev3 = ev3 if ev3 is not None else EV3Brick()
+    def hold(self):
+        self.motor.hold()
+        self.last_speed = None
+        self.writes += 1
 
-        drive_dir = Direction.COUNTERCLOCKWISE if config.INVERT_DRIVE else Direction.CLOCKWISE
 
-        self.left_motor = Motor(config.PORT_LEFT_MOTOR, drive_dir)
-        self.right_motor = Motor(config.PORT_RIGHT_MOTOR, drive_dir)
+class Car:
+    def __init__(self, auto_calibrate=False, ev3=None, registry=None):
+        self.ev3 = ev3 if ev3 is not None else EV3Brick()
 
-        self.gyro = GyroSensor(config.PORT_GYRO_SENSOR)
+        # Handles already opened by the precheck are reused.
+        self.registry = registry if registry is not None else devices.DeviceRegistry()
+        self.left_motor = self.registry.get(devices.LEFT_MOTOR)
+        self.right_motor = self.registry.get(devices.RIGHT_MOTOR)
+        self.gyro = self.registry.get(devices.GYRO)
+        self.left_command = MotorCommand(self.left_motor, config.MOTOR_COMMAND_DEADBAND_DEG_S)
+        self.right_command = MotorCommand(self.right_motor, config.MOTOR_COMMAND_DEADBAND_DEG_S)
         self.pid_timer = StopWatch(); self.pid_timer.reset()
         self.heading_timer = StopWatch(); self.heading_timer.reset()
         self.drift_rate_dps = 0.0
+        # Confidence half-width of drift_rate_dps (inf until calibrated)
+        self.drift_half_width_dps = float("inf")
+        self.drift_tracker = DriftTracker(config.DRIFT_TRACK_TIME_CONSTANT_S, config.DRIFT_TRACK_MOTION_DEG,
+                                          config.GYRO_ANGLE_RESOLUTION_DEG)
         self.run_mode = config.MODE_STRAIGHT
 
         # Odometry State
         self.distance_mm = 0.0
-        self.start_angle_left = 0
-        self.start_angle_right = 0
         
         self.target_speed_mm_s = 0.0 # Store speed for differential mixing
-
-        self.diff_pid_error_history = []
-        self.diff_pid_integral = 0.0
-        self.diff_pid_last_error = 0.0
+        # Last wheel speeds sent by steer_heading (mm/s), for pose prediction
+        self.command_left_mm_s = 0.0
+        self.command_right_mm_s = 0.0
+
+        self.heading_pid = PID(
+            config.PID_DIFF_HEADING_STRAIGHT_KP,
+            config.PID_DIFF_HEADING_STRAIGHT_KI,
+            config.PID_DIFF_HEADING_STRAIGHT_KD,
+            config.PID_DIFF_INTEGRAL_WINDOW_SIZE,
+            config.PID_DIFF_INTEGRAL_ABS_MAX,
+            config.PID_DIFF_DERIVATIVE_ALPHA,
+        )
         self.last_time = 0
+        self._bind_steering_config()
+
+        # Position tracking (encoder/gyro fusion)
+        self.odometry = Odometry(config.MM_PER_MOTOR_DEGREE, config.EFFECTIVE_TRACK_WIDTH_MM,
+                                 config.ODOMETRY_GYRO_WEIGHT)
+        self.predictor = None
+        if config.POSE_PREDICTION_ENABLED:
+            self.predictor = PosePredictor(config.POSE_PREDICTION_LATENCY_MS, config.EFFECTIVE_TRACK_WIDTH_MM)
 
-        # Position tracking
-        self.x_mm = 0.0
-        self.y_mm = 0.0
-        self.last_odo_dist = 0.0
+        # Per-tick sensor snapshot and read latency stats (us, indexed by DEVICE_*)
+        self.snapshot = SensorSnapshot()
+        self.read_total_us = array("l", [0] * len(DEVICE_NAMES))
+        self.read_max_us = array("l", [0] * len(DEVICE_NAMES))
+        self.read_count = 0
 
         if auto_calibrate:
             self.calibrate_gyro_drift()
@@ -47,111 +149,177 @@ class Car:
     def reset_odometry(self):
         """
         Resets distance and angle measurements to zero.
-        Should be called just before the run starts.
+        Should be called just before the run starts. A drift estimate tracked
+        while the vehicle waited replaces the calibrated one if it covers
+        enough idle time and its confidence interval is tighter.
         """
+        self.apply_tracked_drift()
+        self.drift_tracker.reset()
+
         self.left_motor.reset_angle(0)
         self.right_motor.reset_angle(0)
         self.gyro.reset_angle(0)
         self.heading_timer.reset()
         
         self.distance_mm = 0.0
-        self.diff_pid_error_history = []
-        self.diff_pid_integral = 0.0
-        self.diff_pid_last_error = 0.0
+        self.heading_pid.reset()
         self.pid_timer.reset()
         self.last_time = 0
 
-        self.x_mm = 0.0
-        self.y_mm = 0.0
-        self.last_odo_dist = 0.0
+        self.odometry.reset()
+        self.snapshot.clear()
+        self.command_left_mm_s = 0.0
+        self.command_right_mm_s = 0.0
+
+    def _record_read(self, device, elapsed_us):
+        self.read_total_us[device] += elapsed_us
+        if elapsed_us > self.read_max_us[device]:
+            self.read_max_us[device] = elapsed_us
+
+    def sample_sensors(self):
+        """Reads both motor angles and the gyro once into self.snapshot."""
+        snap = self.snapshot
+        t0 = ticks_us()
+        snap.left_angle = self.left_motor.angle()
+        t1 = ticks_us()
+        snap.right_angle = self.right_motor.angle()
+        t2 = ticks_us()
+        snap.gyro_angle = self.gyro.angle()
+        t3 = ticks_us()
+
+        time_ms = self.heading_timer.time()
+        snap.time_ms = time_ms
+        snap.heading_deg = self._heading_from_raw(snap.gyro_angle, time_ms)
+
+        self._record_read(DEVICE_LEFT_MOTOR, ticks_diff(t1, t0))
+        self._record_read(DEVICE_RIGHT_MOTOR, ticks_diff(t2, t1))
+        self._record_read(DEVICE_GYRO, ticks_diff(t3, t2))
+        self.read_count += 1
+        return snap
+
+    def read_latency_lines(self):
+        count = max(1, self.read_count)
+        lines = []
+        for device, name in enumerate(DEVICE_NAMES):
+            lines.append("Read latency {}: mean={:.1f}us, max={}us over {} reads".format(
+                name, self.read_total_us[device] / count, self.read_max_us[device], self.read_count))
+        return lines
+
+    def motor_command_lines(self):
+        lines = []
+        for name, command in (("left_motor", self.left_command), ("right_motor", self.right_command)):
+            total = max(1, command.writes + command.suppressed)
+            lines.append("Motor commands {}: {} written, {} suppressed ({:.0f}%)".format(
+                name, command.writes, command.suppressed, 100.0 * command.suppressed / total))
+        return lines
 
     def update_sensors(self):
-        l_angle = self.left_motor.angle()
-        r_angle = self.right_motor.angle()
-        avg_angle = (l_angle + r_angle) / 2.0
-        
-        current_dist = avg_angle * config.MM_PER_MOTOR_DEGREE
-        delta_dist = current_dist - self.last_odo_dist
-        self.distance_mm = current_dist
-        self.last_odo_dist = current_dist
-
-        # Update X, Y
-        # Heading is in degrees, convert to radians
+        snap = self.sample_sensors()
         # Coordinate system: X is forward, Y is Left.
         # Heading 0 is along +X. Positive heading is Left (+Y).
-        heading_rad = math.radians(self.get_heading())
-        self.x_mm += delta_dist * math.cos(heading_rad)
-        self.y_mm += delta_dist * math.sin(heading_rad)
+        odo = self.odometry
+        odo.update(snap.left_angle, snap.right_angle, snap.heading_deg)
+        self.distance_mm = odo.distance_mm
         
     def get_distance(self):
         return self.distance_mm
     
     def get_pose(self):
-        """Returns tuple (x_mm, y_mm, heading_deg, distance_mm)"""
-        return self.x_mm, self.y_mm, self.get_heading(), self.distance_mm
-        
-    def get_heading(self):
+        """Returns tuple (x_mm, y_mm, heading_deg, distance_mm) from the fused odometry."""
+        odo = self.odometry
+        return odo.x_mm, odo.y_mm, odo.heading_deg, odo.distance_mm
+
+    def predict_pose(self, pose):
+        """
+        Returns pose advanced to when the next motor command takes effect,
+        or pose itself when prediction is disabled.
+        """
+        if self.predictor is None:
+            return pose
+        age_ms = self.heading_timer.time() - self.snapshot.time_ms
+        return self.predictor.predict(pose, self.command_left_mm_s, self.command_right_mm_s, age_ms)
+
+    def _heading_from_raw(self, raw_angle, elapsed_ms):
         # Gyro angle on EV3 is clockwise-positive; invert so positive means CCW/left
         # (consistent with our geometry and heading targets). Drift compensation
         # follows the same sign convention.
-        elapsed_s = self.heading_timer.time() / config.MS_PER_SECOND
-        raw_angle = self.gyro.angle()
+        elapsed_s = elapsed_ms / config.MS_PER_SECOND
         return -(raw_angle - self.drift_rate_dps * elapsed_s)
 
+    def apply_tracked_drift(self):
+        """Replaces drift_rate_dps with the idle-tracked drift if that estimate is tighter; returns True if it was."""
+        tracker = self.drift_tracker
+        if tracker.span_s() < config.DRIFT_TRACK_MIN_SPAN_S:
+            return False
+        half_width = tracker.half_width_dps(config.GYRO_CAL_CONFIDENCE_Z)
+        if not half_width < self.drift_half_width_dps:
+            log_utils.log("Idle drift {:.4f} +/- {:.4f} deg/s not tighter than calibration ({:.4f} +/- {:.4f}); kept.".format(
+                tracker.drift_dps(), half_width, self.drift_rate_dps, self.drift_half_width_dps))
+            return False
+        log_utils.log("Drift updated from idle tracking: {:.4f} -> {:.4f} +/- {:.4f} deg/s over {:.1f} s".format(
+            self.drift_rate_dps, tracker.drift_dps(), half_width, tracker.span_s()))
+        self.drift_rate_dps = tracker.drift_dps()
+        self.drift_half_width_dps = half_width
+        return True
+
+    def start_drift_tracking(self):
+        """Restarts background drift tracking; call when the vehicle comes to rest."""
+        self.drift_tracker.reset()
+
+    def track_drift(self):
+        """Feeds one gyro sample to the background drift tracker (UI idle loop)."""
+        self.drift_tracker.add(self.heading_timer.time() / config.MS_PER_SECOND, self.gyro.angle())
+
+    def get_heading(self):
+        """Live gyro heading; the control tick uses the fused odometry heading instead."""
+        elapsed_ms = self.heading_timer.time()
+        return self._heading_from_raw(self.gyro.angle(), elapsed_ms)
+
     def set_run_mode(self, mode):
         if mode in (config.MODE_STRAIGHT, config.MODE_BONUS):
             self.run_mode = mode
         else:
             self.run_mode = config.MODE_STRAIGHT
-        self.diff_pid_error_history = []
-        self.diff_pid_integral = 0.0
-        self.diff_pid_last_error = 0.0
+        if self.run_mode == config.MODE_BONUS:
+            self.heading_pid.set_gains(
+                config.PID_DIFF_HEADING_BONUS_KP,
+                config.PID_DIFF_HEADING_BONUS_KI,
+                config.PID_DIFF_HEADING_BONUS_KD,
+            )
+        else:
+            self.heading_pid.set_gains(
+                config.PID_DIFF_HEADING_STRAIGHT_KP,
+                config.PID_DIFF_HEADING_STRAIGHT_KI,
+                config.PID_DIFF_HEADING_STRAIGHT_KD,
+            )
+        self.heading_pid.reset()
+        self._bind_steering_config()
+
+    def _bind_steering_config(self):
+        # Steering constants read once here instead of from config on every tick
+        self._ms_per_second = config.MS_PER_SECOND
+        self._steer_sign = -1.0 if config.INVERT_STEERING else 1.0
+        self._half_track_mm = config.EFFECTIVE_TRACK_WIDTH_MM / 2.0
+        self._max_diff_mm_s = config.MAX_DIFF_SPEED_MM_S
+        self._max_speed_mm_s = config.MAX_SPEED_MM_S
+        self._mm_per_motor_degree = config.MM_PER_MOTOR_DEGREE
 
     def drive_speed(self, speed_mm_s):
         self.target_speed_mm_s = speed_mm_s
 
     def steer_heading(self, target_heading, curvature_mm=0.0):
-        current_heading = self.get_heading()
-        error = target_heading - current_heading
+        error = target_heading - self.odometry.heading_deg
         
         current_time = self.pid_timer.time()
-        dt = (current_time - self.last_time) / config.MS_PER_SECOND # seconds
+        dt = (current_time - self.last_time) / self._ms_per_second # seconds
         self.last_time = current_time
         
         if dt <= 0:
             return
 
-        if self.run_mode == config.MODE_BONUS:
-            kp = config.PID_DIFF_HEADING_BONUS_KP
-            ki = config.PID_DIFF_HEADING_BONUS_KI
-            kd = config.PID_DIFF_HEADING_BONUS_KD
-        else:
-            kp = config.PID_DIFF_HEADING_STRAIGHT_KP
-            ki = config.PID_DIFF_HEADING_STRAIGHT_KI
-            kd = config.PID_DIFF_HEADING_STRAIGHT_KD
-
-        # Reset differential integral when crossing the target to avoid oscillation growth.
-        if self.diff_pid_last_error * error < 0:
-            self.diff_pid_error_history = []
-
-        self.diff_pid_error_history.append(error * dt)
-        if len(self.diff_pid_error_history) > config.PID_DIFF_INTEGRAL_WINDOW_SIZE:
-            self.diff_pid_error_history.pop(0)
-        self.diff_pid_integral = sum(self.diff_pid_error_history)
-
-        if self.diff_pid_integral > config.PID_DIFF_INTEGRAL_ABS_MAX:
-            self.diff_pid_integral = config.PID_DIFF_INTEGRAL_ABS_MAX
-        elif self.diff_pid_integral < -config.PID_DIFF_INTEGRAL_ABS_MAX:
-            self.diff_pid_integral = -config.PID_DIFF_INTEGRAL_ABS_MAX
-
-        i_term = ki * self.diff_pid_integral
-        derivative = (error - self.diff_pid_last_error) / dt
-        d_term = kd * derivative
-        self.diff_pid_last_error = error
-
-        p_term = kp * error
-        
-        pid_output = p_term + i_term + d_term
+        # Gains follow the run mode (bound in set_run_mode). The integral is
+        # reset when crossing the target to avoid oscillation growth.
+        pid_output = self.heading_pid.update(error, dt)
 
         # PID output is interpreted as differential speed adjustment (turn rate control)
         # v_l = v - adjustment
@@ -167,22 +335,20 @@ class Car:
 
         # Use degrees/s directly for easier tuning relative to gyro:
         # Total Output = Feedforward (Physics) + PID (Error Correction)
-        omega_deg_s = feedforward_deg_s + pid_output
-
-        # Apply steering inversion if requested
-        if config.INVERT_STEERING:
-            omega_deg_s = -omega_deg_s
+        # Steering inversion is applied through _steer_sign.
+        omega_deg_s = self._steer_sign * (feedforward_deg_s + pid_output)
 
         omega_rad_s = math.radians(omega_deg_s)
 
         # v = r * omega.  v_diff = (width/2) * omega
-        diff_mm_s = (config.EFFECTIVE_TRACK_WIDTH_MM / 2.0) * omega_rad_s
+        diff_mm_s = self._half_track_mm * omega_rad_s
 
         # Clamp the max speed difference to avoid aggressive turns or wheel slip
-        if diff_mm_s > config.MAX_DIFF_SPEED_MM_S:
-            diff_mm_s = config.MAX_DIFF_SPEED_MM_S
-        elif diff_mm_s < -config.MAX_DIFF_SPEED_MM_S:
-            diff_mm_s = -config.MAX_DIFF_SPEED_MM_S
+        max_diff = self._max_diff_mm_s
+        if diff_mm_s > max_diff:
+            diff_mm_s = max_diff
+        elif diff_mm_s < -max_diff:
+            diff_mm_s = -max_diff
 
         # base_mm_s is the target forward speed
         base_mm_s = self.target_speed_mm_s
@@ -193,47 +359,65 @@ class Car:
 
         # Prioritize steering: if any wheel exceeds max physical speed, reduce both speeds equally
         # to maintain the same difference (same turn rate)
-        max_wheel_speed = max(v_left_mm_s, v_right_mm_s)
-        if max_wheel_speed > config.MAX_SPEED_MM_S:
-            reduction = max_wheel_speed - config.MAX_SPEED_MM_S
+        max_wheel_speed = v_left_mm_s if v_left_mm_s > v_right_mm_s else v_right_mm_s
+        if max_wheel_speed > self._max_speed_mm_s:
+            reduction = max_wheel_speed - self._max_speed_mm_s
             v_left_mm_s -= reduction
             v_right_mm_s -= reduction
 
         # Clamp speeds so they cannot be negative (prevent reversing during steering)
-        v_left_mm_s = max(0, v_left_mm_s)
-        v_right_mm_s = max(0, v_right_mm_s)
+        if v_left_mm_s < 0:
+            v_left_mm_s = 0
+        if v_right_mm_s < 0:
+            v_right_mm_s = 0
 
         # Convert to motor degrees/s
-        speed_l_deg_s = v_left_mm_s / config.MM_PER_MOTOR_DEGREE
-        speed_r_deg_s = v_right_mm_s / config.MM_PER_MOTOR_DEGREE
+        speed_l_deg_s = v_left_mm_s / self._mm_per_motor_degree
+        speed_r_deg_s = v_right_mm_s / self._mm_per_motor_degree
 
-        self.left_motor.run(speed_l_deg_s)
-        self.right_motor.run(speed_r_deg_s)
+        self.left_command.run(speed_l_deg_s)
+        self.right_command.run(speed_r_deg_s)
+        self.command_left_mm_s = v_left_mm_s
+        self.command_right_mm_s = v_right_mm_s
 
 
     def stop(self, brake=True):
+        self.command_left_mm_s = 0.0
+        self.command_right_mm_s = 0.0
         if brake:
-            self.left_motor.hold()
-            self.right_motor.hold()
+            self.left_command.hold()
+            self.right_command.hold()
         else:
-            self.left_motor.stop()
-            self.right_motor.stop()
+            self.left_command.stop()
+            self.right_command.stop()
 
     def calibrate_gyro_drift(self, duration_ms=None, progress_cb=None):
-        """Calibrates gyro drift; safe to call multiple times."""
+        """
+        Calibrates gyro drift; safe to call multiple times.
+        Fits angle against measured sample times and stops as soon as the
+        drift confidence interval is within GYRO_CAL_CI_DPS, or after
+        duration_ms (default GYRO_CAL_DURATION_MS) at the latest.
+        """
         cal_ms = duration_ms if duration_ms is not None else config.GYRO_CAL_DURATION_MS
-        log_utils.log("Starting gyro calibration for {:.1f} s. Do not move the vehicle.".format(cal_ms / config.MS_PER_SECOND))
+        min_ms = min(cal_ms, config.GYRO_CAL_MIN_DURATION_MS)
+        log_utils.log("Starting gyro calibration for up to {:.1f} s. Do not move the vehicle.".format(cal_ms / config.MS_PER_SECOND))
         self.ev3.light.off()
         blink_timer = StopWatch(); blink_timer.reset()
         self.gyro.reset_angle(0)
         wait(config.GYRO_RESET_WAIT_MS)
 
+        estimator = DriftEstimator(config.GYRO_ANGLE_RESOLUTION_DEG)
         timer = StopWatch(); timer.reset()
-        last_angle = self.gyro.angle()
-        drift_sum = 0.0
-        samples = 0
+        estimator.add(0.0, self.gyro.angle())
+        half_width = estimator.half_width_dps(config.GYRO_CAL_CONFIDENCE_Z)
+
+        while True:
+            now_ms = timer.time()
+            if now_ms >= cal_ms:
+                break
+            if now_ms >= min_ms and half_width <= config.GYRO_CAL_CI_DPS:
+                break
 
-        while timer.time() < cal_ms:
             if (blink_timer.time() // config.GYRO_CAL_BLINK_INTERVAL_MS) % 2 == 0:
                 self.ev3.light.on(config.Color.YELLOW)
             else:
@@ -241,17 +425,18 @@ class Car:
 
             wait(config.GYRO_CAL_LOOP_WAIT_MS)
             angle = self.gyro.angle()
-            drift_sum += (angle - last_angle) / config.GYRO_CAL_SAMPLE_TIME_S
-            samples += 1
-            last_angle = angle
+            estimator.add(timer.time() / config.MS_PER_SECOND, angle)
+            half_width = estimator.half_width_dps(config.GYRO_CAL_CONFIDENCE_Z)
 
             if progress_cb:
                 progress_cb(timer.time() / cal_ms)
 
         self.ev3.light.off()
-        self.drift_rate_dps = drift_sum / max(1, samples)
+        self.drift_rate_dps = estimator.drift_dps()
+        self.drift_half_width_dps = half_width
         if progress_cb:
             progress_cb(1.0)
-        log_utils.log("Gyro calibration complete; drift={:.4f} deg/s".format(self.drift_rate_dps))
+        log_utils.log("Gyro calibration complete; drift={:.4f} +/- {:.4f} deg/s after {:.1f} s ({} samples)".format(
+            self.drift_rate_dps, half_width, timer.time() / config.MS_PER_SECOND, estimator.count))
         self.heading_timer.reset()
         return self.drift_rate_dps